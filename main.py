@@ -8,11 +8,13 @@ Features clean architecture with separated UI, game logic, and player strategies
 Usage:
     python main.py                 (run from project root)
     python main.py --demo          (run demo mode)
+    python main.py --self-play     (run headless AI-vs-AI games, see src/self_play.py)
 
 Author: willvelida
 """
 from src.terminal_ui import TerminalUI
 from src.game_controller import GameController
+from src import self_play
 import sys
 
 
@@ -163,5 +165,7 @@ if __name__ == "__main__":
     # Check for demo mode
     if len(sys.argv) > 1 and sys.argv[1] == "--demo":
         run_demo_game()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--self-play":
+        self_play.main(sys.argv[2:])
     else:
         main()
@@ -0,0 +1,322 @@
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Union
+
+from src.tic_tac_toe import TicTacToe, GameMode
+from src.player import Player, HumanPlayer, AIPlayer, DifficultyLevel
+from src.terminal_ui import TerminalUI
+from src.self_play import new_session_stats, record_game_result
+
+
+class AsyncGameUI(ABC):
+    """
+    Awaitable user interface for AsyncGameController.
+
+    Mirrors the methods GameController uses on TerminalUI, but every one that
+    waits for the user or does I/O is a coroutine, so one event loop can serve
+    many players at once (for example, one UI per network connection).
+
+    show_ai_status stays synchronous because AIPlayer calls it as its status
+    callback; implementations should only queue the message, never block.
+    """
+
+    @abstractmethod
+    async def display_board(self, game: TicTacToe) -> None:
+        """Show the current board."""
+
+    @abstractmethod
+    async def get_valid_position(self, game: TicTacToe) -> int:
+        """Wait for the human player to choose a valid empty position."""
+
+    @abstractmethod
+    async def get_game_mode(self) -> GameMode:
+        """Wait for the game mode selection."""
+
+    @abstractmethod
+    async def get_player_symbol(self) -> Optional[str]:
+        """Wait for the human player's symbol (None to go back to the menu)."""
+
+    @abstractmethod
+    async def get_ai_difficulty(self) -> DifficultyLevel:
+        """Wait for the AI difficulty selection."""
+
+    @abstractmethod
+    async def display_game_result(self, game_state: dict) -> None:
+        """Show the final result of a game."""
+
+    @abstractmethod
+    async def show_message(self, message: str) -> None:
+        """Show a general message."""
+
+    @abstractmethod
+    async def show_error(self, error_message: str) -> None:
+        """Show an error message."""
+
+    @abstractmethod
+    async def display_turn_info(self, current_player_symbol: str, is_ai: bool = False) -> None:
+        """Show whose turn it is."""
+
+    @abstractmethod
+    async def display_session_stats(self, stats: dict) -> None:
+        """Show the statistics of the session so far."""
+
+    @abstractmethod
+    def show_ai_status(self, status_message: str) -> None:
+        """Show an AI status message (AIPlayer status callback, must not block)."""
+
+
+class AsyncTerminalUI(AsyncGameUI):
+    """
+    AsyncGameUI backed by a TerminalUI.
+
+    Prompts that block on input() run in a worker thread, so the event loop
+    keeps running other games while the player types. Output is printed directly.
+
+    Example:
+        >>> import asyncio
+        >>> asyncio.run(AsyncGameController(AsyncTerminalUI()).play())
+
+    Attributes:
+        terminal (TerminalUI): Terminal UI that reads input and prints output
+    """
+
+    def __init__(self, terminal: Optional[TerminalUI] = None):
+        """
+        Wrap a terminal UI.
+
+        Args:
+            terminal (Optional[TerminalUI]): UI to delegate to (default: a new TerminalUI)
+        """
+        self.terminal = terminal or TerminalUI()
+
+    async def display_board(self, game: TicTacToe) -> None:
+        """Print the board."""
+        self.terminal.display_board(game)
+
+    async def get_valid_position(self, game: TicTacToe) -> int:
+        """Prompt for a position in a worker thread."""
+        return await asyncio.to_thread(self.terminal.get_valid_position, game)
+
+    async def get_game_mode(self) -> GameMode:
+        """Prompt for the game mode in a worker thread."""
+        return await asyncio.to_thread(self.terminal.get_game_mode)
+
+    async def get_player_symbol(self) -> Optional[str]:
+        """Prompt for the player symbol in a worker thread."""
+        return await asyncio.to_thread(self.terminal.get_player_symbol)
+
+    async def get_ai_difficulty(self) -> DifficultyLevel:
+        """Prompt for the AI difficulty in a worker thread."""
+        return await asyncio.to_thread(self.terminal.get_ai_difficulty)
+
+    async def display_game_result(self, game_state: dict) -> None:
+        """Print the game result."""
+        self.terminal.display_game_result(game_state)
+
+    async def show_message(self, message: str) -> None:
+        """Print a general message."""
+        self.terminal.show_message(message)
+
+    async def show_error(self, error_message: str) -> None:
+        """Print an error message."""
+        self.terminal.show_error(error_message)
+
+    async def display_turn_info(self, current_player_symbol: str, is_ai: bool = False) -> None:
+        """Print whose turn it is."""
+        self.terminal.display_turn_info(current_player_symbol, is_ai)
+
+    async def display_session_stats(self, stats: dict) -> None:
+        """Print the session statistics."""
+        self.terminal.display_session_stats(stats)
+
+    def show_ai_status(self, status_message: str) -> None:
+        """Print an AI status message."""
+        self.terminal.show_ai_status(status_message)
+
+
+class AsyncGameController:
+    """
+    Asyncio counterpart of GameController.
+
+    Runs the same setup and game flow, but awaits the UI, the players' moves
+    and the AI thinking delay instead of blocking. AI searches run in an
+    executor through AIPlayer.get_move_async, so a single event loop can host
+    thousands of games at once; see run_sessions.
+
+    Example:
+        >>> import asyncio
+        >>> controllers = [AsyncGameController(ui) for ui in connection_uis]
+        >>> results = asyncio.run(run_sessions(controllers))
+
+    Attributes:
+        ui (AsyncGameUI): Awaitable user interface for this session
+        executor (Optional[ThreadPoolExecutor]): Thread pool for AI searches (None
+            uses the event loop's default thread pool)
+        enable_delay (bool): Whether AI players take a simulated thinking time
+        game (Optional[TicTacToe]): Game in progress
+        player_x (Optional[Player]): Player using the 'X' symbol
+        player_o (Optional[Player]): Player using the 'O' symbol
+        session_stats (dict): Results of the games played by this controller
+    """
+
+    def __init__(self, ui: AsyncGameUI, executor: Optional[ThreadPoolExecutor] = None,
+                 enable_delay: bool = True):
+        """
+        Initialize the controller.
+
+        Args:
+            ui (AsyncGameUI): Awaitable user interface for this session
+            executor (Optional[ThreadPoolExecutor]): Thread pool AI searches run in
+                (default: None, the event loop's default thread pool). See
+                AIPlayer.get_move_async for why process pools are not supported.
+            enable_delay (bool): Whether AI players take a simulated thinking time
+                (default: True). The delay is awaited, so it never blocks a thread.
+        """
+        self.ui = ui
+        self.executor = executor
+        self.enable_delay = enable_delay
+        self.game: Optional[TicTacToe] = None
+        self.player_x: Optional[Player] = None
+        self.player_o: Optional[Player] = None
+        self.session_stats = new_session_stats()
+
+    async def play(self) -> Optional[dict]:
+        """
+        Set up and play one game.
+
+        Returns:
+            Optional[dict]: Final game state, or None if the user left during setup
+        """
+        try:
+            if not await self._setup_game():
+                return None
+
+            await self._run_game_loop()
+
+            game_state = self.game.get_game_state()
+            await self.ui.display_game_result(game_state)
+
+            record_game_result(self.session_stats, game_state)
+            await self.ui.display_session_stats(self.session_stats)
+            return game_state
+
+        except SystemExit:
+            # Clean exit requested by user
+            raise
+        except Exception as e:
+            await self.ui.show_error(f"An unexpected error occurred: {e}")
+            raise
+
+    async def _setup_game(self) -> bool:
+        """
+        Set up the game including mode selection and player creation.
+
+        Returns:
+            bool: True if setup completed successfully, False if user quit
+        """
+        game_mode = await self.ui.get_game_mode()
+        self.game = TicTacToe(game_mode)
+
+        if game_mode == GameMode.HUMAN_VS_HUMAN:
+            await self.ui.show_message("Setting up Human vs Human game")
+            await self.ui.show_message("Player X goes first, Player O goes second")
+            self.player_x = HumanPlayer(TicTacToe.PLAYER_X)
+            self.player_o = HumanPlayer(TicTacToe.PLAYER_O)
+            return True
+        elif game_mode == GameMode.HUMAN_VS_AI:
+            return await self._setup_human_vs_ai()
+        else:
+            await self.ui.show_error("Invalid game mode selected")
+            return False
+
+    async def _setup_human_vs_ai(self) -> bool:
+        """
+        Set up human vs AI game with symbol and difficulty selection.
+
+        Returns:
+            bool: True if setup completed successfully, False if user went back
+        """
+        human_symbol = await self.ui.get_player_symbol()
+        if human_symbol is None:
+            return False
+
+        ai_difficulty = await self.ui.get_ai_difficulty()
+        ai_symbol = TicTacToe.PLAYER_O if human_symbol == TicTacToe.PLAYER_X else TicTacToe.PLAYER_X
+
+        human_player = HumanPlayer(human_symbol)
+        ai_player = AIPlayer(ai_symbol, ai_difficulty, enable_delay=self.enable_delay,
+                             status_callback=self.ui.show_ai_status)
+        if human_symbol == TicTacToe.PLAYER_X:
+            self.player_x, self.player_o = human_player, ai_player
+        else:
+            self.player_x, self.player_o = ai_player, human_player
+
+        await self.ui.show_message("Game setup complete!")
+        await self.ui.show_message(f"Human: {human_symbol}, AI: {ai_symbol} ({ai_difficulty.value})")
+        await self.ui.show_message(f"Player {TicTacToe.PLAYER_X} goes first")
+        return True
+
+    async def _run_game_loop(self) -> None:
+        """Alternate turns until the game ends."""
+        while True:
+            await self.ui.display_board(self.game)
+
+            if self.game.get_game_state()['state'] != 'ongoing':
+                break
+
+            if self.game.current_player == TicTacToe.PLAYER_X:
+                current_player = self.player_x
+            else:
+                current_player = self.player_o
+            await self.ui.display_turn_info(self.game.current_player, isinstance(current_player, AIPlayer))
+
+            move = await self._get_player_move(current_player)
+            try:
+                self.game.make_move(move)
+            except ValueError as e:
+                await self.ui.show_error(f"Invalid move: {e}")
+                continue
+
+        await self.ui.display_board(self.game)
+
+    async def _get_player_move(self, player: Player) -> int:
+        """
+        Get a move from the specified player.
+
+        Args:
+            player (Player): Player to get move from
+
+        Returns:
+            int: Position (1-9) chosen by player
+
+        Raises:
+            ValueError: If the player type is not supported
+        """
+        if isinstance(player, HumanPlayer):
+            return await self.ui.get_valid_position(self.game)
+        elif isinstance(player, AIPlayer):
+            return await player.get_move_async(self.game.board, self.executor)
+        else:
+            raise ValueError(f"Unknown player type: {type(player)}")
+
+
+async def run_sessions(
+        controllers: Iterable[AsyncGameController]) -> List[Union[Optional[dict], BaseException]]:
+    """
+    Play one game on every controller concurrently on the running event loop.
+
+    Sessions are independent: an exception in one (for example, a dropped
+    connection in its UI) does not cancel the others or discard their results.
+    It is returned in that session's slot instead of being raised.
+
+    Args:
+        controllers (Iterable[AsyncGameController]): One controller per session
+
+    Returns:
+        List[Union[Optional[dict], BaseException]]: Outcome of each session, in
+            order: the final game state, None for sessions that left during setup,
+            or the exception that ended a failed session
+    """
+    return list(await asyncio.gather(*(controller.play() for controller in controllers),
+                                     return_exceptions=True))
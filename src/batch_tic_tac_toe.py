@@ -0,0 +1,287 @@
+import itertools
+import random
+import sys
+from array import array
+from typing import List, Optional, Sequence, Union
+
+from src.tic_tac_toe import TicTacToe, make_rng
+from src.bitboard_tic_tac_toe import WIN_MASKS, FULL_BOARD_MASK
+
+# Every board lives in its own 16-bit lane of a large integer: bits 0-8 hold the
+# cells and bit 15 is scratch space for per-lane flags.
+LANE_BITS = 16
+_LANE_MASK = (1 << LANE_BITS) - 1
+_FLAG_BIT = 0x8000
+_BELOW_FLAG = 0x7FFF
+
+# One-hot cell bit for positions 0-9, where position 0 means "no move"
+_ONE_HOT = (0,) + tuple(1 << index for index in range(9))
+
+# Lazily built: _PERMUTATION_STEPS[t][i] is the cell played at step t of permutation i
+_PERMUTATION_STEPS: Optional[List[bytes]] = None
+_PERMUTATION_COUNT = 362880  # 9!
+
+
+def _pack(values) -> int:
+    """Pack an iterable of 16-bit lane values into one integer (lane 0 lowest)."""
+    lanes = array('H', values)
+    if sys.byteorder == 'big':
+        lanes.byteswap()
+    return int.from_bytes(lanes.tobytes(), 'little')
+
+
+def _unpack(packed: int, num_lanes: int) -> List[int]:
+    """Split a packed integer back into its 16-bit lane values."""
+    lanes = array('H')
+    lanes.frombytes(packed.to_bytes(num_lanes * 2, 'little'))
+    if sys.byteorder == 'big':
+        lanes.byteswap()
+    return lanes.tolist()
+
+
+def _popcount(value: int) -> int:
+    """Count the set bits of a non-negative integer."""
+    return bin(value).count('1')
+
+
+def _permutation_steps() -> List[bytes]:
+    """Build (once) the cell played at each step of every ordering of the nine cells."""
+    global _PERMUTATION_STEPS
+    if _PERMUTATION_STEPS is None:
+        orders = list(itertools.permutations(range(1, 10)))
+        _PERMUTATION_STEPS = [bytes(order[step] for order in orders) for step in range(9)]
+    return _PERMUTATION_STEPS
+
+
+class BatchTicTacToe:
+    """
+    Many Tic-Tac-Toe boards advanced in lockstep with whole-batch integer operations.
+
+    The K boards are stored bit-sliced: each board's X and O bitboards occupy a
+    16-bit lane of two large Python integers. Applying one move to every board is
+    a single OR per player, and winner detection compares all K boards against
+    each of the eight win lines with a handful of big-integer operations, so the
+    per-step cost runs in C rather than in a Python loop over game objects.
+
+    Example:
+        >>> batch = BatchTicTacToe(3)
+        >>> batch.make_moves([1, 5, 9])   # X moves on every board
+        >>> batch.make_moves([2, 0, 1])   # O moves on boards 0 and 2, board 1 passes
+        >>> batch.get_board(1)[4]
+        'X'
+
+    Attributes:
+        num_boards (int): Number of boards in the batch
+        x_bits (int): Packed X bitboards, one 16-bit lane per board
+        o_bits (int): Packed O bitboards, one 16-bit lane per board
+    """
+
+    def __init__(self, num_boards: int):
+        """
+        Create a batch of empty boards with X to move on each.
+
+        Args:
+            num_boards (int): Number of boards (K)
+
+        Raises:
+            ValueError: If num_boards is not positive
+        """
+        if num_boards < 1:
+            raise ValueError(f"num_boards must be positive, got {num_boards}")
+
+        self.num_boards = num_boards
+        ones = ((1 << (LANE_BITS * num_boards)) - 1) // _LANE_MASK
+        self._flag_lanes = _FLAG_BIT * ones
+        self._below_flag_lanes = _BELOW_FLAG * ones
+        self._full_lanes = FULL_BOARD_MASK * ones
+        self._win_lanes = [mask * ones for mask in WIN_MASKS]
+        self._ones = ones
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear every board and give X the move everywhere."""
+        self.x_bits = 0
+        self.o_bits = 0
+        self._x_to_move = self._ones  # Lane value 1 where X is to move
+
+    def make_moves(self, positions: Sequence[int]) -> None:
+        """
+        Apply one move to every board at once.
+
+        Args:
+            positions (Sequence[int]): One position (1-9) per board, or 0 to leave
+                that board unchanged (for example because its game is over)
+
+        Raises:
+            ValueError: If the number of positions does not match the batch size
+            ValueError: If a position is outside 0-9
+            ValueError: If a move targets an occupied square or a finished game
+        """
+        if len(positions) != self.num_boards:
+            raise ValueError(f"Expected {self.num_boards} positions, got {len(positions)}")
+        if min(positions) < 0 or max(positions) > 9:
+            raise ValueError("Positions must be between 1 and 9, or 0 to skip a board")
+
+        moves = _pack(map(_ONE_HOT.__getitem__, positions))
+
+        clash = moves & (self.x_bits | self.o_bits)
+        if clash:
+            board = self._first_lane(clash)
+            raise ValueError(f"Position {positions[board]} is already occupied on board {board}")
+
+        x_wins, o_wins = self._win_flags(self.x_bits), self._win_flags(self.o_bits)
+        finished_moves = ((x_wins | o_wins) >> 15) * FULL_BOARD_MASK & moves
+        if finished_moves:
+            board = self._first_lane(finished_moves)
+            raise ValueError(f"Board {board} is already won")
+
+        self._apply(moves)
+
+    def winners(self) -> List[Optional[str]]:
+        """
+        Get the winner of every board.
+
+        Returns:
+            List[Optional[str]]: 'X', 'O' or None for each board
+        """
+        x_wins = _unpack(self._win_flags(self.x_bits) >> 15, self.num_boards)
+        o_wins = _unpack(self._win_flags(self.o_bits) >> 15, self.num_boards)
+        return [TicTacToe.PLAYER_X if x_win else TicTacToe.PLAYER_O if o_win else None
+                for x_win, o_win in zip(x_wins, o_wins)]
+
+    def draws(self) -> List[bool]:
+        """
+        Get whether every board is a draw (full with no winner).
+
+        Returns:
+            List[bool]: True for each drawn board
+        """
+        return [bool(flag) for flag in _unpack(self._draw_flags() >> 15, self.num_boards)]
+
+    def results(self) -> dict:
+        """
+        Summarize the finished boards in the shape of GameController.session_stats.
+
+        Returns:
+            dict: 'games_played' counts finished boards; wins and draws are totals
+        """
+        x_wins = self._win_flags(self.x_bits)
+        o_wins = self._win_flags(self.o_bits) & ~x_wins
+        draws = self._draw_flags()
+        return {
+            'games_played': _popcount(x_wins | o_wins | draws),
+            'x_wins': _popcount(x_wins),
+            'o_wins': _popcount(o_wins),
+            'draws': _popcount(draws)
+        }
+
+    def get_board(self, index: int) -> List[str]:
+        """
+        Get one board as a 9-element list in the TicTacToe format.
+
+        Args:
+            index (int): Board index (0 to num_boards - 1)
+
+        Returns:
+            List[str]: Board state with ' ', 'X' and 'O'
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        if not 0 <= index < self.num_boards:
+            raise IndexError(f"Board index {index} out of range")
+
+        shift = index * LANE_BITS
+        x_lane = self.x_bits >> shift & _LANE_MASK
+        o_lane = self.o_bits >> shift & _LANE_MASK
+        return [TicTacToe.PLAYER_X if x_lane >> cell & 1 else
+                TicTacToe.PLAYER_O if o_lane >> cell & 1 else
+                TicTacToe.EMPTY
+                for cell in range(9)]
+
+    def _apply(self, moves: int) -> None:
+        """Apply packed one-hot moves without validation and flip the side to move."""
+        x_moves = moves & (self._x_to_move * FULL_BOARD_MASK)
+        self.x_bits |= x_moves
+        self.o_bits |= moves ^ x_moves
+        moved = ((moves + self._below_flag_lanes) & self._flag_lanes) >> 15
+        self._x_to_move ^= moved
+
+    def _win_flags(self, bits: int) -> int:
+        """Return bit 15 set in every lane whose bitboard contains a complete line."""
+        flags = 0
+        below_flag = self._below_flag_lanes
+        flag_lanes = self._flag_lanes
+        for line in self._win_lanes:
+            # A lane is zero exactly when the line is complete; adding 0x7FFF
+            # carries into bit 15 for every non-zero lane
+            missing = (bits & line) ^ line
+            flags |= flag_lanes ^ ((missing + below_flag) & flag_lanes)
+        return flags
+
+    def _draw_flags(self) -> int:
+        """Return bit 15 set in every lane that is full with no winner."""
+        empty = (self.x_bits | self.o_bits) ^ self._full_lanes
+        full = self._flag_lanes ^ ((empty + self._below_flag_lanes) & self._flag_lanes)
+        return full & ~(self._win_flags(self.x_bits) | self._win_flags(self.o_bits))
+
+    @staticmethod
+    def _first_lane(packed: int) -> int:
+        """Index of the lowest lane with any bit set."""
+        return ((packed & -packed).bit_length() - 1) // LANE_BITS
+
+
+def random_playouts(num_games: int, rng: Union[random.Random, int, None] = None) -> dict:
+    """
+    Play uniformly random games from the empty board, all in one batch.
+
+    Playing the cells of a uniformly random permutation in order is the same as
+    picking a uniformly random empty cell on every turn, so each game draws one
+    permutation up front. All games then advance one ply per step, and each
+    game's result is fixed the first time its mover completes a line.
+
+    Args:
+        num_games (int): Number of random games to play
+        rng (Union[random.Random, int, None]): Random generator or seed (default:
+            None, a new unseeded generator)
+
+    Returns:
+        dict: Aggregate results in the shape of GameController.session_stats
+
+    Example:
+        >>> random_playouts(1_000_000, random.Random(1))['games_played']
+        1000000
+    """
+    if num_games < 0:
+        raise ValueError(f"num_games must not be negative, got {num_games}")
+    if num_games == 0:
+        return {'games_played': 0, 'x_wins': 0, 'o_wins': 0, 'draws': 0}
+
+    rng = make_rng(rng)
+    steps = _permutation_steps()
+    choice = rng.randrange
+    orders = [choice(_PERMUTATION_COUNT) for _ in range(num_games)]
+
+    batch = BatchTicTacToe(num_games)
+    x_first_wins = 0
+    o_first_wins = 0
+    for step in range(9):
+        cells = map(steps[step].__getitem__, orders)
+        batch._apply(_pack(map(_ONE_HOT.__getitem__, cells)))
+        if step < 4:
+            continue  # Nobody can have three in a row yet
+
+        decided = x_first_wins | o_first_wins
+        if step % 2 == 0:
+            x_first_wins |= batch._win_flags(batch.x_bits) & ~decided
+        else:
+            o_first_wins |= batch._win_flags(batch.o_bits) & ~decided
+
+    x_wins = _popcount(x_first_wins)
+    o_wins = _popcount(o_first_wins)
+    return {
+        'games_played': num_games,
+        'x_wins': x_wins,
+        'o_wins': o_wins,
+        'draws': num_games - x_wins - o_wins
+    }
@@ -0,0 +1,244 @@
+from typing import List, Optional
+
+from src.tic_tac_toe import TicTacToe, GameMode, WINNING_COMBINATIONS, zobrist_hash
+
+# Winning lines as 9-bit masks, in the same order TicTacToe checks them
+WIN_MASKS = tuple(sum(1 << index for index in line) for line in WINNING_COMBINATIONS)
+
+FULL_BOARD_MASK = 0x1FF
+
+# WINNING_PATTERN[bits] is True when the occupied cells in `bits` contain a full line
+WINNING_PATTERN = tuple(
+    any(bits & mask == mask for mask in WIN_MASKS) for bits in range(FULL_BOARD_MASK + 1)
+)
+
+# Maps a single-bit mask back to its board index (0-8)
+_CELL_OF_BIT = {1 << index: index for index in range(9)}
+
+
+class BitboardTicTacToe(TicTacToe):
+    """
+    Tic-Tac-Toe engine backed by two 9-bit integers instead of a list of strings.
+
+    Each player's pieces are stored as a bitmask where bit ``i`` represents board
+    index ``i`` (position ``i + 1``). Applying a move is a single OR and undoing
+    it a single AND, winner detection is a lookup into a precomputed 512-entry
+    table, and draw detection compares the combined occupancy against a
+    full-board mask.
+
+    The class exposes the same public API as TicTacToe, so GameController,
+    TerminalUI and AIPlayer can use it as a drop-in replacement. The ``board``
+    attribute is kept as a property that converts to and from the familiar
+    9-element list; note that mutating the returned list in place does not
+    change the game, assign a new list instead.
+
+    Example:
+        >>> from src.bitboard_tic_tac_toe import BitboardTicTacToe
+        >>>
+        >>> game = BitboardTicTacToe()
+        >>> game.make_move(1)  # X
+        >>> game.make_move(4)  # O
+        >>> game.make_move(2)  # X
+        >>> game.make_move(5)  # O
+        >>> game.make_move(3)  # X completes the top row
+        >>> game.check_winner()
+        'X'
+
+    Attributes:
+        x_bits (int): Bitmask of positions occupied by X
+        o_bits (int): Bitmask of positions occupied by O
+        current_player (str): Current player's symbol ('X' or 'O')
+        mode (GameMode): Current game mode (HUMAN_VS_HUMAN or HUMAN_VS_AI)
+    """
+
+    def __init__(self, mode: GameMode = GameMode.HUMAN_VS_AI):
+        """
+        Initialize a new bitboard game instance.
+
+        Args:
+            mode (GameMode, optional): Game mode to use. Defaults to GameMode.HUMAN_VS_AI.
+        """
+        self.x_bits = 0
+        self.o_bits = 0
+        super().__init__(mode)
+
+    @property
+    def board(self) -> List[str]:
+        """
+        List view of the board, built from the bitmasks.
+
+        Returns:
+            List[str]: 9-element list of ' ', 'X' or 'O'
+        """
+        x_bits = self.x_bits
+        o_bits = self.o_bits
+        return [
+            self.PLAYER_X if x_bits >> index & 1 else
+            self.PLAYER_O if o_bits >> index & 1 else
+            self.EMPTY
+            for index in range(9)
+        ]
+
+    @board.setter
+    def board(self, board: List[str]) -> None:
+        """
+        Load the bitmasks from a 9-element board list.
+
+        Args:
+            board (List[str]): Board state to load
+
+        Raises:
+            ValueError: If the board does not have exactly 9 positions
+        """
+        if len(board) != 9:
+            raise ValueError(f"Board must have exactly 9 positions, got {len(board)}")
+
+        x_bits = 0
+        o_bits = 0
+        for index, value in enumerate(board):
+            if value == self.PLAYER_X:
+                x_bits |= 1 << index
+            elif value == self.PLAYER_O:
+                o_bits |= 1 << index
+        self.x_bits = x_bits
+        self.o_bits = o_bits
+        self._board_hash = zobrist_hash(board)
+        self._clear_history()
+
+    def reset_board(self):
+        """Clear both bitmasks and give the first move to X."""
+        self.x_bits = 0
+        self.o_bits = 0
+        self._board_hash = 0
+        self.current_player = self.PLAYER_X
+        self._clear_history()
+
+    def is_valid_move(self, position: int) -> bool:
+        """
+        Check if position is valid and empty.
+
+        Args:
+            position (int): Position on board (1-9)
+
+        Returns:
+            bool: True if position is valid and empty, False otherwise
+        """
+        if position < 1 or position > 9:
+            return False
+
+        return not (self.x_bits | self.o_bits) >> (position - 1) & 1
+
+    def _apply_move(self, index: int, player: str) -> None:
+        """Set the mover's bit for a board index (0-8)."""
+        if player == self.PLAYER_X:
+            self.x_bits |= 1 << index
+        else:
+            self.o_bits |= 1 << index
+        self._board_hash ^= self._zobrist[index][player]
+
+    def _sync(self) -> None:
+        """The bitmasks are always current, so there is nothing to rescan."""
+
+    def _remove_move(self, index: int) -> None:
+        """Clear whichever bit is set for a board index (0-8)."""
+        player = self.PLAYER_X if self.x_bits >> index & 1 else self.PLAYER_O
+        self._board_hash ^= self._zobrist[index][player]
+        keep = ~(1 << index)
+        self.x_bits &= keep
+        self.o_bits &= keep
+
+    def get_display_value(self, position: int) -> str:
+        """
+        Return display value for position.
+
+        Args:
+            position (int): Position on board (1-9)
+
+        Returns:
+            str: Position number if empty, player symbol if occupied
+        """
+        bit = 1 << (position - 1)
+        if self.x_bits & bit:
+            return self.PLAYER_X
+        if self.o_bits & bit:
+            return self.PLAYER_O
+        return str(position)
+
+    def check_winner(self):
+        """
+        Check if there's a winner on the board.
+
+        Returns:
+            str or None: 'X' or 'O' if there's a winner, None otherwise
+        """
+        if WINNING_PATTERN[self.x_bits]:
+            return self.PLAYER_X
+        if WINNING_PATTERN[self.o_bits]:
+            return self.PLAYER_O
+        return None
+
+    def is_board_full(self) -> bool:
+        """
+        Check if the board is completely full.
+
+        Returns:
+            bool: True if all positions are occupied, False otherwise
+        """
+        return (self.x_bits | self.o_bits) == FULL_BOARD_MASK
+
+    def is_draw(self) -> bool:
+        """
+        Check if the game is a draw (board full with no winner).
+
+        Returns:
+            bool: True if game is a draw, otherwise False
+        """
+        return (self.is_board_full() and
+                not WINNING_PATTERN[self.x_bits] and
+                not WINNING_PATTERN[self.o_bits])
+
+    def get_game_state(self) -> dict:
+        """
+        Get the current state of the game.
+
+        Returns:
+            dict: Game state information with keys:
+                - 'state': 'ongoing', 'won', or 'draw'
+                - 'winner': 'X', 'O' or None
+        """
+        winner = self.check_winner()
+        if winner:
+            return {'state': 'won', 'winner': winner}
+
+        if self.is_board_full():
+            return {'state': 'draw', 'winner': None}
+
+        return {'state': 'ongoing', 'winner': None}
+
+    def find_winning_move(self, player_symbol: str) -> Optional[int]:
+        """
+        Find a position where the player can win in one move.
+
+        Args:
+            player_symbol (str): 'X' or 'O'
+
+        Returns:
+            Optional[int]: Position 1-9 where player can win, or None if no winning move
+
+        Raises:
+            ValueError: If player_symbol is not 'X' or 'O'
+        """
+        if player_symbol == self.PLAYER_X:
+            own_bits = self.x_bits
+        elif player_symbol == self.PLAYER_O:
+            own_bits = self.o_bits
+        else:
+            raise ValueError(f"Invalid player symbol '{player_symbol}'. Must be 'X' or 'O'.")
+
+        empty_bits = ~(self.x_bits | self.o_bits) & FULL_BOARD_MASK
+        for mask in WIN_MASKS:
+            missing = mask & ~own_bits
+            if missing & empty_bits == missing and missing in _CELL_OF_BIT:
+                return _CELL_OF_BIT[missing] + 1
+
+        return None
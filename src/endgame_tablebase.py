@@ -0,0 +1,364 @@
+"""
+Endgame tablebase for small generalized boards.
+
+Positions with few empty cells are the leaves of every deep search, and on
+the 4x4 board they make up most of its nodes. A tablebase stores the
+win/draw/loss value of every position with at most ``max_empties`` empty
+cells, so AIPlayer can stop searching as soon as it reaches one.
+
+The tablebase is built by retrograde analysis, one layer of empty cells at a
+time: full boards are scored first, and every position with ``e`` empty
+cells is then scored from its children in the already finished ``e - 1``
+layer. No position is ever searched twice.
+
+Each position gets a perfect (gap-free) index: positions are grouped by the
+number of empty cells; within a group, the set of empty cells and the set of
+X marks among the occupied cells are ranked with the combinatorial number
+system. Values take 2 bits each (0 = cannot occur, 1 = loss, 2 = draw,
+3 = win, for the side to move), four to a byte.
+
+Ranking uses 16-bit lookup tables, so boards are limited to 16 cells (4x4);
+beyond that the tables would not fit in memory anyway.
+
+File format (little-endian):
+    - 4-byte magic ``b'TTE1'``
+    - uint16 board size, uint16 win length, uint16 max empties, uint32 position count
+    - ceil(count / 4) bytes of packed values, position i in bits 2*(i % 4)
+
+Build a tablebase with:
+    python -m src.endgame_tablebase --size 4 --max-empties 4 --output tablebase_4x4.bin
+"""
+import argparse
+import mmap
+import struct
+import sys
+import threading
+from array import array
+from itertools import combinations
+from math import comb
+from typing import List, Optional, Sequence, Tuple, Union
+
+from src.tic_tac_toe import TicTacToe, winning_lines
+from src.perfect_play_table import LOSS, DRAW, WIN
+
+MAGIC = b'TTE1'
+HEADER = struct.Struct('<4sHHHI')
+MAX_CELLS = 16
+
+# 2-bit codes stored per position; a game value v is stored as v + 2
+UNREACHABLE = 0
+
+_tables: Optional[Tuple[array, array, bytes]] = None
+_tables_lock = threading.Lock()
+
+
+def _ranking_tables() -> Tuple[array, array, bytes]:
+    """
+    Build (once) the 16-bit lookup tables used to rank positions.
+
+    Returns:
+        Tuple[array, array, bytes]: Colex rank of every 16-bit mask among masks with
+            the same number of bits, the bits of a byte gathered by an 8-bit mask
+            (indexed by ``mask << 8 | byte``), and the bit count of every byte
+    """
+    global _tables
+    if _tables is None:
+        with _tables_lock:
+            if _tables is None:
+                colex = array('I', bytes(4 * (1 << MAX_CELLS)))
+                for mask in range(1, 1 << MAX_CELLS):
+                    rank = 0
+                    count = 0
+                    bits = mask
+                    while bits:
+                        low = bits & -bits
+                        count += 1
+                        rank += comb(low.bit_length() - 1, count)
+                        bits ^= low
+                    colex[mask] = rank
+
+                gather = array('B', bytes(1 << 16))
+                for mask in range(256):
+                    cells = [bit for bit in range(8) if mask >> bit & 1]
+                    for byte in range(256):
+                        gather[mask << 8 | byte] = sum(1 << slot for slot, bit in enumerate(cells)
+                                                       if byte >> bit & 1)
+                popcount = bytes(bin(byte).count('1') for byte in range(256))
+                _tables = (colex, gather, popcount)
+    return _tables
+
+
+def _check_configuration(size: int, win_length: int, max_empties: int) -> None:
+    """Raise ValueError for a board or empty-cell limit a tablebase cannot cover."""
+    cell_count = size * size
+    if size < 1 or not 1 <= win_length <= size:
+        raise ValueError(f"Invalid board geometry: size {size}, win length {win_length}")
+    if cell_count > MAX_CELLS:
+        raise ValueError(f"Tablebases support at most {MAX_CELLS} cells, got {cell_count}")
+    if not 0 <= max_empties <= cell_count:
+        raise ValueError(f"max_empties must be between 0 and {cell_count}, got {max_empties}")
+
+
+def _layer_offsets(cell_count: int, max_empties: int) -> List[int]:
+    """Index of the first position of each empty-cell layer (plus the total at the end)."""
+    offsets = [0]
+    for empties in range(max_empties + 1):
+        occupied = cell_count - empties
+        offsets.append(offsets[-1] + comb(cell_count, empties) * comb(occupied, (occupied + 1) // 2))
+    return offsets
+
+
+class EndgameTablebase:
+    """
+    Win/draw/loss values of every position with few empty cells.
+
+    Example:
+        >>> tablebase = build_tablebase(3, max_empties=9)
+        >>> tablebase.probe([' '] * 9, 'X')
+        0
+        >>> tablebase.probe(['X', 'X', ' ', 'O', 'O', ' ', ' ', ' ', ' '], 'X')
+        1
+
+    Attributes:
+        size (int): Board width and height
+        win_length (int): Marks in a row needed to win
+        max_empties (int): Largest number of empty cells covered
+        cell_count (int): Number of positions on the board
+        position_count (int): Number of indexed positions
+    """
+
+    def __init__(self, size: int, win_length: int, max_empties: int,
+                 values: Union[bytearray, bytes, mmap.mmap], offset: int = 0):
+        """
+        Wrap packed values produced by build_tablebase or read from a file.
+
+        Args:
+            size (int): Board width and height
+            win_length (int): Marks in a row needed to win
+            max_empties (int): Largest number of empty cells covered
+            values (Union[bytearray, bytes, mmap.mmap]): Packed 2-bit values
+            offset (int): Byte offset of the first value in ``values`` (default: 0)
+
+        Raises:
+            ValueError: If the configuration is invalid or values has the wrong length
+        """
+        _check_configuration(size, win_length, max_empties)
+        cell_count = size * size
+        self.size = size
+        self.win_length = win_length
+        self.max_empties = max_empties
+        self.cell_count = cell_count
+        self._offsets = _layer_offsets(cell_count, max_empties)
+        self.position_count = self._offsets[-1]
+        if len(values) - offset != (self.position_count + 3) // 4:
+            raise ValueError(f"Expected {(self.position_count + 3) // 4} bytes of values, "
+                             f"got {len(values) - offset}")
+        self._values = values
+        self._base = offset
+        self._full = (1 << cell_count) - 1
+        self._group_sizes = tuple(comb(cell_count - empties, (cell_count - empties + 1) // 2)
+                                  for empties in range(cell_count + 1))
+
+    def index(self, x_bits: int, o_bits: int) -> Optional[int]:
+        """
+        Compute the perfect index of a position given as bitmasks.
+
+        Args:
+            x_bits (int): Mask of cells holding X (bit i = board index i)
+            o_bits (int): Mask of cells holding O
+
+        Returns:
+            Optional[int]: Index from 0 to position_count - 1, or None if the position
+                has too many empty cells or mark counts no legal game produces
+        """
+        colex, gather, popcount = _ranking_tables()
+        occupied = x_bits | o_bits
+        low = occupied & 0xFF
+        high = occupied >> 8
+        filled = popcount[low] + popcount[high]
+        empties = self.cell_count - filled
+        if empties > self.max_empties:
+            return None
+        if popcount[x_bits & 0xFF] + popcount[x_bits >> 8] != (filled + 1) // 2:
+            return None
+
+        # X marks relative to the occupied cells, as an occupied-count-bit mask
+        x_slots = gather[low << 8 | x_bits & 0xFF] | gather[high << 8 | x_bits >> 8] << popcount[low]
+        return (self._offsets[empties] + colex[self._full ^ occupied] * self._group_sizes[empties] +
+                colex[x_slots])
+
+    def probe(self, board: Sequence[str], symbol: str) -> Optional[int]:
+        """
+        Look up the game value of a position for the player about to move.
+
+        Args:
+            board (Sequence[str]): Board cells (size * size elements)
+            symbol (str): Symbol of the player to move ('X' or 'O')
+
+        Returns:
+            Optional[int]: WIN (1), DRAW (0) or LOSS (-1) for ``symbol``, or None if the
+                board has the wrong size or too many empty cells, it is not ``symbol``'s
+                turn (X moves first), or the position cannot occur
+        """
+        if len(board) != self.cell_count:
+            return None
+        if (board.count(TicTacToe.EMPTY) % 2 != self.cell_count % 2) != (symbol == TicTacToe.PLAYER_O):
+            return None
+        x_bits = o_bits = 0
+        for cell, value in enumerate(board):
+            if value == TicTacToe.PLAYER_X:
+                x_bits |= 1 << cell
+            elif value == TicTacToe.PLAYER_O:
+                o_bits |= 1 << cell
+        index = self.index(x_bits, o_bits)
+        if index is None:
+            return None
+        code = self._values[self._base + (index >> 2)] >> ((index & 3) << 1) & 3
+        return None if code == UNREACHABLE else code - 2
+
+    def save(self, path: str) -> None:
+        """
+        Write the tablebase to a binary file.
+
+        Args:
+            path (str): Output file path
+        """
+        with open(path, 'wb') as output:
+            output.write(HEADER.pack(MAGIC, self.size, self.win_length, self.max_empties,
+                                     self.position_count))
+            output.write(self._values[self._base:])
+
+    def close(self) -> None:
+        """Release the memory map of a tablebase opened with load (no-op otherwise)."""
+        if isinstance(self._values, mmap.mmap):
+            self._values.close()
+
+    @classmethod
+    def load(cls, path: str) -> 'EndgameTablebase':
+        """
+        Memory-map a tablebase written by save.
+
+        Args:
+            path (str): Location of the binary tablebase file
+
+        Returns:
+            EndgameTablebase: Tablebase reading its values from the mapped file
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a valid tablebase
+        """
+        with open(path, 'rb') as tablebase_file:
+            data = mmap.mmap(tablebase_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(data) < HEADER.size:
+            data.close()
+            raise ValueError(f"{path} is not an endgame tablebase")
+        magic, size, win_length, max_empties, count = HEADER.unpack_from(data, 0)
+        try:
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not an endgame tablebase")
+            tablebase = cls(size, win_length, max_empties, data, HEADER.size)
+            if tablebase.position_count != count:
+                raise ValueError(f"{path} has {count} positions, expected {tablebase.position_count}")
+        except ValueError:
+            data.close()
+            raise
+        return tablebase
+
+
+def build_tablebase(size: int, win_length: Optional[int] = None, max_empties: int = 4) -> EndgameTablebase:
+    """
+    Solve every position with at most ``max_empties`` empty cells by retrograde analysis.
+
+    Args:
+        size (int): Board width and height (at most 4)
+        win_length (Optional[int]): Marks in a row needed to win (default: size)
+        max_empties (int): Largest number of empty cells to cover (default: 4)
+
+    Returns:
+        EndgameTablebase: The solved positions
+
+    Raises:
+        ValueError: If the configuration is invalid or the board has more than 16 cells
+    """
+    if win_length is None:
+        win_length = size
+    _check_configuration(size, win_length, max_empties)
+    cell_count = size * size
+    position_count = _layer_offsets(cell_count, max_empties)[-1]
+    tablebase = EndgameTablebase(size, win_length, max_empties, bytearray((position_count + 3) // 4))
+    values = tablebase._values
+    index = tablebase.index
+
+    line_masks = [sum(1 << cell for cell in line) for line in winning_lines(size, win_length)]
+    has_line = bytearray(1 << cell_count)
+    for line_mask in line_masks:
+        for mask in range(1 << cell_count):
+            if mask & line_mask == line_mask:
+                has_line[mask] = 1
+
+    full = (1 << cell_count) - 1
+    for empties in range(max_empties + 1):
+        filled = cell_count - empties
+        x_to_move = filled % 2 == 0
+        for empty_cells in combinations(range(cell_count), empties):
+            empty_mask = sum(1 << cell for cell in empty_cells)
+            occupied_cells = [cell for cell in range(cell_count) if not empty_mask >> cell & 1]
+            occupied = full ^ empty_mask
+            for x_cells in combinations(occupied_cells, (filled + 1) // 2):
+                x_bits = sum(1 << cell for cell in x_cells)
+                o_bits = occupied ^ x_bits
+                mover, waiting = (x_bits, o_bits) if x_to_move else (o_bits, x_bits)
+
+                if has_line[mover]:
+                    continue  # The game ended before the side to move got another turn
+                if has_line[waiting]:
+                    code = LOSS + 2
+                elif not empties:
+                    code = DRAW + 2
+                else:
+                    # Best child for the side to move: any lost child is a win
+                    code = LOSS + 2
+                    for cell in empty_cells:
+                        bit = 1 << cell
+                        child = index(x_bits | bit, o_bits) if x_to_move else index(x_bits, o_bits | bit)
+                        child_code = values[child >> 2] >> ((child & 3) << 1) & 3
+                        if child_code == LOSS + 2:
+                            code = WIN + 2
+                            break
+                        if child_code == DRAW + 2:
+                            code = DRAW + 2
+
+                position = index(x_bits, o_bits)
+                values[position >> 2] |= code << ((position & 3) << 1)
+    return tablebase
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point for building a tablebase file.
+
+    Usage:
+        python -m src.endgame_tablebase --size 4 --max-empties 4 --output tablebase_4x4.bin
+
+    Args:
+        argv (Optional[List[str]]): Arguments to parse (default: sys.argv[1:])
+
+    Returns:
+        int: Number of positions written
+    """
+    parser = argparse.ArgumentParser(description="Build an endgame tablebase for a board variant.")
+    parser.add_argument('--size', type=int, default=4, help="board width and height (at most 4)")
+    parser.add_argument('--win-length', type=int, default=None, help="marks in a row to win (default: size)")
+    parser.add_argument('--max-empties', type=int, default=4, help="largest number of empty cells covered")
+    parser.add_argument('--output', required=True, help="output path")
+    args = parser.parse_args(argv)
+
+    tablebase = build_tablebase(args.size, args.win_length, args.max_empties)
+    tablebase.save(args.output)
+    print(f"Wrote {tablebase.position_count} positions to {args.output}")
+    return tablebase.position_count
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
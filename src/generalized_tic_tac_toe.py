@@ -0,0 +1,179 @@
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from src.tic_tac_toe import TicTacToe, GameMode, winning_lines, lines_through_cells, zobrist_keys
+
+
+@lru_cache(maxsize=None)
+def board_geometry(size: int, win_length: int) -> Tuple[Tuple[Tuple[int, ...], ...],
+                                                        Tuple[Tuple[Tuple[int, ...], ...], ...]]:
+    """
+    Precompute the win lines of a board configuration, once per configuration.
+
+    Args:
+        size (int): Board width and height
+        win_length (int): Number of marks in a row needed to win
+
+    Returns:
+        Tuple: ``(lines, lines_through)`` where ``lines`` holds every winning line
+            and ``lines_through[i]`` holds only the lines that contain index ``i``
+
+    Example:
+        >>> lines, lines_through = board_geometry(3, 3)
+        >>> lines_through[4]
+        ((3, 4, 5), (1, 4, 7), (0, 4, 8), (2, 4, 6))
+    """
+    lines = winning_lines(size, win_length)
+    return lines, lines_through_cells(lines, size * size)
+
+
+@lru_cache(maxsize=None)
+def square_symmetries(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Build the eight rotations and reflections of a square board as index permutations.
+
+    Uses the same convention as SYMMETRIES in tic_tac_toe: each symmetry is a
+    tuple ``source`` such that the transformed board is
+    ``[board[source[i]] for i in range(size * size)]``. Index 0 is the identity,
+    1-3 are clockwise rotations by 90/180/270 degrees, and 4-7 are the same
+    rotations applied after a left-right mirror. Win lines map onto win lines
+    under every symmetry, so symmetric positions have the same value.
+
+    Args:
+        size (int): Board width and height
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: The eight permutations
+    """
+    last = size - 1
+    cells = range(size * size)
+    identity = tuple(cells)
+    rotate = tuple(size * (last - col) + row for row in range(size) for col in range(size))
+    mirror = tuple(size * row + (last - col) for row in range(size) for col in range(size))
+
+    symmetries = []
+    for start in (identity, mirror):
+        current = start
+        for _ in range(4):
+            symmetries.append(current)
+            current = tuple(current[rotate[i]] for i in cells)
+    return tuple(symmetries)
+
+
+class GeneralizedTicTacToe(TicTacToe):
+    """
+    Tic-Tac-Toe on an N x N board where k marks in a row win.
+
+    Covers the classic game (3x3, 3 in a row) as well as larger variants such as
+    4x4 with 4 in a row or 15x15 gomoku with 5 in a row. The win lines for each
+    configuration are computed once and shared between instances. Every move
+    only re-checks the lines passing through the cell just played (at most 4k
+    of them) instead of every line on the board.
+
+    Positions are numbered 1 to N*N, row by row from the top-left, and the
+    ``board`` attribute is a flat list of N*N cells. Move handling, outcome
+    tracking and game state queries are inherited from TicTacToe, which reads
+    the board geometry from the instance. The inherited symmetry helpers and
+    base-3 state codes only describe the 3x3 board and raise ValueError for
+    other sizes; use square_symmetries and zobrist_hash instead.
+
+    Example:
+        >>> from src.generalized_tic_tac_toe import GeneralizedTicTacToe
+        >>>
+        >>> game = GeneralizedTicTacToe(size=4, win_length=3)
+        >>> for position in (1, 5, 2, 6, 3):
+        ...     game.make_move(position)
+        >>> game.check_winner()
+        'X'
+
+    Attributes:
+        size (int): Board width and height
+        win_length (int): Number of marks in a row needed to win
+        cell_count (int): Number of cells (size * size)
+        lines (Tuple[Tuple[int, ...], ...]): Every winning line as 0-based indices
+        current_player (str): Current player's symbol ('X' or 'O')
+        mode (GameMode): Current game mode (HUMAN_VS_HUMAN or HUMAN_VS_AI)
+    """
+
+    def __init__(self, size: int = 3, win_length: Optional[int] = None,
+                 mode: GameMode = GameMode.HUMAN_VS_AI):
+        """
+        Initialize an empty board of the given configuration.
+
+        Args:
+            size (int): Board width and height (default: 3)
+            win_length (Optional[int]): Marks in a row needed to win (default: size)
+            mode (GameMode, optional): Game mode to use. Defaults to GameMode.HUMAN_VS_AI.
+
+        Raises:
+            ValueError: If size is less than 1
+            ValueError: If win_length is not between 1 and size
+        """
+        if win_length is None:
+            win_length = size
+        if size < 1:
+            raise ValueError(f"Board size must be at least 1, got {size}")
+        if not 1 <= win_length <= size:
+            raise ValueError(f"win_length must be between 1 and {size}, got {win_length}")
+
+        self.size = size
+        self.win_length = win_length
+        self.cell_count = size * size
+        self.lines, self._lines_through = board_geometry(size, win_length)
+        self._zobrist = zobrist_keys(self.cell_count)
+        super().__init__(mode)
+
+    @TicTacToe.board.setter
+    def board(self, board: List[str]) -> None:
+        """
+        Replace the board with a copy of the given cells.
+
+        Args:
+            board (List[str]): New board with exactly size * size cells
+
+        Raises:
+            ValueError: If the board has the wrong number of cells
+        """
+        if len(board) != self.cell_count:
+            raise ValueError(f"Board must have exactly {self.cell_count} positions, got {len(board)}")
+
+        TicTacToe.board.fset(self, board)
+
+    def _check_line(self, positions: Tuple[int, ...]) -> bool:
+        """
+        Check if every position in a line has the same non-empty symbol.
+
+        Args:
+            positions (Tuple[int, ...]): Board indices of the line
+
+        Returns:
+            bool: True if all positions have same non-empty symbol
+        """
+        board = self.board
+        first = board[positions[0]]
+        return first != self.EMPTY and all(board[cell] == first for cell in positions)
+
+    def find_winning_move(self, player_symbol: str) -> Optional[int]:
+        """
+        Find a position where the player can win in one move.
+
+        Args:
+            player_symbol (str): 'X' or 'O'
+
+        Returns:
+            Optional[int]: Position where player can win, or None if no winning move
+
+        Raises:
+            ValueError: If player_symbol is not 'X' or 'O'
+        """
+        if player_symbol not in [self.PLAYER_X, self.PLAYER_O]:
+            raise ValueError(f"Invalid player symbol '{player_symbol}'. Must be 'X' or 'O'.")
+
+        board = self.board
+        needed = self.win_length - 1
+        for line in self.lines:
+            values = [board[cell] for cell in line]
+            if values.count(player_symbol) == needed and self.EMPTY in values:
+                return line[values.index(self.EMPTY)] + 1
+
+        return None
@@ -0,0 +1,354 @@
+"""
+Opening book for board variants too large to solve.
+
+The first few plies of a game on a larger board are the most expensive to
+search (the most empty cells) and the most repetitive. The book stores the
+best replies found by a budgeted search for every position the book's side
+can reach in the opening, so AIPlayer answers those moves with a lookup.
+
+Positions are keyed by the Zobrist hash of their canonical form (the
+smallest hash over the eight rotations and reflections of the board) with the
+side to move folded in, so symmetric positions share one entry. Replies are
+stored in the canonical orientation and mapped back onto the actual board.
+
+File format (little-endian):
+    - 4-byte magic ``b'TTB1'``
+    - uint16 board size, uint16 win length, uint32 record count
+    - fixed-width records sorted by key, then move:
+        - uint64 canonical position key
+        - uint16 best reply as a 0-based cell index in canonical orientation
+
+A position with several equally good replies has one record per reply.
+Lookups binary-search the memory-mapped file, so opening a book costs
+nothing until the first probe and books are shared through the page cache.
+
+Build a book with:
+    python -m src.opening_book --size 4 --plies 4 --node-budget 20000
+"""
+import argparse
+import mmap
+import os
+import struct
+import sys
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from src.tic_tac_toe import TicTacToe, zobrist_hash
+from src.generalized_tic_tac_toe import board_geometry, square_symmetries
+
+MAGIC = b'TTB1'
+HEADER = struct.Struct('<4sHHI')
+RECORD = struct.Struct('<QH')
+_KEY = struct.Struct('<Q')
+
+DEFAULT_BOOK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def default_book_path(size: int, win_length: int) -> str:
+    """
+    Location of the book shipped for a board configuration.
+
+    Args:
+        size (int): Board width and height
+        win_length (int): Marks in a row needed to win
+
+    Returns:
+        str: Path inside the package data directory
+    """
+    return os.path.join(DEFAULT_BOOK_DIR, f'opening_{size}x{size}_{win_length}.bin')
+
+
+def canonical_key(board: Sequence[str], side_to_move: str, size: int) -> Tuple[int, int]:
+    """
+    Compute the symmetry-independent key of a position.
+
+    Args:
+        board (Sequence[str]): Board cells (size * size elements)
+        side_to_move (str): 'X' or 'O'
+        size (int): Board width and height
+
+    Returns:
+        Tuple[int, int]: The 64-bit key and the index of the symmetry in
+            square_symmetries(size) that produces the canonical board
+    """
+    best_key = None
+    best_transform = 0
+    for transform, source in enumerate(square_symmetries(size)):
+        key = zobrist_hash([board[index] for index in source], side_to_move)
+        if best_key is None or key < best_key:
+            best_key = key
+            best_transform = transform
+    return best_key, best_transform
+
+
+def _side_to_move(board: Sequence[str]) -> str:
+    """Infer the player to move from the number of marks (X moves first)."""
+    x_count = board.count(TicTacToe.PLAYER_X)
+    o_count = board.count(TicTacToe.PLAYER_O)
+    return TicTacToe.PLAYER_X if x_count == o_count else TicTacToe.PLAYER_O
+
+
+def build_book(size: int, win_length: Optional[int] = None, plies: int = 4,
+               node_budget: int = 20000) -> Dict[int, List[int]]:
+    """
+    Search the best replies of every opening position the book's side can reach.
+
+    For each side, the opening tree is walked for ``plies`` plies: the book
+    side plays only its best replies, while the opponent plays every legal
+    move. Each position where the book side moves is searched once with
+    iterative deepening under ``node_budget``, so a build is reproducible.
+
+    Args:
+        size (int): Board width and height
+        win_length (Optional[int]): Marks in a row needed to win (default: size)
+        plies (int): Number of opening plies covered (default: 4)
+        node_budget (int): Search nodes per position (default: 20000)
+
+    Returns:
+        Dict[int, List[int]]: Canonical cell indices of the best replies per key
+
+    Raises:
+        ValueError: If plies or node_budget is not positive
+    """
+    # Imported here because AIPlayer itself consults the book
+    from src.player import AIPlayer, DifficultyLevel
+
+    if win_length is None:
+        win_length = size
+    if plies < 1:
+        raise ValueError(f"plies must be positive, got {plies}")
+    if node_budget < 1:
+        raise ValueError(f"node_budget must be positive, got {node_budget}")
+
+    _, lines_through = board_geometry(size, win_length)
+    symmetries = square_symmetries(size)
+    inverses = [tuple(source.index(index) for index in range(size * size)) for source in symmetries]
+    searchers = {
+        symbol: AIPlayer(symbol, DifficultyLevel.HARD, enable_delay=False, node_budget=node_budget,
+                         use_opening_book=False, board_size=size, win_length=win_length)
+        for symbol in (TicTacToe.PLAYER_X, TicTacToe.PLAYER_O)
+    }
+    book: Dict[int, List[int]] = {}
+    expanded: Set[Tuple[int, str]] = set()
+
+    def completes_line(board: List[str], index: int) -> bool:
+        symbol = board[index]
+        return any(all(board[cell] == symbol for cell in line) for line in lines_through[index])
+
+    def visit(board: List[str], side: str, ply: int, book_side: str) -> None:
+        key, transform = canonical_key(board, side, size)
+        if (key, book_side) in expanded:
+            return
+        expanded.add((key, book_side))
+
+        if side == book_side:
+            if key not in book:
+                best = searchers[side]._iterative_deepening(board)
+                book[key] = sorted(inverses[transform][position - 1] for position in best)
+            moves = [symmetries[transform][cell] for cell in book[key]]
+        else:
+            moves = [index for index, cell in enumerate(board) if cell == TicTacToe.EMPTY]
+
+        if ply + 1 >= plies:
+            return
+        opponent = TicTacToe.PLAYER_O if side == TicTacToe.PLAYER_X else TicTacToe.PLAYER_X
+        for index in moves:
+            board[index] = side
+            if not completes_line(board, index) and TicTacToe.EMPTY in board:
+                visit(board, opponent, ply + 1, book_side)
+            board[index] = TicTacToe.EMPTY
+
+    for book_side in (TicTacToe.PLAYER_X, TicTacToe.PLAYER_O):
+        visit([TicTacToe.EMPTY] * (size * size), TicTacToe.PLAYER_X, 0, book_side)
+    return book
+
+
+def write_book(book: Dict[int, List[int]], size: int, win_length: int, path: str) -> int:
+    """
+    Write a book as a sorted fixed-width binary file.
+
+    Args:
+        book (Dict[int, List[int]]): Best replies per canonical key (see build_book)
+        size (int): Board width and height
+        win_length (int): Marks in a row needed to win
+        path (str): Output file path
+
+    Returns:
+        int: Number of records written
+    """
+    records = sorted((key, move) for key, moves in book.items() for move in moves)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(path, 'wb') as output:
+        output.write(HEADER.pack(MAGIC, size, win_length, len(records)))
+        output.write(b''.join(RECORD.pack(key, move) for key, move in records))
+    return len(records)
+
+
+class OpeningBook:
+    """
+    Lazily memory-mapped reader for an opening book file.
+
+    Example:
+        >>> book = OpeningBook(default_book_path(4, 4), size=4, win_length=4)
+        >>> book.best_moves([' '] * 16, 'X')
+        [1, 4, 6, 7, 10, 11, 13, 16]
+
+    Attributes:
+        path (str): Location of the binary book file
+        size (int): Board width and height the book was built for
+        win_length (int): Marks in a row needed to win
+    """
+
+    def __init__(self, path: str, size: int, win_length: Optional[int] = None):
+        """
+        Create a reader for a book file without opening it.
+
+        Args:
+            path (str): Location of the binary book file
+            size (int): Board width and height the book must cover
+            win_length (Optional[int]): Marks in a row needed to win (default: size)
+        """
+        self.path = path
+        self.size = size
+        self.win_length = size if win_length is None else win_length
+        self._data: Optional[mmap.mmap] = None
+        self._count = 0
+        self._unavailable = False
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        """
+        Check whether the book file exists and matches the board, loading it if needed.
+
+        Returns:
+            bool: True if lookups can be answered from the book
+        """
+        return self._load() is not None
+
+    def __len__(self) -> int:
+        """Number of records in the book (0 if it is unavailable)."""
+        return self._count if self._load() is not None else 0
+
+    def best_moves(self, board: Sequence[str], symbol: str) -> Optional[List[int]]:
+        """
+        Look up the book replies for the player about to move.
+
+        Args:
+            board (Sequence[str]): Board cells (size * size elements)
+            symbol (str): Symbol of the player to move ('X' or 'O')
+
+        Returns:
+            Optional[List[int]]: Best positions (1-based) in ascending order, or None
+                if the book is unavailable, the board has the wrong size, it is not
+                ``symbol``'s turn, or the position is not in the book
+        """
+        data = self._load()
+        if data is None or len(board) != self.size * self.size or _side_to_move(board) != symbol:
+            return None
+
+        key, transform = canonical_key(board, symbol, self.size)
+        offset = HEADER.size
+        low, high = 0, self._count
+        while low < high:  # First record whose key is not below ``key``
+            middle = (low + high) // 2
+            if _KEY.unpack_from(data, offset + middle * RECORD.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        source = square_symmetries(self.size)[transform]
+        moves = []
+        for record in range(low, self._count):
+            record_key, cell = RECORD.unpack_from(data, offset + record * RECORD.size)
+            if record_key != key:
+                break
+            moves.append(source[cell] + 1)
+        return sorted(moves) or None
+
+    def close(self) -> None:
+        """Release the memory map. The next lookup maps the file again."""
+        with self._lock:
+            if self._data is not None:
+                self._data.close()
+                self._data = None
+            self._unavailable = False
+
+    def _load(self) -> Optional[mmap.mmap]:
+        """Map the book file on first use; remember if it is missing or invalid."""
+        if self._data is not None or self._unavailable:
+            return self._data
+
+        with self._lock:
+            if self._data is None and not self._unavailable:
+                try:
+                    with open(self.path, 'rb') as book_file:
+                        data = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    self._unavailable = True
+                    return None
+
+                if len(data) < HEADER.size:
+                    data.close()
+                    self._unavailable = True
+                    return None
+                magic, size, win_length, count = HEADER.unpack_from(data, 0)
+                if (magic != MAGIC or (size, win_length) != (self.size, self.win_length) or
+                        len(data) != HEADER.size + RECORD.size * count):
+                    data.close()
+                    self._unavailable = True
+                    return None
+                self._count = count
+                self._data = data
+        return self._data
+
+
+@lru_cache(maxsize=None)
+def default_book(size: int, win_length: int) -> OpeningBook:
+    """
+    Shared reader for the book shipped with the package for a board configuration.
+
+    Args:
+        size (int): Board width and height
+        win_length (int): Marks in a row needed to win
+
+    Returns:
+        OpeningBook: Reader (unavailable if no book ships for the configuration)
+    """
+    return OpeningBook(default_book_path(size, win_length), size, win_length)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point for building an opening book.
+
+    Usage:
+        python -m src.opening_book --size 4 --win-length 4 --plies 4 --node-budget 20000
+
+    Args:
+        argv (Optional[List[str]]): Arguments to parse (default: sys.argv[1:])
+
+    Returns:
+        int: Number of records written
+    """
+    parser = argparse.ArgumentParser(description="Build an opening book for a board variant.")
+    parser.add_argument('--size', type=int, default=4, help="board width and height")
+    parser.add_argument('--win-length', type=int, default=None, help="marks in a row to win (default: size)")
+    parser.add_argument('--plies', type=int, default=4, help="opening plies covered")
+    parser.add_argument('--node-budget', type=int, default=20000, help="search nodes per position")
+    parser.add_argument('--output', default=None, help="output path (default: the shipped book)")
+    args = parser.parse_args(argv)
+
+    win_length = args.size if args.win_length is None else args.win_length
+    path = args.output or default_book_path(args.size, win_length)
+    book = build_book(args.size, win_length, args.plies, args.node_budget)
+    count = write_book(book, args.size, win_length, path)
+    print(f"Wrote {count} replies for {len(book)} positions to {path}")
+    return count
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,263 @@
+"""
+Precomputed perfect-play table for 3x3 Tic-Tac-Toe.
+
+Every position reachable from the empty board is solved once with exhaustive
+minimax and written to a small binary file that ships with the package. At
+runtime AIPlayer answers HARD-difficulty moves with a single lookup instead of
+a tree search.
+
+File format (little-endian):
+    - 4-byte magic ``b'TTT1'``
+    - uint32 entry count (3^9 = 19683)
+    - one uint16 record per board, indexed by TicTacToe.encode_board
+      (empty = 0, X = 1, O = 2, position 1 is the least significant digit)
+
+Record layout:
+    - bits 0-8:  mask of optimal moves (bit i set = position i + 1)
+    - bits 9-10: game value for the side to move (0 = loss, 1 = draw, 2 = win)
+    - 0xFFFF marks a board that cannot occur in a legal game
+
+Rebuild the shipped table with:
+    python -m src.perfect_play_table
+"""
+import mmap
+import os
+import struct
+import sys
+import threading
+from typing import Dict, List, Optional
+
+from src.tic_tac_toe import TicTacToe, BOARD_CODE_COUNT
+
+MAGIC = b'TTT1'
+HEADER = struct.Struct('<4sI')
+RECORD = struct.Struct('<H')
+ENTRY_COUNT = BOARD_CODE_COUNT
+UNREACHABLE = 0xFFFF
+
+LOSS, DRAW, WIN = -1, 0, 1
+
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  'data', 'perfect_play.bin')
+
+_MASK_POSITIONS = tuple(
+    [position for position in range(1, 10) if mask >> (position - 1) & 1]
+    for mask in range(1 << 9)
+)
+
+
+def board_index(board: List[str]) -> int:
+    """
+    Compute the base-3 table index of a board.
+
+    Args:
+        board (List[str]): 9-element board
+
+    Returns:
+        int: Index in the range 0 to 3^9 - 1
+    """
+    return TicTacToe.encode_board(board)
+
+
+def solve_all_positions() -> Dict[int, int]:
+    """
+    Solve every position reachable from the empty board.
+
+    Positions are generated by playing moves through TicTacToe, so only boards
+    that can occur in a legal game are included.
+
+    Returns:
+        Dict[int, int]: Packed record for each reachable board index
+    """
+    records: Dict[int, int] = {}
+
+    def solve(game: TicTacToe) -> int:
+        index = board_index(game.board)
+        if index in records:
+            return (records[index] >> 9) - 1
+
+        state = game.get_game_state()
+        if state['state'] == 'won':
+            value, optimal_mask = LOSS, 0  # The previous move won the game
+        elif state['state'] == 'draw':
+            value, optimal_mask = DRAW, 0
+        else:
+            value, optimal_mask = LOSS - 1, 0
+            for position in range(1, 10):
+                if not game.is_valid_move(position):
+                    continue
+                child = TicTacToe(game.mode)
+                child.board = game.board.copy()
+                child.current_player = game.current_player
+                child.make_move(position)
+
+                move_value = -solve(child)
+                if move_value > value:
+                    value, optimal_mask = move_value, 0
+                if move_value == value:
+                    optimal_mask |= 1 << (position - 1)
+
+        records[index] = (value + 1) << 9 | optimal_mask
+        return value
+
+    solve(TicTacToe())
+    return records
+
+
+def write_table(path: str = DEFAULT_TABLE_PATH) -> int:
+    """
+    Solve the game and write the binary table.
+
+    Args:
+        path (str): Output file path (default: the table shipped with the package)
+
+    Returns:
+        int: Number of reachable positions written
+    """
+    records = solve_all_positions()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(path, 'wb') as output:
+        output.write(HEADER.pack(MAGIC, ENTRY_COUNT))
+        output.write(b''.join(RECORD.pack(records.get(index, UNREACHABLE))
+                              for index in range(ENTRY_COUNT)))
+    return len(records)
+
+
+class PerfectPlayTable:
+    """
+    Lazily memory-mapped reader for the perfect-play table.
+
+    The file is not opened until the first lookup, and lookups read a single
+    record straight from the mapped file, so creating players stays cheap and
+    the table is shared through the OS page cache.
+
+    Example:
+        >>> table = PerfectPlayTable()
+        >>> table.best_moves(['X', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '], 'O')
+        [5]
+
+    Attributes:
+        path (str): Location of the binary table file
+    """
+
+    def __init__(self, path: str = DEFAULT_TABLE_PATH):
+        """
+        Create a reader for the given table file without opening it.
+
+        Args:
+            path (str): Location of the binary table file
+        """
+        self.path = path
+        self._data: Optional[mmap.mmap] = None
+        self._unavailable = False
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        """
+        Check whether the table file exists and is valid, loading it if needed.
+
+        Returns:
+            bool: True if lookups can be answered from the table
+        """
+        return self._load() is not None
+
+    def best_moves(self, board: List[str], symbol: str) -> Optional[List[int]]:
+        """
+        Look up every optimal move for the player about to move.
+
+        Args:
+            board (List[str]): 9-element board
+            symbol (str): Symbol of the player to move ('X' or 'O')
+
+        Returns:
+            Optional[List[int]]: Optimal positions (1-9), or None if the table is
+                unavailable, the board cannot occur in a legal game, it is not
+                ``symbol``'s turn, or the game is already over
+        """
+        record = self._record(board, symbol)
+        if record is None or not record & 0x1FF:
+            return None
+        return list(_MASK_POSITIONS[record & 0x1FF])
+
+    def value(self, board: List[str], symbol: str) -> Optional[int]:
+        """
+        Look up the game-theoretic value of a position for the player to move.
+
+        Args:
+            board (List[str]): 9-element board
+            symbol (str): Symbol of the player to move ('X' or 'O')
+
+        Returns:
+            Optional[int]: 1 (win), 0 (draw) or -1 (loss) with perfect play, or
+                None under the same conditions as best_moves
+        """
+        record = self._record(board, symbol)
+        if record is None:
+            return None
+        return (record >> 9) - 1
+
+    def close(self) -> None:
+        """Release the memory map. The next lookup maps the file again."""
+        with self._lock:
+            if self._data is not None:
+                self._data.close()
+                self._data = None
+            self._unavailable = False
+
+    def _record(self, board: List[str], symbol: str) -> Optional[int]:
+        """Read the packed record for a board, or None if it does not apply."""
+        data = self._load()
+        if data is None:
+            return None
+
+        x_count = board.count(TicTacToe.PLAYER_X)
+        o_count = board.count(TicTacToe.PLAYER_O)
+        side_to_move = TicTacToe.PLAYER_X if x_count == o_count else TicTacToe.PLAYER_O
+        if symbol != side_to_move:
+            return None
+
+        record = RECORD.unpack_from(data, HEADER.size + RECORD.size * board_index(board))[0]
+        if record == UNREACHABLE:
+            return None
+        return record
+
+    def _load(self) -> Optional[mmap.mmap]:
+        """Map the table file on first use; remember if it is missing or invalid."""
+        if self._data is not None or self._unavailable:
+            return self._data
+
+        with self._lock:
+            if self._data is None and not self._unavailable:
+                try:
+                    with open(self.path, 'rb') as table_file:
+                        data = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    self._unavailable = True
+                    return None
+
+                # Check the length first: a file shorter than the header cannot be unpacked
+                if len(data) < HEADER.size:
+                    data.close()
+                    self._unavailable = True
+                    return None
+                magic, count = HEADER.unpack_from(data, 0)
+                if (magic != MAGIC or count != ENTRY_COUNT or
+                        len(data) != HEADER.size + RECORD.size * ENTRY_COUNT):
+                    data.close()
+                    self._unavailable = True
+                    return None
+                self._data = data
+        return self._data
+
+
+# Shared reader used by AIPlayer; the file is mapped on the first HARD lookup
+default_table = PerfectPlayTable()
+
+
+if __name__ == '__main__':
+    output_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TABLE_PATH
+    count = write_table(output_path)
+    print(f"Wrote {count} positions to {output_path}")
@@ -1,11 +1,80 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Callable, Sequence, Tuple, Union
+import asyncio
+import math
 import random
+import threading
 import time
 import sys
+import weakref
 from enum import Enum
 
-from src.tic_tac_toe import TicTacToe
+from src.tic_tac_toe import (TicTacToe, SYMMETRIES, INVERSE_SYMMETRIES, ZOBRIST_SIDE_KEY, board_winner,
+                             board_is_full, make_rng, zobrist_hash, zobrist_keys)
+from src.generalized_tic_tac_toe import GeneralizedTicTacToe, board_geometry
+from src.transposition_table import TranspositionTable, Bound
+from src.position_evaluator import PositionEvaluator
+from src import perfect_play_table
+from src.opening_book import OpeningBook, default_book
+from src.endgame_tablebase import EndgameTablebase
+
+class _SearchTimeout(Exception):
+    """Raised inside a search when its time or node budget is exhausted."""
+
+
+class _SearchBudget:
+    """
+    Time and node limits for one budgeted search.
+
+    The clock is only read every 64 nodes, so enforcing a time budget costs
+    almost nothing per node while overshooting the deadline by at most a few
+    dozen nodes.
+    """
+    CLOCK_INTERVAL = 64
+
+    def __init__(self, time_budget: Optional[float], node_budget: Optional[int]):
+        self.deadline = None if time_budget is None else time.perf_counter() + time_budget
+        self.node_budget = node_budget
+        self.nodes = 0
+
+    def charge(self) -> None:
+        """Count one node and raise _SearchTimeout once a limit is reached."""
+        self.nodes += 1
+        if self.node_budget is not None and self.nodes > self.node_budget:
+            raise _SearchTimeout()
+        if (self.deadline is not None and not self.nodes % self.CLOCK_INTERVAL and
+                time.perf_counter() >= self.deadline):
+            raise _SearchTimeout()
+
+
+class _ActiveBudget(threading.local):
+    """Per-thread slot for the budget of the search running on that thread."""
+    budget: Optional[_SearchBudget] = None
+
+
+# Search depth meaning "to the end of the game"; it is never decremented
+UNLIMITED_DEPTH = -1
+
+# Integer bound beyond any reachable score (at most 10 plus the number of cells)
+SCORE_BOUND = 1_000_000
+
+
+class _OrderingHeuristics(threading.local):
+    """
+    Per-thread killer and history tables for dynamic move ordering.
+
+    ``killers[n]`` holds the last two moves that caused a cutoff in positions
+    with ``n`` empty cells, and ``history[symbol][cell]`` grows every time that
+    player's move at ``cell`` causes a cutoff, weighted by the size of the
+    subtree it pruned. Both only change the order moves are tried in, so they
+    are kept between searches.
+    """
+
+    def __init__(self, cell_count: int):
+        self.killers: List[List[Optional[int]]] = [[None, None] for _ in range(cell_count + 1)]
+        self.history = {TicTacToe.PLAYER_X: [0] * cell_count, TicTacToe.PLAYER_O: [0] * cell_count}
+
 
 class DifficultyLevel(Enum):
     """AI Difficulty levels"""
@@ -13,6 +82,14 @@ class DifficultyLevel(Enum):
     MEDIUM = "medium"
     HARD = "hard"
 
+
+class MoveOrdering(Enum):
+    """Order in which the AI search tries the moves of each position"""
+    INDEX = "index"      # Board order, position 1 first
+    STATIC = "static"    # Cells on the most winning lines first: center, corners, then edges
+    DYNAMIC = "dynamic"  # Transposition-table move and killer moves, then static
+    HISTORY = "history"  # As DYNAMIC, with history scores breaking ties between equally central cells
+
 class Player(ABC):
     """
     Abstract base class for all player types in the Tic-Tac-Toe game.
@@ -42,19 +119,22 @@ class Player(ABC):
         
     Attributes:
         symbol (str): Player's symbol ('X' or 'O')
+        rng (random.Random): This player's own random generator, behind every
+            random choice it makes
     """
 
-    def __init__(self, symbol: str):
+    def __init__(self, symbol: str, rng: Union[random.Random, int, None] = None):
         if symbol not in [TicTacToe.PLAYER_X, TicTacToe.PLAYER_O]:
             raise ValueError(f"Invalid symbol '{symbol}'. Must be 'X' or 'O'.")
         self.symbol = symbol
+        self.rng = make_rng(rng)
 
     @abstractmethod
     def get_move(self, board: List[str]) -> int:
         pass
 
     @classmethod
-    def choose_symbol(cls) -> str:
+    def choose_symbol(cls, rng: Union[random.Random, int, None] = None) -> str:
         """
         Display symbol selection menu and get user choice.
         
@@ -62,6 +142,10 @@ class Player(ABC):
         for X, O, random choice, or quitting the game. Handles input validation
         and provides clear feedback for invalid selections.
         
+        Args:
+            rng (Union[random.Random, int, None]): Random generator or seed for the
+                random option (default: None, a new unseeded generator)
+        
         Returns:
             str: Selected player symbol ('X' or 'O')
             
@@ -87,7 +171,7 @@ class Player(ABC):
                 elif choice == '2':
                     return TicTacToe.PLAYER_O
                 elif choice == '3':
-                    symbol = random.choice([TicTacToe.PLAYER_X, TicTacToe.PLAYER_O])
+                    symbol = make_rng(rng).choice([TicTacToe.PLAYER_X, TicTacToe.PLAYER_O])
                     print(f"Random choice: You are player {symbol}")
                     return symbol
                 elif choice == '4':
@@ -148,20 +232,39 @@ class AIPlayer(Player):
            - Blocks opponent winning moves
            - Prefers center position on empty board
            - Reduces ~90% of minimax calculations for obvious positions
+           - Answers remaining positions from the precomputed perfect-play table,
+             or from the opening book on larger boards
            
         2. **Minimax with Alpha-Beta Pruning**:
            - Evaluates all possible game outcomes recursively
-           - Scoring: +10 (AI win), -10 (AI loss), 0 (draw)
-           - Pruning eliminates unnecessary branches for performance
+           - Scoring: +10 (AI win), -10 (AI loss), 0 (draw); depth-limited
+             searches score unfinished positions with a heuristic within +/-9
+           - Fail-soft alpha-beta bounds skip branches that cannot change the result
+           - Moves are ordered so the best one is usually tried first: the move
+             stored in the transposition table, killer moves, then cells on the
+             most winning lines (see MoveOrdering)
+           - Can be disabled with ``use_alpha_beta=False`` for plain minimax
+           
+        3. **Iterative Deepening** (when a time or node budget is set):
+           - Searches 1, 2, 3, ... plies deep, best moves of the last depth first
+           - Stops when the budget runs out and plays the best move of the
+             deepest completed iteration, bounding response latency on any board
            
-        3. **Difficulty-Based Randomization**:
+        4. **Parallel Root Split** (when ``parallel_workers`` > 1):
+           - Root moves are independent, so each one is searched in a separate
+             worker process and the scores are merged in the parent
+           - Worker processes are started on first use and kept for later moves;
+             call ``close()`` or use the player as a context manager to stop
+             them (they are also shut down when the player is garbage collected)
+           
+        5. **Difficulty-Based Randomization**:
            - Easy (30%): Mostly random moves with occasional optimal play
            - Medium (70%): Strategic balance of optimal and suboptimal moves  
            - Hard (100%): Perfect minimax play - unbeatable
            
     Performance:
         - Early termination reduces computation by ~90% for obvious moves
-        - Alpha-beta pruning provides additional 30-50% speedup
+        - Alpha-beta pruning cuts a full empty-board search from ~550,000 nodes to ~29,000
         - Typical move calculation: <10ms even on slower hardware
         
     Example:
@@ -181,67 +284,270 @@ class AIPlayer(Player):
         
     Attributes:
         difficulty (DifficultyLevel): AI difficulty setting
-        enable_delay (bool): Whether to simulate thinking time
+        enable_delay (bool): Whether moves take a simulated thinking time
         status_callback (Optional[Callable]): Function for AI status updates
+        use_alpha_beta (bool): Whether minimax prunes with alpha-beta bounds
+        nodes_searched (int): Total minimax nodes visited by this player
+        transposition_table (Optional[TranspositionTable]): Search cache shared by
+            every move and game this player makes, or None when disabled
+        use_lookup_table (bool): Whether optimal moves come from the precomputed
+            perfect-play table before falling back to search
+        time_budget (Optional[float]): Seconds of search allowed per move, or None
+        node_budget (Optional[int]): Search nodes allowed per move, or None
+        board_size (int): Width and height of the boards this player plays on
+        win_length (int): Marks in a row needed to win
+        cell_count (int): Number of positions on the board
+        last_search_depth (int): Deepest fully completed iteration of the most
+            recent budgeted search (0 if none completed)
+        parallel_workers (int): Worker processes used to search root moves (1 searches
+            in the calling process)
+        move_ordering (MoveOrdering): Order the search tries moves in
+        opening_book (Optional[OpeningBook]): Book of precomputed opening replies
+            consulted before searching on larger boards, or None when disabled
+        tablebase (Optional[EndgameTablebase]): Solved endgame positions that end
+            the search as soon as it reaches one, or None
+        rng (random.Random): Random generator for difficulty rolls, ties between
+            optimal moves and the thinking delay
     """
 
     def __init__(self, symbol: str, difficulty: DifficultyLevel, enable_delay: bool = True, 
-             status_callback: Optional[Callable[[str], None]] = None):
+             status_callback: Optional[Callable[[str], None]] = None,
+             use_alpha_beta: bool = True, transposition_table_size: int = 20000,
+             use_lookup_table: bool = True, time_budget: Optional[float] = None,
+             node_budget: Optional[int] = None, board_size: int = 3,
+             win_length: Optional[int] = None, parallel_workers: int = 1,
+             move_ordering: MoveOrdering = MoveOrdering.DYNAMIC,
+             use_opening_book: bool = True, tablebase: Optional[EndgameTablebase] = None,
+             rng: Union[random.Random, int, None] = None):
         """
         Initialize AI Player with symbol and difficulty level
 
         Args:
             symbol (str): Player symbol ('X' or 'O')
             difficulty (DifficultyLevel): AI Difficulty level
-            enable_delay (bool): Whether to enable move delay simulation (default: True)
+            enable_delay (bool): Whether to enable move delay simulation (default: True).
+                The delay is a random minimum response time of 0.5-2 seconds, and time
+                spent searching counts toward it.
             status_callback (Optional[Callable[[str], None]]): Optional callback function 
                 for AI status messages (e.g., "AI is thinking...")
+            use_alpha_beta (bool): Whether to prune the minimax search with alpha-beta
+                bounds (default: True). Pruning never changes which moves are optimal.
+            transposition_table_size (int): Maximum number of positions cached between
+                searches (default: 20000). Use 0 to disable the transposition table.
+            use_lookup_table (bool): Whether to answer optimal moves from the shipped
+                perfect-play table (default: True). Positions the table cannot answer
+                fall back to minimax search. The table only covers the 3x3 game.
+            time_budget (Optional[float]): Maximum seconds of search per move. When this
+                or node_budget is set, search uses iterative deepening and returns the
+                best move found so far once the budget runs out (default: None, search
+                to the end of the game).
+            node_budget (Optional[int]): Maximum search nodes per move (default: None)
+            board_size (int): Width and height of the board (default: 3)
+            win_length (Optional[int]): Marks in a row needed to win (default: board_size)
+            parallel_workers (int): Worker processes for the root-split search
+                (default: 1, search in the calling process). Each worker keeps its own
+                transposition table, and a node budget is split evenly between the
+                root moves.
+            move_ordering (MoveOrdering): Order the search tries moves in (default:
+                MoveOrdering.DYNAMIC). Ordering only changes how much alpha-beta can
+                prune, never which moves are optimal.
+            use_opening_book (bool): Whether to answer opening moves on boards other
+                than 3x3 from the opening book shipped for the configuration
+                (default: True). Positions outside the book fall back to search.
+            tablebase (Optional[EndgameTablebase]): Win/draw/loss values of positions
+                with few empty cells for this board configuration (default: None).
+                The search scores those positions with a lookup instead of expanding
+                them. Parallel workers search without it.
+            rng (Union[random.Random, int, None]): Random generator for every random
+                choice, or a seed for a new one (default: None, a new generator seeded
+                from the OS). Pass a seed or a seeded random.Random to replay the
+                same games.
 
         Raises:
             ValueError: If symbol is invalid
+            ValueError: If a budget is not positive, the board geometry is invalid or
+                parallel_workers is less than 1
             TypeError: If difficulty is not a DifficultyLevel enum
+            TypeError: If move_ordering is not a MoveOrdering enum
+            ValueError: If tablebase was built for a different board configuration
         """
-        super().__init__(symbol)
+        super().__init__(symbol, rng)
 
         if not isinstance(difficulty, DifficultyLevel):
             raise TypeError(f"Difficulty must be a DifficultyLevel enum, got {type(difficulty)}")
+        if not isinstance(move_ordering, MoveOrdering):
+            raise TypeError(f"move_ordering must be a MoveOrdering enum, got {type(move_ordering)}")
         
         self.difficulty = difficulty
         self.enable_delay = enable_delay
         self.status_callback = status_callback
-        # Create a single TicTacToe instance for board analysis (optimization)
-        self._game_analyzer = TicTacToe()
+        self.use_alpha_beta = use_alpha_beta
+        self.nodes_searched = 0
+        self.transposition_table = (TranspositionTable(transposition_table_size)
+                                    if transposition_table_size > 0 else None)
+        self.use_lookup_table = use_lookup_table
+
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError(f"time_budget must be positive, got {time_budget}")
+        if node_budget is not None and node_budget < 1:
+            raise ValueError(f"node_budget must be positive, got {node_budget}")
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.last_search_depth = 0
+        self._active_budget = _ActiveBudget()
+
+        if win_length is None:
+            win_length = board_size
+        if board_size < 1 or not 1 <= win_length <= board_size:
+            raise ValueError(f"Invalid board geometry: size {board_size}, win length {win_length}")
+        self.board_size = board_size
+        self.win_length = win_length
+        self.cell_count = board_size * board_size
+        self._lines, self._lines_through = board_geometry(board_size, win_length)
+        self._zobrist = zobrist_keys(self.cell_count)
+        self._evaluator = PositionEvaluator(board_size, win_length)
+        # The symmetry tables, board_winner and the perfect-play table are 3x3 only
+        self._is_classic = board_size == 3 and win_length == 3
+
+        if parallel_workers < 1:
+            raise ValueError(f"parallel_workers must be at least 1, got {parallel_workers}")
+        self.parallel_workers = parallel_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_finalizer: Optional[weakref.finalize] = None
+        self._executor_lock = threading.Lock()
+
+        self.move_ordering = move_ordering
+        center = (board_size - 1) / 2
+        self._line_counts = tuple(len(lines) for lines in self._lines_through)
+        # Cells on more winning lines first, then closer to the center
+        self._static_order = tuple(sorted(
+            range(self.cell_count),
+            key=lambda cell: (-self._line_counts[cell],
+                              (cell // board_size - center) ** 2 + (cell % board_size - center) ** 2)))
+        self._heuristics = _OrderingHeuristics(self.cell_count)
+
+        # The 3x3 game is solved by the perfect-play table instead
+        self.opening_book: Optional[OpeningBook] = (
+            default_book(board_size, win_length) if use_opening_book and not self._is_classic else None)
+
+        if tablebase is not None and (tablebase.size, tablebase.win_length) != (board_size, win_length):
+            raise ValueError(f"Tablebase is for size {tablebase.size}, win length {tablebase.win_length}, "
+                             f"not size {board_size}, win length {win_length}")
+        self.tablebase = tablebase
+
+    def close(self) -> None:
+        """Shut down the worker processes of the parallel search, if any were started."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            finalizer, self._executor_finalizer = self._executor_finalizer, None
+        if finalizer is not None:
+            finalizer.detach()
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> 'AIPlayer':
+        """Use the player in a with block that closes it on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Shut down the parallel search workers when the with block ends."""
+        self.close()
 
     def get_move(self, board: List[str]) -> int:
         """
         Get AI move using strategic randomness based on difficulty level.
     
         Args:
-            board (List[str]): Current board state (9 elements)
+            board (List[str]): Current board state (board_size * board_size elements)
     
         Returns:
-            int: Position 1-9 for AI move
+            int: Position (1-9 on the standard board) for AI move
     
         Raises:
             ValueError: If no valid moves are available
             ValueError: If board is invalid format
         """
-        if len(board) != 9:
-            raise ValueError(f"Board must have exactly 9 positions, got {len(board)}")
+        available_moves = self._available_moves(board)
         
-        available_moves = [i + 1 for i in range(9) if board[i] == TicTacToe.EMPTY]
+        # The thinking delay is a minimum response time: the search runs inside
+        # it, and only the time it leaves over is slept
+        deadline = self._start_thinking_delay() if self.enable_delay else None
+        move = self._choose_move(board, available_moves)
+        if deadline is not None:
+            remaining = self._remaining_delay(deadline)
+            if remaining > 0:
+                time.sleep(remaining)
+        return move
     
-        if not available_moves:
-            raise ValueError("No valid moves available on the board")
+    async def get_move_async(self, board: List[str], executor: Optional[ThreadPoolExecutor] = None) -> int:
+        """
+        Awaitable variant of get_move for asyncio applications.
+    
+        The search runs in ``executor`` (default: the event loop's default
+        executor) so the event loop stays responsive, and the rest of the thinking
+        delay is awaited with asyncio.sleep instead of blocking a thread.
+    
+        Only thread pools are supported: the search is a bound method of this
+        player, which holds locks and cannot be pickled for a process pool. The
+        search still holds the GIL while it runs, so on large boards set a
+        time_budget or node_budget to keep each move short.
+    
+        Args:
+            board (List[str]): Current board state (board_size * board_size elements)
+            executor (Optional[ThreadPoolExecutor]): Thread pool the search runs in
+                (default: None, the event loop's default thread pool)
+    
+        Returns:
+            int: Position (1-9 on the standard board) for AI move
+    
+        Raises:
+            ValueError: If executor is not a ThreadPoolExecutor
+            ValueError: If no valid moves are available
+            ValueError: If board is invalid format
+        """
+        if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+            raise ValueError(f"executor must be a ThreadPoolExecutor, got {type(executor).__name__}")
+        available_moves = self._available_moves(board)
         
-        if self.enable_delay:
-            self._simulate_thinking_delay()
+        deadline = self._start_thinking_delay() if self.enable_delay else None
+        loop = asyncio.get_running_loop()
+        # The search writes moves into the board while it runs, so give it a copy
+        move = await loop.run_in_executor(executor, self._choose_move, list(board), available_moves)
+        if deadline is not None:
+            remaining = self._remaining_delay(deadline)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+        return move
+    
+    def _available_moves(self, board: List[str]) -> List[int]:
+        """
+        Validate a board and list its empty positions.
+    
+        Args:
+            board (List[str]): Current board state
+    
+        Returns:
+            List[int]: Empty positions (1-based)
+    
+        Raises:
+            ValueError: If board is invalid format or has no empty positions
+        """
+        if len(board) != self.cell_count:
+            raise ValueError(f"Board must have exactly {self.cell_count} positions, got {len(board)}")
         
+        available_moves = [i + 1 for i in range(self.cell_count) if board[i] == TicTacToe.EMPTY]
+    
+        if not available_moves:
+            raise ValueError("No valid moves available on the board")
+        return available_moves
+    
+    def _choose_move(self, board: List[str], available_moves: List[int]) -> int:
+        """Pick an optimal or a reasonable suboptimal move according to the difficulty."""
         # Get optimal play probability based on difficulty
         optimal_probability = self._get_optimal_probability()
         
         # Decide whether to play optimally or suboptimally
-        if random.random() < optimal_probability:
+        if self.rng.random() < optimal_probability:
             # Play optimally - use full minimax
             return self._get_best_move_minimax(board)
         else:
@@ -262,7 +568,10 @@ class AIPlayer(Player):
         # Early termination optimization: Check for obvious moves first
         
         # Create a temporary game analyzer with the current board state
-        temp_game = TicTacToe()
+        if self._is_classic:
+            temp_game = TicTacToe()
+        else:
+            temp_game = GeneralizedTicTacToe(self.board_size, self.win_length)
         temp_game.board = board.copy()
         
         # 1. Check for immediate wins
@@ -277,21 +586,90 @@ class AIPlayer(Player):
             return blocking_move
         
         # 3. Prefer center on empty board (existing optimization)
-        if all(pos == TicTacToe.EMPTY for pos in board) and board[4] == TicTacToe.EMPTY:
-            return 5  # Center position
+        if self.board_size % 2 and all(pos == TicTacToe.EMPTY for pos in board):
+            return self.cell_count // 2 + 1  # Center position
         
-        # 4. Fall back to full minimax for complex positions
-        best_score = float('-inf')
-        best_moves = []  # Track all equally good moves
+        # 4. Look up the optimal moves in the precomputed perfect-play table
+        if self.use_lookup_table and self._is_classic:
+            best_moves = perfect_play_table.default_table.best_moves(board, self.symbol)
+            if best_moves:
+                return self.rng.choice(best_moves)
+
+        # 5. On larger boards, play a precomputed reply from the opening book
+        if self.opening_book is not None:
+            best_moves = self.opening_book.best_moves(board, self.symbol)
+            if best_moves:
+                return self.rng.choice(best_moves)
+        
+        # 6. Fall back to minimax for positions the table cannot answer, deepening
+        # iteratively when the move has a budget. Randomly choose among equally
+        # optimal moves
+        if self.time_budget is not None or self.node_budget is not None:
+            return self.rng.choice(self._iterative_deepening(board))
+        return self.rng.choice(self._find_best_moves(board))
     
-        for position in range(1, 10):
-            if board[position - 1] == TicTacToe.EMPTY:
-                # Simulate this move
-                simulated_board = board.copy()
-                simulated_board[position - 1] = self.symbol
+    def _find_best_moves(self, board: List[str]) -> List[int]:
+        """
+        Run a full-depth minimax search from the root and collect every optimal move.
+        
+        Args:
+            board (List[str]): Current board state with the AI to move
+            
+        Returns:
+            List[int]: All positions that share the best minimax score
+        """
+        return self._search_root(board, UNLIMITED_DEPTH)[1]
     
-                # Evaluate this move (opponent's turn next, unlimited depth)
-                score = self._minimax(simulated_board, float('inf'), False)
+    def _search_root(self, board: List[str], depth: int,
+                     first_moves: Sequence[int] = ()) -> Tuple[int, List[int]]:
+        """
+        Search every move at the root to the given depth.
+        
+        With alpha-beta enabled, each root move is searched with a lower bound one
+        point below the best score found so far. Scores are integers, so any move
+        that ties the best score still gets its exact value, while worse moves are
+        cut off as soon as they are proven worse. The returned set is therefore
+        identical to the one found by plain minimax. With ``parallel_workers`` > 1
+        the root moves are instead scored concurrently with full windows.
+        
+        Args:
+            board (List[str]): Current board state with the AI to move
+            depth (int): Plies to search, or UNLIMITED_DEPTH for the whole game
+            first_moves (Sequence[int]): Positions to search before the others, such
+                as the best moves of a shallower iteration
+            
+        Returns:
+            Tuple[int, List[int]]: Best score and all positions that reach it, in
+                ascending order (-SCORE_BOUND and no moves on a full board)
+        """
+        best_score = -SCORE_BOUND
+        best_moves = []  # Track all equally good moves
+        board = list(board)  # Private copy, searched in place with make/unmake
+        # Children only need their last move checked for a win unless the root
+        # position is already decided
+        root_is_open = self._winner(board) is None
+        root_hash = None if self._is_classic else zobrist_hash(board)
+        child_depth = self._child_depth(depth)
+        opponent = self._get_opponent_symbol()
+        
+        order = list(first_moves)
+        order += [index + 1 for index in self._move_order() if index + 1 not in order]
+        if self.parallel_workers > 1:
+            moves = [position for position in order if board[position - 1] == TicTacToe.EMPTY]
+            if len(moves) > 1:
+                scores = self._score_root_moves_in_parallel(board, depth, moves)
+                best_score = max(scores)
+                return best_score, sorted(move for move, score in zip(moves, scores) if score == best_score)
+
+        for position in order:
+            index = position - 1
+            if board[index] == TicTacToe.EMPTY:
+                # Evaluate this move (opponent's turn next)
+                board[index] = self.symbol
+                child_hash = None if root_hash is None else root_hash ^ self._zobrist[index][self.symbol]
+                score = -self._negamax(board, child_depth, opponent, -SCORE_BOUND, 1 - best_score,
+                                       index if root_is_open else None, child_hash)
+                board[index] = TicTacToe.EMPTY
     
                 if score > best_score:
                     best_score = score
@@ -299,8 +677,134 @@ class AIPlayer(Player):
                 elif score == best_score:
                     best_moves.append(position)  # Equally good move
     
-        # Randomly choose among equally optimal moves
-        return random.choice(best_moves)
+        return best_score, sorted(best_moves)
+    
+    def _score_root_moves_in_parallel(self, board: List[str], depth: int,
+                                      moves: List[int]) -> List[int]:
+        """
+        Score each root move in its own task on the worker process pool.
+        
+        Inside a budgeted search, every task gets the time left on the move's
+        budget and an equal share of its remaining nodes. If any task runs out,
+        or the results are not back before the deadline, the whole root search
+        counts as timed out.
+        
+        Args:
+            board (List[str]): Current board state with the AI to move
+            depth (int): Plies to search, or UNLIMITED_DEPTH for the whole game
+            moves (List[int]): Empty positions to score
+            
+        Returns:
+            List[int]: Exact minimax score of each move, in the order given
+            
+        Raises:
+            _SearchTimeout: If the move's budget runs out before every score is known
+        """
+        budget = self._active_budget.budget
+        time_left = node_share = None
+        if budget is not None:
+            if budget.deadline is not None:
+                time_left = budget.deadline - time.perf_counter()
+                if time_left <= 0:
+                    raise _SearchTimeout()
+            if budget.node_budget is not None:
+                node_share = max(1, (budget.node_budget - budget.nodes) // len(moves))
+        
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.parallel_workers)
+                # Players that are never closed still release their workers; the
+                # finalizer must not reference self, or it would keep it alive
+                self._executor_finalizer = weakref.finalize(
+                    self, self._executor.shutdown, wait=False, cancel_futures=True)
+            executor = self._executor
+        
+        table_size = self.transposition_table.max_entries if self.transposition_table is not None else 0
+        settings = (self.symbol, self.use_alpha_beta, table_size, self.board_size, self.win_length,
+                    self.move_ordering)
+        futures = [executor.submit(_score_root_move_in_worker,
+                                   (settings, list(board), position, depth, time_left, node_share))
+                   for position in moves]
+        done, pending = wait(futures, timeout=time_left)
+        for future in pending:
+            future.cancel()
+        
+        results = [future.result() for future in done]
+        nodes = sum(result[1] for result in results)
+        self.nodes_searched += nodes
+        if budget is not None:
+            budget.nodes += nodes
+        if pending or any(result[0] is None for result in results):
+            raise _SearchTimeout()
+        return [future.result()[0] for future in futures]
+    
+    def _score_root_move(self, board: List[str], position: int, depth: int,
+                         time_budget: Optional[float] = None,
+                         node_budget: Optional[int] = None) -> Tuple[Optional[int], int]:
+        """
+        Search a single root move with a full window; the worker side of the root split.
+        
+        Args:
+            board (List[str]): Board before the move, with the AI to move
+            position (int): Root move to score (1-based)
+            depth (int): Plies to search counting the root move, or UNLIMITED_DEPTH
+            time_budget (Optional[float]): Seconds allowed for this move, or None
+            node_budget (Optional[int]): Nodes allowed for this move, or None
+            
+        Returns:
+            Tuple[Optional[int], int]: The move's exact score (None if the budget ran
+                out) and the number of nodes searched
+        """
+        nodes_before = self.nodes_searched
+        board = list(board)
+        index = position - 1
+        root_is_open = self._winner(board) is None
+        child_hash = None if self._is_classic else zobrist_hash(board) ^ self._zobrist[index][self.symbol]
+        board[index] = self.symbol
+        
+        if time_budget is not None or node_budget is not None:
+            self._active_budget.budget = _SearchBudget(time_budget, node_budget)
+        try:
+            score = -self._negamax(board, self._child_depth(depth), self._get_opponent_symbol(),
+                                   -SCORE_BOUND, SCORE_BOUND, index if root_is_open else None,
+                                   child_hash)
+        except _SearchTimeout:
+            score = None
+        finally:
+            self._active_budget.budget = None
+        return score, self.nodes_searched - nodes_before
+    
+    def _iterative_deepening(self, board: List[str]) -> List[int]:
+        """
+        Search 1, 2, 3, ... plies deep until the move's time or node budget runs out.
+        
+        Each iteration searches the previous iteration's best moves first. When
+        the budget is exhausted mid-iteration, that partial iteration is thrown
+        away and the best moves of the deepest completed one are returned, so
+        the caller always gets a move within budget. The search also stops early
+        once the whole game tree has been searched or a forced win or loss is found.
+        
+        Args:
+            board (List[str]): Current board state with the AI to move
+            
+        Returns:
+            List[int]: Best positions of the deepest completed iteration (every
+                empty position if not even one ply could be searched)
+        """
+        best_moves = [index + 1 for index, cell in enumerate(board) if cell == TicTacToe.EMPTY]
+        self.last_search_depth = 0
+        self._active_budget.budget = _SearchBudget(self.time_budget, self.node_budget)
+        try:
+            for depth in range(1, len(best_moves) + 1):
+                score, best_moves = self._search_root(board, depth, best_moves)
+                self.last_search_depth = depth
+                if abs(score) >= 10:
+                    break  # The result is forced; deeper search cannot change it
+        except _SearchTimeout:
+            pass
+        finally:
+            self._active_budget.budget = None
+        return best_moves
     
     def _get_reasonable_suboptimal_move(self, board: List[str], available_moves: List[int]) -> int:
         """
@@ -315,15 +819,23 @@ class AIPlayer(Player):
         """
         # Strategy: Avoid the absolute worst moves, but don't play optimally
         move_scores = []
+        board = list(board)  # Private copy, searched in place with make/unmake
+        opponent = self._get_opponent_symbol()
         
-        for position in available_moves:
-            # Simulate this move
-            simulated_board = board.copy()
-            simulated_board[position - 1] = self.symbol
-            
-            # Use limited depth for suboptimal play
-            score = self._minimax(simulated_board, 2, False)  # Only look 2 moves ahead
-            move_scores.append((position, score))
+        if self.time_budget is not None or self.node_budget is not None:
+            self._active_budget.budget = _SearchBudget(self.time_budget, self.node_budget)
+        try:
+            for position in available_moves:
+                # Use limited depth for suboptimal play
+                board[position - 1] = self.symbol
+                score = -self._negamax(board, 2, opponent)  # Only look 2 moves ahead
+                board[position - 1] = TicTacToe.EMPTY
+                move_scores.append((position, score))
+        except _SearchTimeout:
+            if not move_scores:
+                return self.rng.choice(available_moves)
+        finally:
+            self._active_budget.budget = None
         
         # Sort moves by score (best to worst)
         move_scores.sort(key=lambda x: x[1], reverse=True)
@@ -332,7 +844,7 @@ class AIPlayer(Player):
         reasonable_moves = move_scores[:max(1, len(move_scores) // 2)]
         reasonable_positions = [move[0] for move in reasonable_moves]
         
-        return random.choice(reasonable_positions)
+        return self.rng.choice(reasonable_positions)
     
     def _get_opponent_symbol(self) -> str:
         """
@@ -343,37 +855,32 @@ class AIPlayer(Player):
         """
         return TicTacToe.PLAYER_O if self.symbol == TicTacToe.PLAYER_X else TicTacToe.PLAYER_X
     
-    def _minimax(self, board: List[str], depth: int, is_maximizing: bool) -> int:
+    def _minimax(self, board: List[str], depth: float, is_maximizing: bool,
+                 alpha: float = float('-inf'), beta: float = float('inf'),
+                 last_move: Optional[int] = None, board_hash: Optional[int] = None) -> int:
         """
-        Minimax algorithm implementation for optimal Tic-Tac-Toe play.
+        Minimax score of a position from the AI's point of view.
         
-        This is the core AI decision-making algorithm that evaluates all possible
-        future game states to determine the optimal move. Uses recursive game tree
-        exploration with immediate termination on win/loss/draw conditions.
+        Thin wrapper over the negamax search core for callers that think in
+        maximizing/minimizing terms. It translates the float depth and window
+        conventions into the integer ones used by _negamax.
         
-        Algorithm Details:
-            The minimax algorithm works by:
-            1. Recursively exploring all possible future moves
-            2. Scoring terminal positions: +10 (AI win), -10 (AI loss), 0 (draw)
-            3. Maximizing player (AI) chooses highest score
-            4. Minimizing player (opponent) chooses lowest score
-            5. Propagating scores back up the game tree
-            
-        Optimization Features:
-            - Early termination on terminal states (win/loss/draw)
-            - Depth bonus: prefers faster wins and slower losses
-            - Alpha-beta pruning for performance (when enabled)
-            
-        Time Complexity: O(3^n) where n is remaining empty positions
-        Space Complexity: O(n) for recursion stack
+        Scoring: +10 (AI win), -10 (AI loss), 0 (draw). A depth-limited search
+        adds the remaining depth to wins and losses, so faster wins and slower
+        losses score higher.
         
         Args:
-            board (List[str]): Current board state (9 elements)
-            depth (int): Remaining search depth (can be infinite for perfect play)
+            board (List[str]): Current board state (board_size * board_size elements)
+            depth (float): Remaining search depth, or float('inf') for perfect play
             is_maximizing (bool): True if AI's turn (maximizing), False if opponent's turn (minimizing)
+            alpha (float): Score the maximizing player is already guaranteed elsewhere
+            beta (float): Score the minimizing player is already guaranteed elsewhere
+            last_move (Optional[int]): Board index of the move that led here, if known
+            board_hash (Optional[int]): Zobrist hash of the board on larger boards
 
         Returns:
-            int: Score for this position (-10 to +10, with depth bonuses)
+            int: Score for this position (-10 to +10, with depth bonuses). When the
+                result is <= alpha or >= beta it is only a bound on the true score.
             
         Example:
             For a position where AI can win in 2 moves:
@@ -381,104 +888,342 @@ class AIPlayer(Player):
             - Finds that all paths lead to AI victory
             - Returns positive score indicating good position
         """
+        depth = UNLIMITED_DEPTH if depth == float('inf') else int(depth)
+        alpha = max(-SCORE_BOUND, min(SCORE_BOUND, alpha))
+        beta = max(-SCORE_BOUND, min(SCORE_BOUND, beta))
+        if is_maximizing:
+            return self._negamax(board, depth, self.symbol, int(alpha), int(beta), last_move, board_hash)
+        return -self._negamax(board, depth, self._get_opponent_symbol(), int(-beta), int(-alpha),
+                              last_move, board_hash)
+    
+    def _negamax(self, board: List[str], depth: int, side: str,
+                 alpha: int = -SCORE_BOUND, beta: int = SCORE_BOUND,
+                 last_move: Optional[int] = None, board_hash: Optional[int] = None) -> int:
+        """
+        Negamax search: the score of a position for the side to move.
+        
+        A position's score is the highest of its children's scores negated, so one
+        code path serves both players. Scores, bounds and depths are all plain
+        integers.
+        
+        Optimization Features:
+            - Early termination on terminal states (win/loss/draw)
+            - Depth bonus: in depth-limited searches, faster wins and slower losses
+              score higher
+            - Fail-soft alpha-beta pruning (when use_alpha_beta is enabled): a node
+              stops expanding children once its score reaches beta, and returns the
+              best score seen so far, which may lie outside the (alpha, beta) window
+            - Transposition table: results are cached by symmetry-canonical position,
+              side to move and remaining depth, so positions reached through
+              different move orders, rotations or reflections (or on a later move or
+              game) are only searched once
+            - Move ordering: the best move stored for the position (at any depth)
+              and killer moves are tried first, so cutoffs come early
+            - Endgame tablebase: positions with few empty cells are scored with a
+              lookup when a tablebase is configured
+            - Budget checks: inside a budgeted search every node is charged to the
+              move's time/node budget, and the search unwinds once it runs out
+            - Larger boards: only the lines through the last move are checked for a
+              win, and positions are keyed by an incrementally updated Zobrist hash
+            
+        Time Complexity: O(3^n) where n is remaining empty positions
+        Space Complexity: O(n) for recursion stack
+        
+        Args:
+            board (List[str]): Current board state, searched in place
+            depth (int): Remaining plies, or UNLIMITED_DEPTH to search to the end
+            side (str): Symbol of the player to move
+            alpha (int): Score the side to move is already guaranteed elsewhere
+            beta (int): Score the opponent lets the side to move reach at most
+            last_move (Optional[int]): Board index of the move that led here, if known
+            board_hash (Optional[int]): Zobrist hash of the board on larger boards
+            
+        Returns:
+            int: Score for the side to move. When the result is <= alpha or >= beta
+                it is only a bound on the true score.
+        """
+        self.nodes_searched += 1
+        budget = self._active_budget.budget
+        if budget is not None:
+            budget.charge()
+        
         # Check terminal conditions first (early termination optimization)
-        winner = self._check_winner(board)
-        if winner == self.symbol:
-            return 10 + (depth if depth != float('inf') else 0)  # Prefer faster wins
-        elif winner == self._get_opponent_symbol():
-            return -10 - (depth if depth != float('inf') else 0)  # Prefer slower losses
-        elif self._is_board_full(board):
+        if last_move is None:
+            winner = self._winner(board)
+        else:
+            winner = self._winner_through(board, last_move)
+        if winner is not None:
+            score = 10 + (depth if depth > 0 else 0)  # Prefer faster wins and slower losses
+            return score if winner == side else -score
+        elif board_is_full(board):
             return 0  # Draw
         
+        # Solved endgame: score a tablebase win like a win found at the search horizon,
+        # so wins the search proves sooner still score higher
+        tablebase = self.tablebase
+        if tablebase is not None and board.count(TicTacToe.EMPTY) <= tablebase.max_empties:
+            value = tablebase.probe(board, side)
+            if value is not None:
+                return 10 * value
+        
         # If we've reached depth limit (for suboptimal play), return heuristic evaluation
-        if depth <= 0:
-            return self._evaluate_position(board)
-        
-        if is_maximizing:  # AI's turn
-            max_eval = float('-inf')
-            for position in range(9):
-                if board[position] == TicTacToe.EMPTY:
-                    # Simulate AI move
-                    new_board = board.copy()
-                    new_board[position] = self.symbol
-                    eval_score = self._minimax(new_board, depth - 1, False)
-                    max_eval = max(max_eval, eval_score)
-            return max_eval
-        else:  # Opponent's turn
-            min_eval = float('inf')
-            for position in range(9):
-                if board[position] == TicTacToe.EMPTY:
-                    # Simulate opponent move
-                    new_board = board.copy()
-                    new_board[position] = self._get_opponent_symbol()
-                    eval_score = self._minimax(new_board, depth - 1, True)
-                    min_eval = min(min_eval, eval_score)
-            return min_eval
-    
-    def _check_winner(self, board: List[str]) -> str:
-        """
-        Check if there's a winner on the board (optimized reusable instance).
+        if depth == 0:
+            score = self._evaluate_position(board)
+            return score if side == self.symbol else -score
+        
+        table = self.transposition_table
+        if table is not None:
+            key, transform = self._table_slot(board, side, board_hash)
+            entry = table.get(key)
+            table_move = None
+            if entry is not None:
+                if entry.depth == depth and (
+                        entry.bound is Bound.EXACT or
+                        (entry.bound is Bound.LOWER and entry.score >= beta) or
+                        (entry.bound is Bound.UPPER and entry.score <= alpha)):
+                    return entry.score
+                table_move = entry.best_move
+                if table_move is not None and transform is not None:
+                    table_move = SYMMETRIES[transform][table_move]  # Canonical to board index
+            score, best_move = self._search_children(board, depth, side, alpha, beta,
+                                                     board_hash, table_move)
+            if self.use_alpha_beta and score <= alpha:
+                bound = Bound.UPPER
+            elif self.use_alpha_beta and score >= beta:
+                bound = Bound.LOWER
+            else:
+                bound = Bound.EXACT
+            if bound is Bound.UPPER:
+                # Every move failed low, so none of them is known to be best;
+                # keep whichever move an earlier search found
+                best_move = entry.best_move if entry is not None else None
+            elif best_move is not None and transform is not None:
+                best_move = INVERSE_SYMMETRIES[transform][best_move]  # Board to canonical index
+            table.store(key, score, depth, bound, best_move)
+            return score
+        
+        return self._search_children(board, depth, side, alpha, beta, board_hash)[0]
     
+    def _search_children(self, board: List[str], depth: int, side: str,
+                         alpha: int, beta: int, board_hash: Optional[int] = None,
+                         table_move: Optional[int] = None) -> Tuple[int, Optional[int]]:
+        """
+        Expand every empty position of a non-terminal node and combine the child scores.
+        
+        Children are visited by writing the move into ``board``, searching, and
+        clearing the cell again, so no list is allocated per node and the board
+        is back in its original state when this returns.
+        
         Args:
-            board (List[str]): Board state to check
+            board (List[str]): Current board state
+            depth (int): Remaining search depth, or UNLIMITED_DEPTH
+            side (str): Symbol of the player to move
+            alpha (int): Lower bound of the search window
+            beta (int): Upper bound of the search window
+            board_hash (Optional[int]): Zobrist hash of the board on larger boards
+            table_move (Optional[int]): Best move stored for this position in the
+                transposition table (board index), tried first with dynamic ordering
+            
+        Returns:
+            Tuple[int, Optional[int]]: Fail-soft negamax score of the node and the
+                board index of the move that produced it
+        """
+        keys = self._zobrist
+        child_hash = None
+        child_depth = self._child_depth(depth)
+        opponent = TicTacToe.PLAYER_O if side == TicTacToe.PLAYER_X else TicTacToe.PLAYER_X
+        prune = self.use_alpha_beta
+        best_score = -SCORE_BOUND
+        best_move = None
+        for position in self._ordered_moves(board, side, table_move):
+            # Make the move, search it, then unmake it
+            board[position] = side
+            if board_hash is not None:
+                child_hash = board_hash ^ keys[position][side]
+            score = -self._negamax(board, child_depth, opponent, -beta, -alpha, position, child_hash)
+            board[position] = TicTacToe.EMPTY
+            if score > best_score:
+                best_score, best_move = score, position
+                if prune and score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        self._record_cutoff(board, side, position)
+                        break  # Cutoff: the opponent will avoid this line
+        return best_score, best_move
     
+    @staticmethod
+    def _child_depth(depth: int) -> int:
+        """Remaining depth one ply further down (UNLIMITED_DEPTH stays unlimited)."""
+        return depth - 1 if depth > 0 else depth
+    
+    def _move_order(self) -> Sequence[int]:
+        """Board indices in the configured static order (index order for MoveOrdering.INDEX)."""
+        if self.move_ordering is MoveOrdering.INDEX:
+            return range(self.cell_count)
+        return self._static_order
+    
+    def _ordered_moves(self, board: List[str], symbol: str,
+                       table_move: Optional[int] = None) -> List[int]:
+        """
+        List the empty cells of a position in the order the search should try them.
+        
+        Args:
+            board (List[str]): Current board state
+            symbol (str): Player to move
+            table_move (Optional[int]): Best move stored in the transposition table
+            
         Returns:
-            str or None: 'X', 'O' if there's a winner, None otherwise
+            List[int]: Board indices of every empty cell
         """
-        # Temporarily set the board for analysis
-        original_board = self._game_analyzer.board
-        self._game_analyzer.board = board
+        moves = [index for index in self._move_order() if board[index] == TicTacToe.EMPTY]
+        if self.move_ordering in (MoveOrdering.INDEX, MoveOrdering.STATIC):
+            return moves
         
-        try:
-            result = self._game_analyzer.check_winner()
-            return result
-        finally:
-            # Always restore the original board state
-            self._game_analyzer.board = original_board
+        if self.move_ordering is MoveOrdering.HISTORY:
+            # Within each group of cells on the same number of lines, highest history
+            # score first; the sort is stable, so remaining ties keep the static order
+            history = self._heuristics.history[symbol]
+            line_counts = self._line_counts
+            moves.sort(key=lambda move: (-line_counts[move], -history[move]))
+        first = []
+        for move in (table_move, *self._heuristics.killers[len(moves)]):
+            if move is not None and board[move] == TicTacToe.EMPTY and move not in first:
+                first.append(move)
+        if first:
+            moves = first + [move for move in moves if move not in first]
+        return moves
     
-    def _is_board_full(self, board: List[str]) -> bool:
+    def _record_cutoff(self, board: List[str], symbol: str, position: int) -> None:
         """
-        Check if the board is completely full (optimized reusable instance).
+        Remember a move that caused an alpha-beta cutoff for dynamic ordering.
+        
+        Args:
+            board (List[str]): Position the move was played from
+            symbol (str): Player who made the move
+            position (int): Board index of the move
+        """
+        if self.move_ordering in (MoveOrdering.INDEX, MoveOrdering.STATIC):
+            return
+        empty_cells = board.count(TicTacToe.EMPTY)
+        killers = self._heuristics.killers[empty_cells]
+        if killers[0] != position:
+            killers[1] = killers[0]
+            killers[0] = position
+        self._heuristics.history[symbol][position] += empty_cells * empty_cells
+    
+    def _position_key(self, board: List[str], is_maximizing: bool,
+                      board_hash: Optional[int] = None) -> int:
+        """
+        Build the transposition table key for a position.
+        
+        On the 3x3 board, rotations and reflections of a board have the same
+        minimax score, so the key encodes the canonical form and all eight
+        symmetric positions share one entry. The key is a compact base-3 state
+        code (see TicTacToe.encode_state). Larger boards do not fit that code,
+        so they are keyed by their 64-bit Zobrist hash instead.
     
         Args:
-            board (List[str]): Board state to check
+            board (List[str]): Board state
+            is_maximizing (bool): Whether the AI is the side to move
+            board_hash (Optional[int]): Zobrist hash of the board if already known
     
         Returns:
-            bool: True if all positions are occupied
+            int: Key identifying the position (and its symmetry class on 3x3)
+        """
+        side_to_move = self.symbol if is_maximizing else self._get_opponent_symbol()
+        return self._table_slot(board, side_to_move, board_hash)[0]
+    
+    def _table_slot(self, board: List[str], side_to_move: str,
+                    board_hash: Optional[int] = None) -> Tuple[int, Optional[int]]:
         """
-        # Temporarily set the board for analysis
-        original_board = self._game_analyzer.board
-        self._game_analyzer.board = board
+        Build the transposition table key for a position and the symmetry it used.
         
-        try:
-            result = self._game_analyzer.is_board_full()
-            return result
-        finally:
-            # Always restore the original board state
-            self._game_analyzer.board = original_board
+        Args:
+            board (List[str]): Board state
+            side_to_move (str): Symbol of the player to move
+            board_hash (Optional[int]): Zobrist hash of the board if already known
+    
+        Returns:
+            Tuple[int, Optional[int]]: The key, and on 3x3 the index of the transform in
+                SYMMETRIES that maps the board to its canonical form (None otherwise).
+                Moves stored in the table are in canonical coordinates.
+        """
+        if self._is_classic:
+            canonical, transform = TicTacToe.canonicalize(board)
+            return TicTacToe.encode_state(canonical, side_to_move), transform
+        if board_hash is None:
+            board_hash = zobrist_hash(board)
+        return (board_hash ^ ZOBRIST_SIDE_KEY if side_to_move == TicTacToe.PLAYER_O else board_hash), None
+    
+    def _winner(self, board: List[str]) -> Optional[str]:
+        """
+        Find the winner of any board this player plays on by scanning every line.
+    
+        Args:
+            board (List[str]): Board state
+    
+        Returns:
+            str or None: 'X' or 'O' if a line is complete, None otherwise
+        """
+        if self._is_classic:
+            return board_winner(board)
+        for line in self._lines:
+            first = board[line[0]]
+            if first != TicTacToe.EMPTY and all(board[cell] == first for cell in line):
+                return first
+        return None
+    
+    def _winner_through(self, board: List[str], index: int) -> Optional[str]:
+        """
+        Check whether the mark at ``index`` completes a line.
+    
+        During search every parent node is undecided, so the last move is the
+        only one that can have produced a winner.
+    
+        Args:
+            board (List[str]): Board state
+            index (int): Board index of the last move
+    
+        Returns:
+            str or None: The last mover's symbol if it won, None otherwise
+        """
+        mover = board[index]
+        for line in self._lines_through[index]:
+            for cell in line:
+                if board[cell] != mover:
+                    break
+            else:
+                return mover
+        return None
     
     def _evaluate_position(self, board: List[str]) -> int:
         """
         Evaluate a non-terminal position when depth limit is reached.
+        
+        Scores open lines, forks and center/corner control (see PositionEvaluator).
+        The result stays within +/-9, below any proven win or loss.
     
         Args:
             board (List[str]): Board state to evaluate
     
         Returns:
-            int: Heuristic score for the position
+            int: Heuristic score for the position from the AI's point of view
         """
-        # For suboptimal play, just return neutral score
-        # This can be enhanced later with positional heuristics
-        return 0
+        return self._evaluator.evaluate(board, self.symbol)
     
-    def _simulate_thinking_delay(self) -> None:
+    def _start_thinking_delay(self) -> float:
         """
-        Simulate AI thinking time with random delay and message display.
+        Start a simulated thinking delay with a random length and display the message.
 
         Provides a more natural user experience by showing the AI is "thinking"
         before making a move. Uses status callback if provided, otherwise prints directly.
+        The move is computed while the delay runs, so callers only wait for
+        whatever is left of it (see _remaining_delay).
+
+        Returns:
+            float: time.perf_counter() value at which the delay ends
         """
-        delay = random.uniform(0.5, 2.0)
+        deadline = time.perf_counter() + self.rng.uniform(0.5, 2.0)
 
         # Use callback for status message if available, otherwise print directly
         if self.status_callback:
@@ -486,4 +1231,326 @@ class AIPlayer(Player):
         else:
             print("AI opponent is thinking...")
 
-        time.sleep(delay)
\ No newline at end of file
+        return deadline
+
+    @staticmethod
+    def _remaining_delay(deadline: float) -> float:
+        """Seconds left until a thinking delay ends (0 once it has passed)."""
+        return max(0.0, deadline - time.perf_counter())
+
+
+# AIPlayer instances kept alive inside each worker process, one per search
+# configuration, so their transposition tables carry over between tasks
+_WORKER_PLAYERS: Dict[tuple, AIPlayer] = {}
+
+
+def _score_root_move_in_worker(task: tuple) -> Tuple[Optional[int], int]:
+    """
+    Score one root move inside a worker process of the parallel search.
+
+    Args:
+        task (tuple): Player settings, board, position, depth, time budget and
+            node budget
+
+    Returns:
+        Tuple[Optional[int], int]: Score (None on timeout) and nodes searched
+    """
+    settings, board, position, depth, time_budget, node_budget = task
+    player = _WORKER_PLAYERS.get(settings)
+    if player is None:
+        symbol, use_alpha_beta, table_size, board_size, win_length, move_ordering = settings
+        player = AIPlayer(symbol, DifficultyLevel.HARD, enable_delay=False,
+                          use_alpha_beta=use_alpha_beta, transposition_table_size=table_size,
+                          use_lookup_table=False, use_opening_book=False, board_size=board_size,
+                          win_length=win_length, move_ordering=move_ordering)
+        _WORKER_PLAYERS[settings] = player
+    return player._score_root_move(board, position, depth, time_budget, node_budget)
+
+
+class _MCTSNode:
+    """
+    One node of an MCTS tree: the position reached by playing ``move``.
+
+    Statistics are kept from the point of view of ``mover``, the player who
+    made the move into this node, which is what its parent maximizes in UCT.
+    """
+    __slots__ = ('move', 'mover', 'parent', 'children', 'untried', 'visits', 'wins',
+                 'winner', 'terminal')
+
+    def __init__(self, move: Optional[int], mover: str, parent: Optional['_MCTSNode'],
+                 untried: List[int], winner: Optional[str] = None):
+        self.move = move
+        self.mover = mover
+        self.parent = parent
+        self.children: List['_MCTSNode'] = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+        self.winner = winner
+        self.terminal = winner is not None or not untried
+
+
+class MCTSPlayer(Player):
+    """
+    AI player using Monte Carlo Tree Search with UCT selection.
+
+    Each search iteration walks down the tree choosing the child with the best
+    UCB1 score, expands one untried move, finishes the game with uniformly
+    random moves and propagates the result back to the root. The move with the
+    most visits is played. Unlike minimax its cost is set by the number of
+    playouts (or a time budget), not by the size of the game tree, so it also
+    plays on boards far larger than 3x3.
+
+    Positions inside the search are two integer bitboards, so playouts never
+    copy a board list: a move is one OR, and a win check tests only the line
+    masks through the cell just played. The tree is kept between moves; when
+    the opponent's reply is a move already explored, that subtree becomes the
+    new root and its statistics are reused.
+
+    Example:
+        >>> from src.player import MCTSPlayer
+        >>>
+        >>> ai = MCTSPlayer('O', playouts=2000)
+        >>> ai.get_move(['X', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '])
+        5
+
+    Attributes:
+        playouts (Optional[int]): Search iterations per move, or None
+        time_budget (Optional[float]): Seconds of search per move, or None
+        exploration (float): UCT exploration constant
+        board_size (int): Width and height of the board
+        win_length (int): Marks in a row needed to win
+        cell_count (int): Number of positions on the board
+        last_playouts (int): Iterations run for the most recent move
+        last_reused_visits (int): Visits inherited from the previous tree for the
+            most recent move (0 when the tree was rebuilt)
+    """
+
+    def __init__(self, symbol: str, playouts: Optional[int] = 1000,
+                 time_budget: Optional[float] = None, exploration: float = math.sqrt(2),
+                 board_size: int = 3, win_length: Optional[int] = None,
+                 rng: Union[random.Random, int, None] = None):
+        """
+        Initialize an MCTS player.
+
+        Args:
+            symbol (str): Player symbol ('X' or 'O')
+            playouts (Optional[int]): Iterations per move (default: 1000). None to
+                rely on time_budget alone.
+            time_budget (Optional[float]): Seconds per move (default: None). With both
+                limits set, the search stops at whichever is reached first.
+            exploration (float): UCT exploration constant (default: sqrt(2))
+            board_size (int): Width and height of the board (default: 3)
+            win_length (Optional[int]): Marks in a row needed to win (default: board_size)
+            rng (Union[random.Random, int, None]): Random generator for playouts, or a
+                seed for a new one (default: None, a new unseeded generator)
+
+        Raises:
+            ValueError: If symbol is invalid
+            ValueError: If neither limit is set, a limit is not positive, or the
+                board geometry is invalid
+        """
+        super().__init__(symbol, rng)
+
+        if playouts is None and time_budget is None:
+            raise ValueError("MCTSPlayer needs a playout count or a time budget")
+        if playouts is not None and playouts < 1:
+            raise ValueError(f"playouts must be positive, got {playouts}")
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError(f"time_budget must be positive, got {time_budget}")
+        if win_length is None:
+            win_length = board_size
+        if board_size < 1 or not 1 <= win_length <= board_size:
+            raise ValueError(f"Invalid board geometry: size {board_size}, win length {win_length}")
+
+        self.playouts = playouts
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.board_size = board_size
+        self.win_length = win_length
+        self.cell_count = board_size * board_size
+        self.last_playouts = 0
+        self.last_reused_visits = 0
+
+        _, lines_through = board_geometry(board_size, win_length)
+        self._masks_through = tuple(
+            tuple(sum(1 << cell for cell in line) for line in lines) for lines in lines_through
+        )
+        self._root: Optional[_MCTSNode] = None
+        self._root_bits: Tuple[int, int] = (0, 0)
+
+    def get_move(self, board: List[str]) -> int:
+        """
+        Search the position and return the most visited move.
+
+        Args:
+            board (List[str]): Current board state (board_size * board_size elements)
+
+        Returns:
+            int: Position (1-9 on the standard board) to play
+
+        Raises:
+            ValueError: If board is invalid format
+            ValueError: If no valid moves are available
+        """
+        if len(board) != self.cell_count:
+            raise ValueError(f"Board must have exactly {self.cell_count} positions, got {len(board)}")
+
+        x_bits = o_bits = 0
+        for index, cell in enumerate(board):
+            if cell == TicTacToe.PLAYER_X:
+                x_bits |= 1 << index
+            elif cell == TicTacToe.PLAYER_O:
+                o_bits |= 1 << index
+        if (x_bits | o_bits) == (1 << self.cell_count) - 1:
+            raise ValueError("No valid moves available on the board")
+
+        root = self._reuse_root(x_bits, o_bits)
+        self.last_reused_visits = root.visits if root is not None else 0
+        if root is None:
+            root = _MCTSNode(None, self._opponent(self.symbol), None, self._empty_cells(x_bits | o_bits))
+
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        iterations = 0
+        while self.playouts is None or iterations < self.playouts:
+            if deadline is not None and time.perf_counter() >= deadline and iterations:
+                break
+            self._run_iteration(root, x_bits, o_bits)
+            iterations += 1
+        self.last_playouts = iterations
+
+        best = max(root.children, key=lambda child: child.visits)
+        best.parent = None  # Keep the chosen subtree for the next move
+        self._root = best
+        if self.symbol == TicTacToe.PLAYER_X:
+            self._root_bits = (x_bits | 1 << best.move, o_bits)
+        else:
+            self._root_bits = (x_bits, o_bits | 1 << best.move)
+        return best.move + 1
+
+    def _reuse_root(self, x_bits: int, o_bits: int) -> Optional[_MCTSNode]:
+        """
+        Find the subtree for the current position left over from the previous move.
+
+        Args:
+            x_bits (int): X bitboard of the current position
+            o_bits (int): O bitboard of the current position
+
+        Returns:
+            Optional[_MCTSNode]: The opponent's reply node, detached from its parent,
+                or None if the position does not follow from the stored tree
+        """
+        previous, self._root = self._root, None
+        if previous is None:
+            return None
+
+        old_x, old_o = self._root_bits
+        opponent_bits, old_opponent = ((o_bits, old_o) if self.symbol == TicTacToe.PLAYER_X
+                                       else (x_bits, old_x))
+        own_bits, old_own = ((x_bits, old_x) if self.symbol == TicTacToe.PLAYER_X
+                             else (o_bits, old_o))
+        added = opponent_bits & ~old_opponent
+        if own_bits != old_own or old_opponent & ~opponent_bits or added & (added - 1) or not added:
+            return None  # Not exactly one opponent move since our last move
+
+        reply = added.bit_length() - 1
+        for child in previous.children:
+            if child.move == reply:
+                child.parent = None
+                return child
+        return None
+
+    def _run_iteration(self, root: _MCTSNode, x_bits: int, o_bits: int) -> None:
+        """Run one selection, expansion, playout and backpropagation pass."""
+        node = root
+        log = math.log
+        sqrt = math.sqrt
+        exploration = self.exploration
+
+        # Selection: descend through fully expanded nodes by UCB1
+        while not node.terminal and not node.untried:
+            log_visits = log(node.visits)
+            node = max(node.children,
+                       key=lambda child: child.wins / child.visits +
+                       exploration * sqrt(log_visits / child.visits))
+            if node.mover == TicTacToe.PLAYER_X:
+                x_bits |= 1 << node.move
+            else:
+                o_bits |= 1 << node.move
+
+        # Expansion: add one untried move
+        if not node.terminal:
+            cell = node.untried.pop()
+            mover = self._opponent(node.mover)
+            if mover == TicTacToe.PLAYER_X:
+                x_bits |= 1 << cell
+                own_bits = x_bits
+            else:
+                o_bits |= 1 << cell
+                own_bits = o_bits
+            winner = mover if self._completes_line(own_bits, cell) else None
+            child = _MCTSNode(cell, mover, node, self._empty_cells(x_bits | o_bits), winner)
+            node.children.append(child)
+            node = child
+
+        # Simulation: play the game out at random unless it is already over
+        if node.terminal:
+            result = node.winner
+        else:
+            result = self._rollout(x_bits, o_bits, self._opponent(node.mover))
+
+        # Backpropagation: a win counts 1, a draw 0.5 for the player who moved
+        while node is not None:
+            node.visits += 1
+            if result is None:
+                node.wins += 0.5
+            elif result == node.mover:
+                node.wins += 1
+            node = node.parent
+
+    def _rollout(self, x_bits: int, o_bits: int, mover: str) -> Optional[str]:
+        """
+        Finish a game with uniformly random moves on the bitboards.
+
+        Playing the empty cells in a random order is the same as choosing a
+        uniformly random empty cell on every turn.
+
+        Args:
+            x_bits (int): X bitboard
+            o_bits (int): O bitboard
+            mover (str): Player to move
+
+        Returns:
+            Optional[str]: The winner, or None for a draw
+        """
+        cells = self._empty_cells(x_bits | o_bits)
+        masks_through = self._masks_through
+        x_to_move = mover == TicTacToe.PLAYER_X
+        for cell in cells:
+            bit = 1 << cell
+            if x_to_move:
+                x_bits |= bit
+                own_bits = x_bits
+            else:
+                o_bits |= bit
+                own_bits = o_bits
+            for mask in masks_through[cell]:
+                if own_bits & mask == mask:
+                    return TicTacToe.PLAYER_X if x_to_move else TicTacToe.PLAYER_O
+            x_to_move = not x_to_move
+        return None
+
+    def _completes_line(self, own_bits: int, cell: int) -> bool:
+        """Check whether the mark at ``cell`` completes one of the mover's lines."""
+        return any(own_bits & mask == mask for mask in self._masks_through[cell])
+
+    def _empty_cells(self, occupied: int) -> List[int]:
+        """List the empty cells of a position in random order."""
+        cells = [cell for cell in range(self.cell_count) if not occupied >> cell & 1]
+        self.rng.shuffle(cells)
+        return cells
+
+    @staticmethod
+    def _opponent(symbol: str) -> str:
+        """Return the other player's symbol."""
+        return TicTacToe.PLAYER_O if symbol == TicTacToe.PLAYER_X else TicTacToe.PLAYER_X
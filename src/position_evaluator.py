@@ -0,0 +1,209 @@
+"""
+Heuristic evaluation of unfinished positions for depth-limited search.
+
+When a search stops before the end of the game it needs a score for the
+position it stopped at. The evaluator combines three signals, all read from
+the precomputed win-line tables of the board configuration:
+
+    - Open lines: every line still free of the opponent's marks counts one
+      point per mark the player has in it, plus a bonus once it is one mark
+      short of a win (a threat).
+    - Forks: a player to move with a threat wins on the next move, and a
+      player facing two or more threats on different cells cannot block them
+      all. Both are scored just below a real win.
+    - Center and corner control: each mark also counts the number of lines
+      through its cell beyond the least-connected cell, so the center and
+      corners of the 3x3 board are worth more than edges.
+
+Scores are integers from the point of view of the requested player and never
+reach the +/-10 of a finished game, so search never mistakes a heuristic for
+a proven result. On the 3x3 board every score is precomputed once into a
+3^9-entry table indexed by TicTacToe.encode_board, so evaluating a position,
+or a whole batch of them, is an encoding and a lookup.
+"""
+import threading
+from array import array
+from typing import Iterable, List, Optional, Sequence
+
+from src.tic_tac_toe import TicTacToe, BOARD_CODE_COUNT
+from src.generalized_tic_tac_toe import board_geometry
+
+# Side to move can complete a line on its next move
+WIN_NEXT_MOVE = 9
+# Side to move faces threats on two or more cells and can only block one
+LOST_TO_FORK = 8
+# Limit for scores built from open lines and cell control
+POSITIONAL_LIMIT = 7
+# Extra points for a line that is one mark short of a win
+THREAT_BONUS = 2
+
+_classic_table: Optional[array] = None
+_classic_table_lock = threading.Lock()
+
+
+class PositionEvaluator:
+    """
+    Static evaluator for positions on an N x N board where k in a row wins.
+
+    Example:
+        >>> evaluator = PositionEvaluator()
+        >>> evaluator.evaluate(['X', 'X', ' ', 'O', 'O', ' ', ' ', ' ', ' '], 'O')
+        -9
+        >>> evaluator.evaluate([' ', ' ', ' ', ' ', 'X', ' ', ' ', ' ', ' '], 'X')
+        6
+
+    Attributes:
+        size (int): Width and height of the board
+        win_length (int): Marks in a row needed to win
+        cell_count (int): Number of positions on the board
+    """
+
+    def __init__(self, size: int = 3, win_length: Optional[int] = None):
+        """
+        Prepare the line and cell weight tables for a board configuration.
+
+        Args:
+            size (int): Width and height of the board (default: 3)
+            win_length (Optional[int]): Marks in a row needed to win (default: size)
+
+        Raises:
+            ValueError: If the board geometry is invalid
+        """
+        if win_length is None:
+            win_length = size
+        if size < 1 or not 1 <= win_length <= size:
+            raise ValueError(f"Invalid board geometry: size {size}, win length {win_length}")
+
+        self.size = size
+        self.win_length = win_length
+        self.cell_count = size * size
+        self._lines, lines_through = board_geometry(size, win_length)
+        line_counts = [len(lines) for lines in lines_through]
+        fewest = min(line_counts)
+        self._cell_weights = tuple(count - fewest for count in line_counts)
+        # Large boards have many lines through each cell; scale raw scores down
+        # so the positional range is not saturated after a few moves
+        self._scale = max(1, (max(line_counts) - 1) // 2)
+        self._is_classic = size == 3 and win_length == 3
+
+    def evaluate(self, board: Sequence[str], symbol: str) -> int:
+        """
+        Score an unfinished position for one player.
+
+        The side to move is inferred from the number of marks (X moves first).
+
+        Args:
+            board (Sequence[str]): Board cells (size * size elements)
+            symbol (str): Player the score is for ('X' or 'O')
+
+        Returns:
+            int: Score from -9 to 9, positive when ``symbol`` stands better
+        """
+        if self._is_classic:
+            score = _classic_scores()[TicTacToe.encode_board(board)]
+        else:
+            score = self._score_for_x(board)
+        return score if symbol == TicTacToe.PLAYER_X else -score
+
+    def evaluate_many(self, boards: Iterable[Sequence[str]], symbol: str) -> List[int]:
+        """
+        Score many positions for one player at once.
+
+        On the 3x3 board this encodes every board and gathers the scores from
+        the precomputed table in bulk.
+
+        Args:
+            boards (Iterable[Sequence[str]]): Positions to score
+            symbol (str): Player the scores are for ('X' or 'O')
+
+        Returns:
+            List[int]: One score per board, in order
+        """
+        if self._is_classic:
+            scores = map(_classic_scores().__getitem__, map(TicTacToe.encode_board, boards))
+        else:
+            scores = map(self._score_for_x, boards)
+        if symbol == TicTacToe.PLAYER_X:
+            return list(scores)
+        return [-score for score in scores]
+
+    def _score_for_x(self, board: Sequence[str]) -> int:
+        """
+        Compute the heuristic score of a position from X's point of view.
+
+        Args:
+            board (Sequence[str]): Board cells (size * size elements)
+
+        Returns:
+            int: Score from -9 to 9
+        """
+        x_symbol, o_symbol = TicTacToe.PLAYER_X, TicTacToe.PLAYER_O
+        threat_size = self.win_length - 1
+        x_threats = set()
+        o_threats = set()
+        raw = 0
+        for line in self._lines:
+            x_marks = o_marks = 0
+            gap = None
+            for cell in line:
+                value = board[cell]
+                if value == x_symbol:
+                    x_marks += 1
+                elif value == o_symbol:
+                    o_marks += 1
+                else:
+                    gap = cell
+            if not o_marks and x_marks:
+                raw += x_marks
+                if x_marks == threat_size:
+                    raw += THREAT_BONUS
+                    x_threats.add(gap)
+            elif not x_marks and o_marks:
+                raw -= o_marks
+                if o_marks == threat_size:
+                    raw -= THREAT_BONUS
+                    o_threats.add(gap)
+
+        weights = self._cell_weights
+        x_count = o_count = 0
+        for cell, value in enumerate(board):
+            if value == x_symbol:
+                x_count += 1
+                raw += weights[cell]
+            elif value == o_symbol:
+                o_count += 1
+                raw -= weights[cell]
+
+        if x_count == o_count:  # X to move
+            if x_threats:
+                return WIN_NEXT_MOVE
+            if len(o_threats) >= 2:
+                return -LOST_TO_FORK
+        else:  # O to move
+            if o_threats:
+                return -WIN_NEXT_MOVE
+            if len(x_threats) >= 2:
+                return LOST_TO_FORK
+
+        scaled = abs(raw) // self._scale
+        return max(-POSITIONAL_LIMIT, min(POSITIONAL_LIMIT, scaled if raw >= 0 else -scaled))
+
+
+def _classic_scores() -> array:
+    """Build (once) the X-perspective score of every 3x3 board, indexed by encode_board."""
+    global _classic_table
+    if _classic_table is None:
+        with _classic_table_lock:
+            if _classic_table is None:
+                evaluator = PositionEvaluator()
+                symbols = (TicTacToe.EMPTY, TicTacToe.PLAYER_X, TicTacToe.PLAYER_O)
+                table = array('b', bytes(BOARD_CODE_COUNT))
+                board = [TicTacToe.EMPTY] * 9
+                for code in range(BOARD_CODE_COUNT):
+                    digits = code
+                    for index in range(9):
+                        board[index] = symbols[digits % 3]
+                        digits //= 3
+                    table[code] = evaluator._score_for_x(board)
+                _classic_table = table
+    return _classic_table
@@ -0,0 +1,157 @@
+import argparse
+import random
+import sys
+import time
+from typing import Callable, List, Optional
+
+from src.tic_tac_toe import TicTacToe
+from src.bitboard_tic_tac_toe import BitboardTicTacToe
+from src.player import Player, AIPlayer, DifficultyLevel
+
+
+def new_session_stats() -> dict:
+    """
+    Create an empty statistics dictionary in the same shape as GameController.session_stats.
+
+    Returns:
+        dict: Counters for games played, X wins, O wins and draws
+    """
+    return {
+        'games_played': 0,
+        'x_wins': 0,
+        'o_wins': 0,
+        'draws': 0
+    }
+
+
+def record_game_result(stats: dict, game_state: dict) -> None:
+    """
+    Add one finished game to a statistics dictionary.
+
+    Args:
+        stats (dict): Statistics in the shape returned by new_session_stats()
+        game_state (dict): Final game state with 'state' and 'winner' keys
+    """
+    stats['games_played'] += 1
+
+    if game_state['state'] == 'draw':
+        stats['draws'] += 1
+    elif game_state['state'] == 'won':
+        winner = game_state.get('winner')
+        if winner == TicTacToe.PLAYER_X:
+            stats['x_wins'] += 1
+        elif winner == TicTacToe.PLAYER_O:
+            stats['o_wins'] += 1
+
+
+def play_game(player_x: Player, player_o: Player,
+              engine_factory: Callable[[], TicTacToe] = BitboardTicTacToe) -> dict:
+    """
+    Play one game between two players without any terminal I/O.
+
+    Args:
+        player_x (Player): Player using the 'X' symbol (moves first)
+        player_o (Player): Player using the 'O' symbol
+        engine_factory (Callable[[], TicTacToe]): Creates the game engine to play on
+            (default: BitboardTicTacToe)
+
+    Returns:
+        dict: Final game state as returned by TicTacToe.get_game_state()
+
+    Raises:
+        ValueError: If a player returns an invalid move
+    """
+    game = engine_factory()
+    players = {TicTacToe.PLAYER_X: player_x, TicTacToe.PLAYER_O: player_o}
+
+    while True:
+        game_state = game.get_game_state()
+        if game_state['state'] != 'ongoing':
+            return game_state
+
+        current_player = players[game.current_player]
+        game.make_move(current_player.get_move(game.board))
+
+
+def run_self_play(player_x: Player, player_o: Player, num_games: int,
+                  engine_factory: Callable[[], TicTacToe] = BitboardTicTacToe) -> dict:
+    """
+    Play a batch of headless games between two players and aggregate the results.
+
+    Players keep their state between games, so AI transposition tables stay warm
+    across the whole batch.
+
+    Args:
+        player_x (Player): Player using the 'X' symbol (moves first in every game)
+        player_o (Player): Player using the 'O' symbol
+        num_games (int): Number of games to play
+        engine_factory (Callable[[], TicTacToe]): Creates the game engine for each game
+            (default: BitboardTicTacToe)
+
+    Returns:
+        dict: Aggregate results in the shape of GameController.session_stats
+
+    Raises:
+        ValueError: If num_games is negative, a player has the wrong symbol, or an
+            AI player still has its thinking delay enabled
+
+    Example:
+        >>> x = AIPlayer('X', DifficultyLevel.HARD, enable_delay=False)
+        >>> o = AIPlayer('O', DifficultyLevel.HARD, enable_delay=False)
+        >>> run_self_play(x, o, 100)
+        {'games_played': 100, 'x_wins': 0, 'o_wins': 0, 'draws': 100}
+    """
+    if num_games < 0:
+        raise ValueError(f"num_games must not be negative, got {num_games}")
+    if player_x.symbol != TicTacToe.PLAYER_X or player_o.symbol != TicTacToe.PLAYER_O:
+        raise ValueError("player_x must play 'X' and player_o must play 'O'")
+    for player in (player_x, player_o):
+        if getattr(player, 'enable_delay', False):
+            raise ValueError("AI players must be created with enable_delay=False for self-play")
+
+    stats = new_session_stats()
+    for _ in range(num_games):
+        record_game_result(stats, play_game(player_x, player_o, engine_factory))
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> dict:
+    """
+    Command-line entry point for headless AI-vs-AI runs.
+
+    Usage:
+        python -m src.self_play --games 1000 --x hard --o easy --seed 42
+
+    Args:
+        argv (Optional[List[str]]): Arguments to parse (default: sys.argv[1:])
+
+    Returns:
+        dict: Aggregate results of the run
+    """
+    difficulties = [level.value for level in DifficultyLevel]
+    parser = argparse.ArgumentParser(description="Run headless AI-vs-AI Tic-Tac-Toe games.")
+    parser.add_argument('--games', type=int, default=1000, help="number of games to play")
+    parser.add_argument('--x', choices=difficulties, default=DifficultyLevel.HARD.value,
+                        help="difficulty of the X player")
+    parser.add_argument('--o', choices=difficulties, default=DifficultyLevel.HARD.value,
+                        help="difficulty of the O player")
+    parser.add_argument('--seed', type=int, default=None, help="seed for reproducible runs")
+    args = parser.parse_args(argv)
+
+    # Both players draw from one seeded generator, so a seed replays the same games
+    rng = random.Random(args.seed) if args.seed is not None else None
+    player_x = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel(args.x), enable_delay=False, rng=rng)
+    player_o = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel(args.o), enable_delay=False, rng=rng)
+
+    start_time = time.perf_counter()
+    stats = run_self_play(player_x, player_o, args.games)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"[SELF-PLAY] X ({args.x}) vs O ({args.o}): {stats['games_played']} games, "
+          f"{stats['x_wins']} X wins, {stats['o_wins']} O wins, {stats['draws']} draws")
+    print(f"[SELF-PLAY] Finished in {elapsed:.2f}s")
+    return stats
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
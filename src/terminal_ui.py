@@ -1,5 +1,5 @@
-from typing import List, Optional, Callable
-from src.tic_tac_toe import TicTacToe, GameMode
+from typing import List, Optional, Callable, Union
+from src.tic_tac_toe import TicTacToe, GameMode, make_rng
 from src.player import DifficultyLevel
 import random
 
@@ -9,8 +9,22 @@ class TerminalUI:
     
     Handles all user input/output including board display, input validation,
     and error handling with retry loops.
+    
+    Attributes:
+        rng (random.Random): Random generator for the random symbol choice
     """
     
+    def __init__(self, rng: Union[random.Random, int, None] = None):
+        """
+        Initialize the terminal UI.
+        
+        Args:
+            rng (Union[random.Random, int, None]): Random generator for the random
+                symbol choice, or a seed for a new one (default: None, a new
+                unseeded generator)
+        """
+        self.rng = make_rng(rng)
+    
     def display_board(self, game: TicTacToe) -> None:
         """
         Display the game board with ASCII art formatting.
@@ -139,7 +153,7 @@ class TerminalUI:
                 elif choice == '2':
                     return TicTacToe.PLAYER_O
                 elif choice == '3':                   
-                    symbol = random.choice([TicTacToe.PLAYER_X, TicTacToe.PLAYER_O])
+                    symbol = self.rng.choice([TicTacToe.PLAYER_X, TicTacToe.PLAYER_O])
                     self.show_message(f"Random choice: You are player {symbol}")
                     return symbol
                 elif choice == '4':
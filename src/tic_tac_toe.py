@@ -1,10 +1,256 @@
-from typing import List, Optional
+import random
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from enum import Enum
 
 class GameMode(Enum):
     HUMAN_VS_HUMAN = 'human_vs_human'
     HUMAN_VS_AI = 'human_vs_ai'
 
+def _build_symmetries() -> Tuple[Tuple[int, ...], ...]:
+    """
+    Build the eight symmetries of the 3x3 board as index permutations.
+
+    Each symmetry is a tuple ``source`` such that the transformed board is
+    ``[board[source[i]] for i in range(9)]``. Index 0 is the identity,
+    1-3 are clockwise rotations by 90/180/270 degrees, and 4-7 are the same
+    rotations applied after a left-right mirror.
+    """
+    identity = tuple(range(9))
+    rotate = tuple(3 * (2 - col) + row for row in range(3) for col in range(3))
+    mirror = tuple(3 * row + (2 - col) for row in range(3) for col in range(3))
+
+    symmetries = []
+    for start in (identity, mirror):
+        current = start
+        for _ in range(4):
+            symmetries.append(current)
+            current = tuple(current[rotate[i]] for i in range(9))
+    return tuple(symmetries)
+
+def winning_lines(size: int, win_length: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    List every run of ``win_length`` cells on a ``size`` x ``size`` board.
+
+    Lines are returned as tuples of 0-based board indices, grouped as rows,
+    columns, diagonals and anti-diagonals, each scanned from the top-left.
+
+    Args:
+        size (int): Board width and height
+        win_length (int): Number of marks in a row needed to win
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: All winning lines for the configuration, each
+            listed once (with ``win_length`` 1 every cell is a single line)
+
+    Example:
+        >>> winning_lines(3, 3)[:2]
+        ((0, 1, 2), (3, 4, 5))
+    """
+    span = range(win_length)
+    starts = range(size - win_length + 1)
+    rows = [tuple(row * size + col + i for i in span) for row in range(size) for col in starts]
+    columns = [tuple((row + i) * size + col for i in span) for col in range(size) for row in starts]
+    diagonals = [tuple((row + i) * size + col + i for i in span) for row in starts for col in starts]
+    anti_diagonals = [tuple((row + i) * size + (size - 1 - col) - i for i in span)
+                      for row in starts for col in starts]
+    # A single cell is a run in every direction; keep only its first occurrence
+    return tuple(dict.fromkeys(rows + columns + diagonals + anti_diagonals))
+
+def lines_through_cells(lines: Tuple[Tuple[int, ...], ...],
+                        cell_count: int) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    Group winning lines by the cells they pass through.
+
+    Args:
+        lines (Tuple[Tuple[int, ...], ...]): Winning lines as 0-based indices
+        cell_count (int): Number of cells on the board
+
+    Returns:
+        Tuple[Tuple[Tuple[int, ...], ...], ...]: ``result[i]`` holds the lines containing index ``i``
+    """
+    return tuple(tuple(line for line in lines if index in line) for index in range(cell_count))
+
+# Rows, columns and diagonals of the standard board:
+# (0,1,2) (3,4,5) (6,7,8) / (0,3,6) (1,4,7) (2,5,8) / (0,4,8) / (2,4,6)
+WINNING_COMBINATIONS = winning_lines(3, 3)
+
+# Lines that can be completed by a move at each index (2 to 4 per cell)
+LINES_THROUGH_CELL = lines_through_cells(WINNING_COMBINATIONS, 9)
+
+# Base-3 state codes: cell i contributes digit (0 empty, 1 X, 2 O) * 3**i, and
+# the code of a state is board_code * 2 + side (0 = X to move, 1 = O to move)
+BOARD_CODE_COUNT = 3 ** 9
+STATE_CODE_COUNT = BOARD_CODE_COUNT * 2
+_CELL_DIGITS = str.maketrans({' ': '0', 'X': '1', 'O': '2'})
+_DIGIT_CELLS = str.maketrans({'0': ' ', '1': 'X', '2': 'O'})
+
+
+def _cell_digits(cells: str) -> str:
+    """
+    Translate joined cells to base-3 digits, rejecting anything but a 9-cell board.
+
+    Args:
+        cells (str): Board cells joined into one string
+
+    Returns:
+        str: One digit per cell, in board order
+
+    Raises:
+        ValueError: If there are not exactly 9 cells or a cell is not ' ', 'X' or 'O'
+    """
+    if len(cells) != 9:
+        raise ValueError(f"Board must have exactly 9 positions, got {len(cells)}")
+    digits = cells.translate(_CELL_DIGITS)
+    # Any character the table does not map survives the strip
+    if digits.strip('012'):
+        raise ValueError(f"Invalid board cells {cells!r}. Must be ' ', 'X' or 'O'.")
+    return digits
+
+# XORed into a Zobrist hash when O is the side to move
+ZOBRIST_SIDE_KEY = random.Random('zobrist-side').getrandbits(64)
+
+@lru_cache(maxsize=None)
+def zobrist_keys(cell_count: int) -> Tuple[Dict[str, int], ...]:
+    """
+    Get the 64-bit Zobrist keys for a board with ``cell_count`` cells.
+
+    Keys come from a generator seeded with the board size, so every process
+    (and every run) hashes the same position to the same value.
+
+    Args:
+        cell_count (int): Number of cells on the board
+
+    Returns:
+        Tuple[Dict[str, int], ...]: ``keys[i][symbol]`` for 'X' and 'O' at index ``i``
+    """
+    rng = random.Random(f'zobrist-{cell_count}')
+    return tuple({'X': rng.getrandbits(64), 'O': rng.getrandbits(64)} for _ in range(cell_count))
+
+def zobrist_hash(board: Sequence[str], side_to_move: Optional[str] = None) -> int:
+    """
+    Compute a Zobrist hash from scratch.
+
+    The hash is the XOR of the key of every occupied cell, plus
+    ZOBRIST_SIDE_KEY when O is to move. Engines keep the same value up to date
+    incrementally; this function is the reference for boards of any size.
+
+    Args:
+        board (Sequence[str]): Board cells
+        side_to_move (Optional[str]): 'X', 'O', or None to hash the board alone
+
+    Returns:
+        int: 64-bit hash
+    """
+    keys = zobrist_keys(len(board))
+    value = 0
+    for cell_keys, cell in zip(keys, board):
+        if cell in cell_keys:
+            value ^= cell_keys[cell]
+    if side_to_move == 'O':
+        value ^= ZOBRIST_SIDE_KEY
+    return value
+
+def board_winner(board: List[str]) -> Optional[str]:
+    """
+    Find the winner of a 3x3 board without creating a game.
+
+    Pure function of its argument, so it is safe to call from several threads
+    and costs no allocation beyond the loop itself.
+
+    Args:
+        board (List[str]): 9-element board
+
+    Returns:
+        str or None: 'X' or 'O' for the first complete line found, None otherwise
+
+    Example:
+        >>> board_winner(['X', 'X', 'X', 'O', 'O', ' ', ' ', ' ', ' '])
+        'X'
+    """
+    empty = TicTacToe.EMPTY
+    for a, b, c in WINNING_COMBINATIONS:
+        first = board[a]
+        if first != empty and first == board[b] and first == board[c]:
+            return first
+    return None
+
+def board_is_full(board: List[str]) -> bool:
+    """
+    Check whether every cell of a board is occupied.
+
+    Args:
+        board (List[str]): Board of any size
+
+    Returns:
+        bool: True if no cell is empty
+    """
+    return TicTacToe.EMPTY not in board
+
+def make_rng(rng: Union[random.Random, int, None] = None) -> random.Random:
+    """
+    Get a private random generator for one player, UI or batch run.
+
+    Args:
+        rng (Union[random.Random, int, None]): A generator to use as is, a seed
+            for a new one, or None for a new generator seeded from the OS
+
+    Returns:
+        random.Random: Generator that is not shared with the ``random`` module
+
+    Example:
+        >>> make_rng(7).random() == make_rng(7).random()
+        True
+    """
+    if rng is None or isinstance(rng, int):
+        return random.Random(rng)
+    return rng
+
+# The eight rotations/reflections of the board (see _build_symmetries)
+SYMMETRIES = _build_symmetries()
+
+# INVERSE_SYMMETRIES[t][j] is where original index j ends up after transform t
+INVERSE_SYMMETRIES = tuple(
+    tuple(source.index(index) for index in range(9)) for source in SYMMETRIES
+)
+
+class _TrackedBoard(list):
+    """
+    Board list that records modifications made outside TicTacToe.make_move.
+
+    TicTacToe keeps the game outcome up to date incrementally. Writing to the
+    board directly (``game.board[0] = 'X'``) sets ``dirty`` so the engine
+    rescans the board before answering the next query.
+    """
+    __slots__ = ('dirty',)
+
+    def __init__(self, cells=()):
+        super().__init__(cells)
+        self.dirty = True
+
+    def place(self, index: int, value: str) -> None:
+        """Write a cell without marking the board dirty."""
+        list.__setitem__(self, index, value)
+
+
+def _marks_dirty(name: str):
+    """Wrap a mutating list method so it flags the board for a rescan."""
+    method = getattr(list, name)
+
+    def mutate(self, *args):
+        self.dirty = True
+        return method(self, *args)
+
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend',
+              'insert', 'pop', 'remove', 'clear', 'sort', 'reverse'):
+    setattr(_TrackedBoard, _name, _marks_dirty(_name))
+
+
 class TicTacToe:
     """
     Core Tic-Tac-Toe game engine with board management and game logic.
@@ -46,6 +292,12 @@ class TicTacToe:
     PLAYER_X = 'X'
     PLAYER_O = 'O'
 
+    # Board geometry; GeneralizedTicTacToe overrides these per instance
+    cell_count = 9
+    lines = WINNING_COMBINATIONS
+    _lines_through = LINES_THROUGH_CELL
+    _zobrist = zobrist_keys(9)
+
     def __init__(self, mode: GameMode = GameMode.HUMAN_VS_AI):
         """
         Initialize a new Tic-Tac-Toe game instance.
@@ -64,6 +316,33 @@ class TicTacToe:
         self.mode = mode
         self.reset_board()
 
+    @property
+    def board(self) -> List[str]:
+        """
+        The board as a flat list of cells.
+
+        The list can be read and modified like any other list; direct writes
+        are detected and the cached game outcome is recomputed on the next query.
+
+        Returns:
+            List[str]: Board cells holding ' ', 'X' or 'O'
+        """
+        return self._board
+
+    @board.setter
+    def board(self, board: List[str]) -> None:
+        """
+        Replace the board with a copy of the given cells.
+
+        The move history is cleared, since it no longer describes how the
+        board was reached.
+
+        Args:
+            board (List[str]): New board state
+        """
+        self._board = _TrackedBoard(board)
+        self._clear_history()
+
     def reset_board(self):
         """
         Reset the game board to initial state and set starting player.
@@ -80,8 +359,18 @@ class TicTacToe:
             >>> game.current_player
             'X'
         """
-        self.board = [self.EMPTY] * 9
+        self._board = _TrackedBoard([self.EMPTY] * self.cell_count)
+        self._board.dirty = False
+        self._winner = None
+        self._move_count = 0
+        self._board_hash = 0
         self.current_player = self.PLAYER_X
+        self._clear_history()
+
+    def _clear_history(self) -> None:
+        """Forget every recorded move, e.g. after the board is replaced."""
+        self._history: List[int] = []
+        self._redo_stack: List[int] = []
 
     def is_valid_move(self, position: int) -> bool:
         """
@@ -93,14 +382,18 @@ class TicTacToe:
         Returns:
             bool: True if position is valid and empty, False otherwise
         """
-        if position < 1 or position > 9:
+        if position < 1 or position > self.cell_count:
             return False
         
-        return self.board[position - 1] == self.EMPTY
+        return self._board[position - 1] == self.EMPTY
 
     def make_move(self, position):
         """
         Make a move at the specified position and switch players
+
+        The game outcome is updated from the lines through the new mark only,
+        so no full-board scan is needed. The move is pushed onto the history
+        so it can be undone, and any previously undone moves are discarded.
         
         Args:
             position (int): Position on board (1-9)
@@ -116,14 +409,143 @@ class TicTacToe:
             'O'
         """
         if not self.is_valid_move(position):
-            if not (1 <= position <= 9):
-                raise ValueError(f"Invalid position {position}: must be between 1 and 9")
+            if not (1 <= position <= self.cell_count):
+                raise ValueError(f"Invalid position {position}: must be between 1 and {self.cell_count}")
             else:
-                raise ValueError(f"Position {position} is already occupied by '{self.board[position-1]}'")
+                raise ValueError(f"Position {position} is already occupied by '{self.get_display_value(position)}'")
 
-        self.board[position - 1] = self.current_player
+        self._apply_move(position - 1, self.current_player)
+        self._history.append(position)
+        self._redo_stack.clear()
         self._switch_player()
 
+    def undo_move(self) -> int:
+        """
+        Take back the most recent move and give the turn back to its player.
+
+        Returns:
+            int: Position (1-9) of the move that was undone
+
+        Raises:
+            ValueError: If there is no move to undo
+            ValueError: If the board was changed directly so that the position no
+                longer holds the mark of the player who moved there
+
+        Example:
+            >>> game = TicTacToe()
+            >>> game.make_move(5)
+            >>> game.undo_move()
+            5
+            >>> game.current_player
+            'X'
+        """
+        if not self._history:
+            raise ValueError("No moves to undo")
+
+        position = self._history[-1]
+        mover = self.PLAYER_O if self.current_player == self.PLAYER_X else self.PLAYER_X
+        if self.get_display_value(position) != mover:
+            raise ValueError(f"Cannot undo move at position {position}: it no longer holds '{mover}'")
+
+        self._history.pop()
+        self._remove_move(position - 1)
+        self._redo_stack.append(position)
+        self._switch_player()
+        return position
+
+    def redo_move(self) -> int:
+        """
+        Replay the most recently undone move.
+
+        Returns:
+            int: Position (1-9) of the move that was replayed
+
+        Raises:
+            ValueError: If there is no undone move to replay
+            ValueError: If the position has been occupied since it was undone
+        """
+        if not self._redo_stack:
+            raise ValueError("No moves to redo")
+
+        position = self._redo_stack[-1]
+        if not self.is_valid_move(position):
+            raise ValueError(f"Position {position} is already occupied by '{self.get_display_value(position)}'")
+
+        self._redo_stack.pop()
+        self._apply_move(position - 1, self.current_player)
+        self._history.append(position)
+        self._switch_player()
+        return position
+
+    def _apply_move(self, index: int, player: str) -> None:
+        """
+        Place a mark and update the cached outcome. Subclasses with a different
+        board representation override this together with _remove_move.
+
+        The winner is the player owning the first complete line in ``lines``
+        order, as in a full rescan. A first win is found from the lines through
+        the new mark. If play continues after a win and the other player also
+        completes a line, either line may come first, so the board is rescanned
+        lazily instead.
+
+        Args:
+            index (int): Board index (0-8)
+            player (str): Symbol to place
+        """
+        self._sync()
+        board = self._board
+        board.place(index, player)
+        self._move_count += 1
+        self._board_hash ^= self._zobrist[index][player]
+
+        if self._winner != player:
+            for line in self._lines_through[index]:
+                if all(board[cell] == player for cell in line):
+                    if self._winner is None:
+                        self._winner = player
+                    else:
+                        board.dirty = True
+                    break
+
+    def _remove_move(self, index: int) -> None:
+        """
+        Clear a mark placed by _apply_move.
+
+        Removing a mark cannot create a win, so without a winner only the move
+        counter changes. If the game was won the board is rescanned lazily,
+        because the removed mark may or may not have completed the line.
+
+        Args:
+            index (int): Board index (0-8)
+        """
+        self._sync()
+        self._board_hash ^= self._zobrist[index][self._board[index]]
+        self._board.place(index, self.EMPTY)
+        self._move_count -= 1
+        if self._winner is not None:
+            self._board.dirty = True
+
+    def _sync(self) -> None:
+        """
+        Recompute the cached outcome and hash if the board was modified directly.
+
+        Rescans every line in order and takes the first complete one, the same
+        rule _apply_move follows, so the cached winner always matches a full
+        check of the board. Does nothing when the board is not marked dirty.
+        """
+        board = self._board
+        if not board.dirty:
+            return
+
+        self._move_count = len(board) - board.count(self.EMPTY)
+        self._board_hash = zobrist_hash(board)
+        self._winner = None
+        for line in self.lines:
+            if self._check_line(line):
+                self._winner = board[line[0]]
+                break
+        board.dirty = False
+
     def _switch_player(self):
         """
         Switch current player from X to O or O to X.
@@ -169,20 +591,8 @@ class TicTacToe:
         Returns:
             str or None: 'X' or 'O' if there's a winner, None otherwise
         """
-        winning_combinations = [
-            # Rows
-            [0,1,2], [3,4,5],[6,7,8],
-            # Columns
-            [0,3,6], [1,4,7],[2,5,8],
-            # Diagonals
-            [0,4,8],[2,4,6]
-        ]
-
-        for combination in winning_combinations:
-            if self._check_line(combination):
-                return self.board[combination[0]]
-            
-        return None
+        self._sync()
+        return self._winner
 
     def _check_line(self, positions: List[int]) -> bool:
         """
@@ -206,7 +616,8 @@ class TicTacToe:
         Returns:
             bool: True if all positions are occupied, False otherwise
         """
-        return self.EMPTY not in self.board
+        self._sync()
+        return self._move_count == self.cell_count
     
     def is_draw(self) -> bool:
         """
@@ -221,20 +632,273 @@ class TicTacToe:
         """
         Get the current state of the game.
 
+        The outcome is maintained as moves are made, so this is O(1) unless
+        the board was modified directly since the last query.
+
         Returns:
             dict: Game state information with keys:
                 - 'state': 'ongoing', 'won', or 'draw'
                 - 'winner': 'X', 'O' or None
         """
-        winner = self.check_winner()
-        if winner:
-            return {'state': 'won', 'winner': winner}
+        self._sync()
+        if self._winner:
+            return {'state': 'won', 'winner': self._winner}
         
-        if self.is_draw():
+        if self._move_count == self.cell_count:
             return {'state':'draw', 'winner': None}
         
         return {'state': 'ongoing', 'winner': None}
 
+    @staticmethod
+    def canonicalize(board: List[str]) -> Tuple[List[str], int]:
+        """
+        Map a board to the canonical representative of its symmetry class.
+
+        The 3x3 board has eight symmetries (four rotations, each with or without
+        a reflection). Every board in the same class maps to the same canonical
+        board, so caches and tables keyed on it need about 8x fewer entries.
+
+        Args:
+            board (List[str]): 9-element board
+
+        Returns:
+            Tuple[List[str], int]: The canonical board and the index of the
+                transform in SYMMETRIES that produced it from ``board``
+
+        Raises:
+            ValueError: If the board does not have exactly 9 positions (larger
+                boards use square_symmetries in generalized_tic_tac_toe)
+
+        Example:
+            >>> canonical, transform = TicTacToe.canonicalize(
+            ...     [' ', ' ', 'X', ' ', ' ', ' ', ' ', ' ', ' '])
+            >>> canonical
+            [' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', 'X']
+            >>> TicTacToe.inverse_transform_position(9, transform)
+            3
+        """
+        if len(board) != 9:
+            raise ValueError(f"Board must have exactly 9 positions, got {len(board)}")
+        best_key = None
+        best_transform = 0
+        for transform, source in enumerate(SYMMETRIES):
+            key = ''.join([board[index] for index in source])
+            if best_key is None or key < best_key:
+                best_key = key
+                best_transform = transform
+
+        return [board[index] for index in SYMMETRIES[best_transform]], best_transform
+
+    @staticmethod
+    def canonical_key(board: List[str]) -> str:
+        """
+        Get a hashable key that is identical for all symmetric boards.
+
+        Args:
+            board (List[str]): 9-element board
+
+        Returns:
+            str: The canonical board joined into a 9-character string
+
+        Raises:
+            ValueError: If the board does not have exactly 9 positions
+        """
+        if len(board) != 9:
+            raise ValueError(f"Board must have exactly 9 positions, got {len(board)}")
+        return min(''.join([board[index] for index in source]) for source in SYMMETRIES)
+
+    @staticmethod
+    def encode_board(board: Sequence[str]) -> int:
+        """
+        Pack a board into a base-3 integer.
+
+        Position 1 is the least significant digit, with empty = 0, X = 1 and O = 2.
+
+        Args:
+            board (Sequence[str]): 9 cells, as a list or a joined string
+
+        Returns:
+            int: Board code in the range 0 to 3^9 - 1
+
+        Raises:
+            ValueError: If there are not exactly 9 cells or a cell is not ' ', 'X' or 'O'
+
+        Example:
+            >>> TicTacToe.encode_board(['O', 'X', ' ', ' ', ' ', ' ', ' ', ' ', ' '])
+            5
+        """
+        return int(_cell_digits(''.join(board))[::-1], 3)
+
+    @staticmethod
+    def encode_state(board: Sequence[str], side_to_move: Optional[str] = None) -> int:
+        """
+        Pack a board and the side to move into one integer below 3^9 * 2.
+
+        The code fits in 16 bits and can be used as a cache key, a compact wire
+        format or a row index into a table with STATE_CODE_COUNT rows.
+
+        Args:
+            board (Sequence[str]): 9 cells, as a list or a joined string
+            side_to_move (Optional[str]): 'X' or 'O'. Defaults to the side implied by
+                the number of marks (X moves when both have played equally often).
+
+        Returns:
+            int: State code in the range 0 to 3^9 * 2 - 1
+
+        Raises:
+            ValueError: If the board is not 9 valid cells, or side_to_move is not
+                'X', 'O' or None
+
+        Example:
+            >>> TicTacToe.encode_state(['X'] + [' '] * 8, 'O')
+            3
+        """
+        cells = ''.join(board)
+        digits = _cell_digits(cells)
+        if side_to_move is None:
+            side = (9 - cells.count(TicTacToe.EMPTY)) & 1
+        elif side_to_move in (TicTacToe.PLAYER_X, TicTacToe.PLAYER_O):
+            side = side_to_move == TicTacToe.PLAYER_O
+        else:
+            raise ValueError(f"Invalid player symbol '{side_to_move}'. Must be 'X' or 'O'.")
+        return int(digits[::-1], 3) * 2 + side
+
+    @staticmethod
+    def encode_states(boards: Iterable[Sequence[str]],
+                      sides_to_move: Optional[Iterable[str]] = None) -> array:
+        """
+        Encode many states at once into a compact unsigned 16-bit array.
+
+        All boards are joined and translated to digits in one pass, leaving a
+        single int() call per board. Each state then takes 2 bytes instead of a
+        list holding 9 string references.
+
+        Args:
+            boards (Iterable[Sequence[str]]): Boards to encode
+            sides_to_move (Optional[Iterable[str]]): Side to move for each board.
+                Defaults to the side implied by the number of marks on each board.
+
+        Returns:
+            array: array('H') of state codes, in the order of ``boards``
+
+        Raises:
+            ValueError: If a board is not 9 valid cells, a side to move is not
+                'X' or 'O', or the number of sides does not match the boards
+        """
+        boards = [''.join(board) for board in boards]
+        for cells in boards:
+            if len(cells) != 9:
+                raise ValueError(f"Board must have exactly 9 positions, got {len(cells)}")
+        joined = ''.join(boards)
+
+        # Reversing the whole batch reverses every board's digits (position 1
+        # becomes least significant) and the order of boards, undone below
+        digits = joined[::-1].translate(_CELL_DIGITS)
+        if digits.strip('012'):
+            raise ValueError("Invalid board cells. Must be ' ', 'X' or 'O'.")
+        board_codes = [int(digits[start:start + 9], 3) for start in range(0, len(digits), 9)]
+        board_codes.reverse()
+
+        if sides_to_move is None:
+            sides = [(9 - joined.count(TicTacToe.EMPTY, start, start + 9)) & 1
+                     for start in range(0, len(joined), 9)]
+        else:
+            sides = []
+            for side in sides_to_move:
+                if side not in (TicTacToe.PLAYER_X, TicTacToe.PLAYER_O):
+                    raise ValueError(f"Invalid player symbol '{side}'. Must be 'X' or 'O'.")
+                sides.append(side == TicTacToe.PLAYER_O)
+            if len(sides) != len(board_codes):
+                raise ValueError(f"Expected {len(board_codes)} sides to move, got {len(sides)}")
+
+        return array('H', [code * 2 + side for code, side in zip(board_codes, sides)])
+
+    @staticmethod
+    def decode_state(code: int) -> Tuple[List[str], str]:
+        """
+        Unpack a state code produced by encode_state.
+
+        Args:
+            code (int): State code in the range 0 to 3^9 * 2 - 1
+
+        Returns:
+            Tuple[List[str], str]: The 9-element board and the side to move
+
+        Raises:
+            ValueError: If code is out of range
+
+        Example:
+            >>> TicTacToe.decode_state(3)
+            (['X', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '], 'O')
+        """
+        if not 0 <= code < STATE_CODE_COUNT:
+            raise ValueError(f"State code must be between 0 and {STATE_CODE_COUNT - 1}, got {code}")
+
+        board_code, side = divmod(code, 2)
+        digits = []
+        for _ in range(9):
+            board_code, digit = divmod(board_code, 3)
+            digits.append(str(digit))
+        board = list(''.join(digits).translate(_DIGIT_CELLS))
+        return board, TicTacToe.PLAYER_O if side else TicTacToe.PLAYER_X
+
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        64-bit Zobrist hash of the board and side to move.
+
+        The board part is updated with one XOR per make_move, undo_move and
+        redo_move, so reading the hash is O(1) on any board size. It equals
+        ``zobrist_hash(board, current_player)`` at all times.
+
+        Returns:
+            int: Hash suitable as a transposition table key
+        """
+        self._sync()
+        if self.current_player == self.PLAYER_O:
+            return self._board_hash ^ ZOBRIST_SIDE_KEY
+        return self._board_hash
+
+    def get_state_code(self) -> int:
+        """
+        Encode the current board and player to move.
+
+        Returns:
+            int: State code as produced by encode_state
+        """
+        return self.encode_state(self.board, self.current_player)
+
+    @staticmethod
+    def transform_position(position: int, transform: int) -> int:
+        """
+        Map a position on the original board to the transformed board.
+
+        Args:
+            position (int): Position on the original board (1-9)
+            transform (int): Index into SYMMETRIES, as returned by canonicalize
+
+        Returns:
+            int: The same square's position (1-9) on the transformed board
+        """
+        return INVERSE_SYMMETRIES[transform][position - 1] + 1
+
+    @staticmethod
+    def inverse_transform_position(position: int, transform: int) -> int:
+        """
+        Map a position on the transformed board back to the original board.
+
+        Use this to translate a move found for the canonical board into a move
+        on the board the player is actually looking at.
+
+        Args:
+            position (int): Position on the transformed board (1-9)
+            transform (int): Index into SYMMETRIES, as returned by canonicalize
+
+        Returns:
+            int: The same square's position (1-9) on the original board
+        """
+        return SYMMETRIES[transform][position - 1] + 1
+
     def get_game_mode(self) -> GameMode:
         """
         Get the current game mode.
@@ -274,13 +938,7 @@ class TicTacToe:
         """
         if player_symbol not in [self.PLAYER_X, self.PLAYER_O]:
             raise ValueError(f"Invalid player symbol '{player_symbol}'. Must be 'X' or 'O'.")
-        winning_combinations = [
-            [0,1,2], [3,4,5], [6,7,8],  # Rows
-            [0,3,6], [1,4,7], [2,5,8],  # Columns
-            [0,4,8], [2,4,6]           # Diagonals
-        ]
-
-        for combo in winning_combinations:
+        for combo in WINNING_COMBINATIONS:
             player_count = 0
             empty_count = 0
             empty_position = None
@@ -0,0 +1,176 @@
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.tic_tac_toe import TicTacToe
+from src.player import AIPlayer, DifficultyLevel
+from src.self_play import new_session_stats, run_self_play
+
+Pairing = Tuple[DifficultyLevel, DifficultyLevel]
+
+
+def round_robin_pairings(difficulties: Sequence[DifficultyLevel] = tuple(DifficultyLevel)) -> List[Pairing]:
+    """
+    Build every (X difficulty, O difficulty) matchup, including mirror matches.
+
+    Each pair of difficulties meets twice, once with each side moving first,
+    because going first is a large advantage in Tic-Tac-Toe.
+
+    Args:
+        difficulties (Sequence[DifficultyLevel]): Difficulty levels taking part
+
+    Returns:
+        List[Pairing]: Ordered (x_difficulty, o_difficulty) pairs
+    """
+    return [(x_level, o_level) for x_level in difficulties for o_level in difficulties]
+
+
+def merge_stats(results: Iterable[dict]) -> dict:
+    """
+    Combine statistics from several batches into one total.
+
+    Args:
+        results (Iterable[dict]): Statistics in the shape of GameController.session_stats
+
+    Returns:
+        dict: Sum of every counter
+    """
+    total = new_session_stats()
+    for stats in results:
+        for key in total:
+            total[key] += stats[key]
+    return total
+
+
+def batch_seed(seed: int, pairing_index: int, batch_index: int) -> int:
+    """
+    Derive the RNG seed for one batch from the tournament seed.
+
+    Seeds depend only on the batch's position in the schedule, never on which
+    worker runs it, so a tournament replays identically for any worker count.
+
+    Args:
+        seed (int): Tournament seed
+        pairing_index (int): Index of the matchup in the pairing list
+        batch_index (int): Index of the batch within the matchup
+
+    Returns:
+        int: 64-bit seed for the batch
+    """
+    return random.Random(f"{seed}:{pairing_index}:{batch_index}").getrandbits(64)
+
+
+def _play_batch(task: Tuple[str, str, int, int]) -> dict:
+    """
+    Play one batch of games inside a worker process.
+
+    Args:
+        task (Tuple[str, str, int, int]): X difficulty value, O difficulty value,
+            number of games and RNG seed
+
+    Returns:
+        dict: Statistics for the batch
+    """
+    x_value, o_value, num_games, seed = task
+    rng = random.Random(seed)
+
+    player_x = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel(x_value), enable_delay=False, rng=rng)
+    player_o = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel(o_value), enable_delay=False, rng=rng)
+    return run_self_play(player_x, player_o, num_games)
+
+
+def run_tournament(games_per_pairing: int,
+                   difficulties: Sequence[DifficultyLevel] = tuple(DifficultyLevel),
+                   workers: Optional[int] = None, batch_size: int = 500,
+                   seed: int = 0) -> Dict[Pairing, dict]:
+    """
+    Run a round-robin between AI difficulty levels across a pool of processes.
+
+    Each matchup is split into batches of at most ``batch_size`` games. Batches
+    are spread over a ProcessPoolExecutor, the players of each batch draw from a
+    generator seeded with the batch seed, and the per-batch results are merged per matchup.
+
+    Args:
+        games_per_pairing (int): Games to play for every (X, O) matchup
+        difficulties (Sequence[DifficultyLevel]): Difficulty levels taking part
+        workers (Optional[int]): Worker processes (default: one per CPU). Use 1 to
+            play every batch in the current process.
+        batch_size (int): Maximum games per task sent to a worker (default: 500)
+        seed (int): Tournament seed; the same seed replays the same games
+
+    Returns:
+        Dict[Pairing, dict]: Merged statistics for each (x_difficulty, o_difficulty)
+
+    Raises:
+        ValueError: If games_per_pairing is negative or batch_size is not positive
+
+    Example:
+        >>> results = run_tournament(1000, workers=8, seed=42)
+        >>> results[(DifficultyLevel.HARD, DifficultyLevel.EASY)]['o_wins']
+        0
+    """
+    if games_per_pairing < 0:
+        raise ValueError(f"games_per_pairing must not be negative, got {games_per_pairing}")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    pairings = round_robin_pairings(difficulties)
+    tasks = []
+    owners = []
+    for pairing_index, (x_level, o_level) in enumerate(pairings):
+        for batch_index, start in enumerate(range(0, games_per_pairing, batch_size)):
+            num_games = min(batch_size, games_per_pairing - start)
+            tasks.append((x_level.value, o_level.value, num_games,
+                          batch_seed(seed, pairing_index, batch_index)))
+            owners.append(pairing_index)
+
+    if workers == 1:
+        batch_results = [_play_batch(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batch_results = list(executor.map(_play_batch, tasks))
+
+    grouped: List[List[dict]] = [[] for _ in pairings]
+    for pairing_index, stats in zip(owners, batch_results):
+        grouped[pairing_index].append(stats)
+
+    return {pairing: merge_stats(results) for pairing, results in zip(pairings, grouped)}
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[Pairing, dict]:
+    """
+    Command-line entry point for difficulty round-robins.
+
+    Usage:
+        python -m src.tournament --games 10000 --workers 32 --seed 7
+
+    Args:
+        argv (Optional[List[str]]): Arguments to parse (default: sys.argv[1:])
+
+    Returns:
+        Dict[Pairing, dict]: Merged statistics for each matchup
+    """
+    parser = argparse.ArgumentParser(description="Run an AI difficulty round-robin tournament.")
+    parser.add_argument('--games', type=int, default=1000, help="games per matchup")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--batch-size', type=int, default=500, help="games per worker task")
+    parser.add_argument('--seed', type=int, default=0, help="tournament seed")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    results = run_tournament(args.games, workers=args.workers,
+                             batch_size=args.batch_size, seed=args.seed)
+    elapsed = time.perf_counter() - start_time
+
+    for (x_level, o_level), stats in results.items():
+        print(f"[TOURNAMENT] X {x_level.value:<6} vs O {o_level.value:<6}: "
+              f"{stats['x_wins']} X wins, {stats['o_wins']} O wins, {stats['draws']} draws")
+    print(f"[TOURNAMENT] {len(results)} matchups finished in {elapsed:.2f}s")
+    return results
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
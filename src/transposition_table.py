@@ -0,0 +1,117 @@
+import threading
+from collections import OrderedDict
+from enum import Enum
+from typing import Hashable, NamedTuple, Optional
+
+
+class Bound(Enum):
+    """How a stored score relates to the true minimax value of a position"""
+    EXACT = "exact"  # Score is the true value
+    LOWER = "lower"  # True value is at least the score (search failed high)
+    UPPER = "upper"  # True value is at most the score (search failed low)
+
+
+class TranspositionEntry(NamedTuple):
+    """A single cached search result."""
+    score: int
+    depth: float
+    bound: Bound
+    best_move: Optional[int] = None  # Move that produced the score, tried first on revisits
+
+
+class TranspositionTable:
+    """
+    Bounded cache of minimax search results keyed by position.
+
+    Each entry records the score found for a position, the remaining search depth
+    it was computed with, whether the score is exact or only a bound (as
+    produced by alpha-beta cutoffs), and the best move found, which a later
+    search of the position tries first whatever its depth. When the table is full, the least recently
+    used entry is evicted, so positions that keep recurring across moves and
+    games stay resident. All operations hold an internal lock, so one table can
+    be shared by searches running on several threads.
+
+    Example:
+        >>> table = TranspositionTable(max_entries=2)
+        >>> table.store('key', 10, float('inf'), Bound.EXACT)
+        >>> table.get('key')
+        TranspositionEntry(score=10, depth=inf, bound=<Bound.EXACT: 'exact'>, best_move=None)
+
+    Attributes:
+        max_entries (int): Maximum number of positions kept before evicting
+        hits (int): Number of lookups that found an entry
+        misses (int): Number of lookups that found nothing
+    """
+
+    def __init__(self, max_entries: int = 20000):
+        """
+        Create an empty transposition table.
+
+        Args:
+            max_entries (int): Size cap for the table (default: 20000)
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, TranspositionEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[TranspositionEntry]:
+        """
+        Look up a position and mark it as recently used.
+
+        Args:
+            key (Hashable): Position key
+
+        Returns:
+            Optional[TranspositionEntry]: Cached entry, or None if not present
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def store(self, key: Hashable, score: int, depth: float, bound: Bound,
+              best_move: Optional[int] = None) -> None:
+        """
+        Store a search result, evicting the least recently used entry if full.
+
+        Args:
+            key (Hashable): Position key
+            score (int): Score found by the search
+            depth (float): Remaining depth the score was searched to
+            bound (Bound): Whether the score is exact or a lower/upper bound
+            best_move (Optional[int]): Best or refuting move found, if any
+        """
+        entries = self._entries
+        with self._lock:
+            if key in entries:
+                entries.move_to_end(key)
+            elif len(entries) >= self.max_entries:
+                entries.popitem(last=False)
+
+            entries[key] = TranspositionEntry(score, depth, bound, best_move)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
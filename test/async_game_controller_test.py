@@ -0,0 +1,193 @@
+import asyncio
+import threading
+import time
+import unittest
+from io import StringIO
+from typing import List, Optional
+from unittest.mock import patch
+
+from src.async_game_controller import AsyncGameController, AsyncGameUI, AsyncTerminalUI, run_sessions
+from src.player import AIPlayer, HumanPlayer, DifficultyLevel
+from src.terminal_ui import TerminalUI
+from src.tic_tac_toe import TicTacToe, GameMode
+
+
+class ScriptedUI(AsyncGameUI):
+    """AsyncGameUI that answers prompts from a script and records everything shown."""
+
+    def __init__(self, mode: GameMode, positions: List[int], symbol: Optional[str] = TicTacToe.PLAYER_X,
+                 difficulty: DifficultyLevel = DifficultyLevel.HARD):
+        self.mode = mode
+        self.positions = list(positions)
+        self.symbol = symbol
+        self.difficulty = difficulty
+        self.messages: List[str] = []
+        self.errors: List[str] = []
+        self.ai_statuses: List[str] = []
+        self.result: Optional[dict] = None
+
+    async def display_board(self, game: TicTacToe) -> None:
+        await asyncio.sleep(0)
+
+    async def get_valid_position(self, game: TicTacToe) -> int:
+        await asyncio.sleep(0)  # Waiting on the user lets other sessions run
+        for position in self.positions:
+            if game.is_valid_move(position):
+                self.positions.remove(position)
+                return position
+        return next(p for p in range(1, 10) if game.is_valid_move(p))
+
+    async def get_game_mode(self) -> GameMode:
+        return self.mode
+
+    async def get_player_symbol(self) -> Optional[str]:
+        return self.symbol
+
+    async def get_ai_difficulty(self) -> DifficultyLevel:
+        return self.difficulty
+
+    async def display_game_result(self, game_state: dict) -> None:
+        self.result = game_state
+
+    async def show_message(self, message: str) -> None:
+        self.messages.append(message)
+
+    async def show_error(self, error_message: str) -> None:
+        self.errors.append(error_message)
+
+    async def display_turn_info(self, current_player_symbol: str, is_ai: bool = False) -> None:
+        pass
+
+    async def display_session_stats(self, stats: dict) -> None:
+        pass
+
+    def show_ai_status(self, status_message: str) -> None:
+        self.ai_statuses.append(status_message)
+
+
+class TestAsyncGameController(unittest.TestCase):
+    """Test cases for AsyncGameController"""
+
+    def test_human_vs_human_game(self) -> None:
+        """Test a scripted two-player game runs to a win and updates the session stats."""
+        ui = ScriptedUI(GameMode.HUMAN_VS_HUMAN, [1, 4, 2, 5, 3])
+        controller = AsyncGameController(ui)
+
+        result = asyncio.run(controller.play())
+
+        self.assertEqual(result, {'state': 'won', 'winner': TicTacToe.PLAYER_X})
+        self.assertEqual(ui.result, result)
+        self.assertIsInstance(controller.player_x, HumanPlayer)
+        self.assertIn("Setting up Human vs Human game", ui.messages)
+        self.assertEqual(controller.session_stats,
+                         {'games_played': 1, 'x_wins': 1, 'o_wins': 0, 'draws': 0})
+
+    def test_human_vs_ai_game_awaits_ai_moves(self) -> None:
+        """Test the AI moves through its awaitable interface and reports its status."""
+        ui = ScriptedUI(GameMode.HUMAN_VS_AI, [1, 2, 3, 4, 5, 6, 7, 8, 9])
+        controller = AsyncGameController(ui)
+
+        with patch('random.Random.uniform', return_value=0.01), patch('time.sleep') as mock_sleep:
+            result = asyncio.run(controller.play())
+
+        self.assertIsInstance(controller.player_o, AIPlayer)
+        self.assertNotEqual(result['winner'], TicTacToe.PLAYER_X)  # HARD never loses
+        self.assertIn("AI opponent is thinking...", ui.ai_statuses)
+        self.assertIn(f"Human: X, AI: O ({DifficultyLevel.HARD.value})", ui.messages)
+        mock_sleep.assert_not_called()
+
+    def test_going_back_during_setup_returns_none(self) -> None:
+        """Test leaving at the symbol prompt ends the session without a game."""
+        ui = ScriptedUI(GameMode.HUMAN_VS_AI, [], symbol=None)
+        controller = AsyncGameController(ui)
+
+        self.assertIsNone(asyncio.run(controller.play()))
+        self.assertEqual(controller.session_stats['games_played'], 0)
+
+    def test_unknown_player_type_is_reported(self) -> None:
+        """Test an unsupported player type is rejected."""
+        ui = ScriptedUI(GameMode.HUMAN_VS_HUMAN, [])
+        controller = AsyncGameController(ui)
+
+        async def play_with_bad_player():
+            await controller._setup_game()
+            controller.player_x = object()
+            await controller._run_game_loop()
+
+        with self.assertRaises(ValueError):
+            asyncio.run(play_with_bad_player())
+
+    def test_sessions_run_concurrently(self) -> None:
+        """Test many games share one event loop and their thinking delays overlap."""
+        sessions = 200
+        uis = [ScriptedUI(GameMode.HUMAN_VS_AI, [1, 3, 7, 9, 2, 4, 6, 8],
+                          symbol=TicTacToe.PLAYER_O if index % 2 else TicTacToe.PLAYER_X)
+               for index in range(sessions)]
+        controllers = [AsyncGameController(ui) for ui in uis]
+
+        start = time.perf_counter()
+        with patch('random.Random.uniform', return_value=0.05):
+            results = asyncio.run(run_sessions(controllers))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(results), sessions)
+        self.assertTrue(all(result['state'] in ('won', 'draw') for result in results))
+        # At least four AI moves per game: run one after another, the delays alone
+        # would take sessions * 4 * 0.05 = 40 seconds
+        self.assertLess(elapsed, 10)
+
+    def test_failed_session_does_not_affect_others(self) -> None:
+        """Test an exception in one session is returned in its slot while the others finish."""
+        class DisconnectingUI(ScriptedUI):
+            async def get_valid_position(self, game: TicTacToe) -> int:
+                raise ConnectionResetError("client went away")
+
+        uis = [ScriptedUI(GameMode.HUMAN_VS_HUMAN, [1, 4, 2, 5, 3]) for _ in range(3)]
+        uis.insert(1, DisconnectingUI(GameMode.HUMAN_VS_HUMAN, []))
+        controllers = [AsyncGameController(ui) for ui in uis]
+
+        results = asyncio.run(run_sessions(controllers))
+
+        self.assertIsInstance(results[1], ConnectionResetError)
+        self.assertEqual(uis[1].errors, ["An unexpected error occurred: client went away"])
+        for index in (0, 2, 3):
+            with self.subTest(session=index):
+                self.assertEqual(results[index], {'state': 'won', 'winner': TicTacToe.PLAYER_X})
+                self.assertEqual(controllers[index].session_stats['games_played'], 1)
+
+
+class TestAsyncTerminalUI(unittest.TestCase):
+    """Test cases for AsyncTerminalUI"""
+
+    @patch('builtins.input')
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_prompts_run_off_the_event_loop(self, mock_stdout, mock_input) -> None:
+        """Test blocking prompts are answered from a worker thread and output is printed."""
+        input_threads = []
+
+        def answer(prompt):
+            input_threads.append(threading.get_ident())
+            return '2' if len(input_threads) == 1 else '5'
+
+        mock_input.side_effect = answer
+        ui = AsyncTerminalUI(TerminalUI())
+        game = TicTacToe()
+
+        async def prompt():
+            mode = await ui.get_game_mode()
+            position = await ui.get_valid_position(game)
+            await ui.show_message("hello")
+            ui.show_ai_status("thinking")
+            return mode, position
+
+        mode, position = asyncio.run(prompt())
+
+        self.assertEqual(mode, GameMode.HUMAN_VS_AI)
+        self.assertEqual(position, 5)
+        self.assertNotIn(threading.get_ident(), input_threads)
+        self.assertIn("Info: hello", mock_stdout.getvalue())
+        self.assertIn("thinking", mock_stdout.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import random
+import unittest
+
+from src.batch_tic_tac_toe import BatchTicTacToe, random_playouts
+from src.tic_tac_toe import TicTacToe
+
+
+class TestBatchTicTacToe(unittest.TestCase):
+    """Test cases for BatchTicTacToe"""
+
+    def test_new_batch_has_empty_boards(self) -> None:
+        """Test every board starts empty with no winners or draws."""
+        batch = BatchTicTacToe(4)
+
+        for index in range(4):
+            self.assertEqual(batch.get_board(index), [TicTacToe.EMPTY] * 9)
+        self.assertEqual(batch.winners(), [None] * 4)
+        self.assertEqual(batch.draws(), [False] * 4)
+        self.assertEqual(batch.results()['games_played'], 0)
+
+    def test_rejects_empty_batch(self) -> None:
+        """Test a batch needs at least one board."""
+        with self.assertRaises(ValueError):
+            BatchTicTacToe(0)
+
+    def test_make_moves_alternates_players_per_board(self) -> None:
+        """Test boards that pass keep their side to move."""
+        batch = BatchTicTacToe(2)
+
+        batch.make_moves([1, 1])
+        batch.make_moves([2, 0])   # Board 1 passes, so O is still to move there
+        batch.make_moves([3, 2])
+
+        self.assertEqual(batch.get_board(0)[:3], ['X', 'O', 'X'])
+        self.assertEqual(batch.get_board(1)[:3], ['X', 'O', TicTacToe.EMPTY])
+
+    def test_make_moves_validates_input(self) -> None:
+        """Test wrong lengths, bad positions, occupied squares and won boards raise."""
+        batch = BatchTicTacToe(2)
+
+        with self.assertRaises(ValueError):
+            batch.make_moves([1])
+        with self.assertRaises(ValueError):
+            batch.make_moves([1, 10])
+        with self.assertRaises(ValueError):
+            batch.make_moves([-1, 1])
+
+        batch.make_moves([1, 1])
+        with self.assertRaises(ValueError) as context:
+            batch.make_moves([2, 1])
+        self.assertIn("board 1", str(context.exception))
+
+        # X completes the top row on both boards
+        for position in [4, 2, 5, 3]:
+            batch.make_moves([position, position])
+        with self.assertRaises(ValueError) as context:
+            batch.make_moves([6, 0])
+        self.assertEqual(str(context.exception), "Board 0 is already won")
+
+    def test_matches_list_engine_over_random_games(self) -> None:
+        """Test winners and draws match TicTacToe for every board of a random batch."""
+        rng = random.Random(99)
+        num_boards = 64
+        batch = BatchTicTacToe(num_boards)
+        games = [TicTacToe() for _ in range(num_boards)]
+
+        for _ in range(9):
+            positions = []
+            for game in games:
+                if game.get_game_state()['state'] != 'ongoing':
+                    positions.append(0)
+                    continue
+                position = rng.choice([p for p in range(1, 10) if game.is_valid_move(p)])
+                game.make_move(position)
+                positions.append(position)
+            batch.make_moves(positions)
+
+            self.assertEqual(batch.winners(), [game.check_winner() for game in games])
+            self.assertEqual(batch.draws(), [game.is_draw() for game in games])
+            for index, game in enumerate(games):
+                self.assertEqual(batch.get_board(index), game.board)
+
+        results = batch.results()
+        self.assertEqual(results['games_played'], num_boards)
+        self.assertEqual(results['x_wins'], sum(g.check_winner() == 'X' for g in games))
+        self.assertEqual(results['o_wins'], sum(g.check_winner() == 'O' for g in games))
+        self.assertEqual(results['draws'], sum(g.is_draw() for g in games))
+
+    def test_reset_clears_all_boards(self) -> None:
+        """Test reset empties the batch and restores X to move."""
+        batch = BatchTicTacToe(2)
+        batch.make_moves([5, 5])
+
+        batch.reset()
+        batch.make_moves([1, 1])
+
+        self.assertEqual(batch.get_board(0)[0], TicTacToe.PLAYER_X)
+        self.assertEqual(batch.get_board(0)[4], TicTacToe.EMPTY)
+
+    def test_get_board_rejects_out_of_range_index(self) -> None:
+        """Test board indices are bounds-checked."""
+        with self.assertRaises(IndexError):
+            BatchTicTacToe(2).get_board(2)
+
+
+class TestRandomPlayouts(unittest.TestCase):
+    """Test cases for random_playouts"""
+
+    def test_results_match_known_random_play_odds(self) -> None:
+        """Test random games end roughly 58.5% X, 28.8% O, 12.7% draws."""
+        results = random_playouts(20000, random.Random(3))
+
+        self.assertEqual(results['games_played'], 20000)
+        self.assertEqual(results['x_wins'] + results['o_wins'] + results['draws'], 20000)
+        self.assertAlmostEqual(results['x_wins'] / 20000, 0.585, delta=0.02)
+        self.assertAlmostEqual(results['o_wins'] / 20000, 0.288, delta=0.02)
+        self.assertAlmostEqual(results['draws'] / 20000, 0.127, delta=0.02)
+
+    def test_seeded_runs_are_reproducible(self) -> None:
+        """Test the same seed replays the same playouts."""
+        self.assertEqual(random_playouts(500, random.Random(8)),
+                         random_playouts(500, random.Random(8)))
+
+    def test_handles_zero_and_negative_counts(self) -> None:
+        """Test zero games returns empty results and negative counts raise."""
+        self.assertEqual(random_playouts(0)['games_played'], 0)
+        with self.assertRaises(ValueError):
+            random_playouts(-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
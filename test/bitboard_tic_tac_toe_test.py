@@ -0,0 +1,194 @@
+import random
+import unittest
+
+from src.bitboard_tic_tac_toe import BitboardTicTacToe, WIN_MASKS, WINNING_PATTERN, FULL_BOARD_MASK
+from src.tic_tac_toe import TicTacToe, GameMode, zobrist_hash
+
+
+class TestBitboardTicTacToe(unittest.TestCase):
+    """Test cases for BitboardTicTacToe"""
+
+    def setUp(self) -> None:
+        self.game = BitboardTicTacToe()
+
+    def test_is_a_tic_tac_toe_engine(self) -> None:
+        """Test the bitboard engine can be used wherever TicTacToe is expected."""
+        self.assertIsInstance(self.game, TicTacToe)
+        self.assertEqual(self.game.get_game_mode(), GameMode.HUMAN_VS_AI)
+        self.assertEqual(BitboardTicTacToe(GameMode.HUMAN_VS_HUMAN).mode, GameMode.HUMAN_VS_HUMAN)
+
+    def test_starts_with_empty_board_and_x_to_move(self) -> None:
+        """Test a new game has no pieces and X moves first."""
+        self.assertEqual(self.game.x_bits, 0)
+        self.assertEqual(self.game.o_bits, 0)
+        self.assertEqual(self.game.board, [TicTacToe.EMPTY] * 9)
+        self.assertEqual(self.game.current_player, TicTacToe.PLAYER_X)
+
+    def test_make_move_sets_bit_and_switches_player(self) -> None:
+        """Test make_move sets the mover's bit and alternates turns."""
+        self.game.make_move(5)
+        self.game.make_move(1)
+
+        self.assertEqual(self.game.x_bits, 1 << 4)
+        self.assertEqual(self.game.o_bits, 1 << 0)
+        self.assertEqual(self.game.current_player, TicTacToe.PLAYER_X)
+        self.assertEqual(self.game.board[4], TicTacToe.PLAYER_X)
+        self.assertEqual(self.game.board[0], TicTacToe.PLAYER_O)
+
+    def test_make_move_raises_same_errors_as_list_engine(self) -> None:
+        """Test invalid moves raise the same ValueError messages as TicTacToe."""
+        self.game.make_move(3)
+
+        with self.assertRaises(ValueError) as context:
+            self.game.make_move(3)
+        self.assertEqual(str(context.exception), "Position 3 is already occupied by 'X'")
+
+        for position in [0, 10, -1]:
+            with self.subTest(position=position):
+                with self.assertRaises(ValueError) as context:
+                    self.game.make_move(position)
+                self.assertEqual(str(context.exception),
+                                 f"Invalid position {position}: must be between 1 and 9")
+
+    def test_board_setter_loads_bitmasks(self) -> None:
+        """Test assigning a list board loads both bitmasks."""
+        self.game.board = ['X', 'O', ' ',
+                           ' ', 'X', ' ',
+                           ' ', ' ', 'O']
+
+        self.assertEqual(self.game.x_bits, (1 << 0) | (1 << 4))
+        self.assertEqual(self.game.o_bits, (1 << 1) | (1 << 8))
+        self.assertEqual(self.game.get_display_value(1), 'X')
+        self.assertEqual(self.game.get_display_value(3), '3')
+
+    def test_board_setter_rejects_wrong_length(self) -> None:
+        """Test assigning a board that isn't 9 elements raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.game.board = [TicTacToe.EMPTY] * 8
+
+    def test_reset_board_clears_bitmasks(self) -> None:
+        """Test reset_board clears both players and gives X the move."""
+        self.game.make_move(1)
+        self.game.reset_board()
+
+        self.assertEqual(self.game.x_bits | self.game.o_bits, 0)
+        self.assertEqual(self.game.current_player, TicTacToe.PLAYER_X)
+
+    def test_winning_pattern_table_matches_every_win_mask(self) -> None:
+        """Test the precomputed table marks exactly the patterns containing a line."""
+        self.assertEqual(len(WINNING_PATTERN), FULL_BOARD_MASK + 1)
+        for mask in WIN_MASKS:
+            with self.subTest(mask=mask):
+                self.assertTrue(WINNING_PATTERN[mask])
+                for extra in range(9):
+                    self.assertTrue(WINNING_PATTERN[mask | 1 << extra])
+        self.assertFalse(WINNING_PATTERN[0])
+        self.assertFalse(WINNING_PATTERN[0b000010011])
+
+    def test_check_winner_and_game_state(self) -> None:
+        """Test winner, draw and ongoing states are reported like TicTacToe."""
+        self.assertEqual(self.game.get_game_state(), {'state': 'ongoing', 'winner': None})
+
+        self.game.board = ['O', 'X', 'X',
+                           'O', 'X', ' ',
+                           'O', ' ', ' ']
+        self.assertEqual(self.game.check_winner(), TicTacToe.PLAYER_O)
+        self.assertEqual(self.game.get_game_state(), {'state': 'won', 'winner': 'O'})
+
+        self.game.board = ['X', 'O', 'X',
+                           'X', 'O', 'O',
+                           'O', 'X', 'X']
+        self.assertTrue(self.game.is_board_full())
+        self.assertTrue(self.game.is_draw())
+        self.assertEqual(self.game.get_game_state(), {'state': 'draw', 'winner': None})
+
+    def test_find_winning_move(self) -> None:
+        """Test find_winning_move finds completions and validates the symbol."""
+        self.game.board = ['X', 'X', ' ',
+                           'O', 'O', ' ',
+                           ' ', ' ', ' ']
+
+        self.assertEqual(self.game.find_winning_move('X'), 3)
+        self.assertEqual(self.game.find_winning_move('O'), 6)
+
+        self.game.board = ['X', 'X', 'O',
+                           ' ', ' ', ' ',
+                           ' ', ' ', ' ']
+        self.assertIsNone(self.game.find_winning_move('X'))
+
+        with self.assertRaises(ValueError):
+            self.game.find_winning_move('Z')
+
+    def test_matches_list_engine_over_random_games(self) -> None:
+        """Test every public query agrees with TicTacToe across random games."""
+        rng = random.Random(1234)
+
+        for _ in range(200):
+            reference = TicTacToe()
+            bitboard = BitboardTicTacToe()
+
+            while reference.get_game_state()['state'] == 'ongoing':
+                position = rng.choice([p for p in range(1, 10) if reference.is_valid_move(p)])
+                reference.make_move(position)
+                bitboard.make_move(position)
+
+                self.assertEqual(bitboard.board, reference.board)
+                self.assertEqual(bitboard.current_player, reference.current_player)
+                self.assertEqual(bitboard.check_winner(), reference.check_winner())
+                self.assertEqual(bitboard.is_draw(), reference.is_draw())
+                self.assertEqual(bitboard.get_game_state(), reference.get_game_state())
+                for symbol in (TicTacToe.PLAYER_X, TicTacToe.PLAYER_O):
+                    self.assertEqual(bitboard.find_winning_move(symbol),
+                                     reference.find_winning_move(symbol))
+                for p in range(1, 10):
+                    self.assertEqual(bitboard.is_valid_move(p), reference.is_valid_move(p))
+                    self.assertEqual(bitboard.get_display_value(p), reference.get_display_value(p))
+
+
+    def test_undo_and_redo_update_bitmasks(self) -> None:
+        """Test undo clears the mover's bit and redo sets it again."""
+        for position in (1, 4, 2, 5, 3):
+            self.game.make_move(position)
+        self.assertEqual(self.game.check_winner(), TicTacToe.PLAYER_X)
+
+        self.assertEqual(self.game.undo_move(), 3)
+        self.assertEqual(self.game.x_bits, 0b11)
+        self.assertEqual(self.game.current_player, TicTacToe.PLAYER_X)
+        self.assertIsNone(self.game.check_winner())
+
+        self.assertEqual(self.game.redo_move(), 3)
+        self.assertEqual(self.game.x_bits, 0b111)
+        self.assertEqual(self.game.check_winner(), TicTacToe.PLAYER_X)
+
+    def test_undo_matches_list_engine(self) -> None:
+        """Test random move/undo sequences leave both engines in the same state."""
+        rng = random.Random(11)
+        for _ in range(100):
+            reference = TicTacToe()
+            bitboard = BitboardTicTacToe()
+            for _ in range(30):
+                empty = [p for p in range(1, 10) if reference.is_valid_move(p)]
+                if empty and (rng.random() < 0.6 or not reference._history):
+                    position = rng.choice(empty)
+                    reference.make_move(position)
+                    bitboard.make_move(position)
+                elif reference._history:
+                    self.assertEqual(bitboard.undo_move(), reference.undo_move())
+
+                self.assertEqual(bitboard.board, reference.board)
+                self.assertEqual(bitboard.current_player, reference.current_player)
+                self.assertEqual(bitboard.zobrist_hash, reference.zobrist_hash)
+
+    def test_zobrist_hash_after_board_assignment(self) -> None:
+        """Test loading a board rehashes it from the bitmasks."""
+        board = ['X', 'O', ' ', ' ', 'X', ' ', ' ', ' ', ' ']
+        self.game.board = board
+        self.game.current_player = TicTacToe.PLAYER_O
+
+        self.assertEqual(self.game.zobrist_hash, zobrist_hash(board, TicTacToe.PLAYER_O))
+        self.game.reset_board()
+        self.assertEqual(self.game.zobrist_hash, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import os
+import random
+import tempfile
+import unittest
+from itertools import product
+
+from src.endgame_tablebase import EndgameTablebase, build_tablebase, MAGIC, HEADER
+from src.perfect_play_table import solve_all_positions, LOSS, DRAW, WIN
+from src.player import AIPlayer, DifficultyLevel, UNLIMITED_DEPTH
+from src.tic_tac_toe import TicTacToe
+
+X, O, E = TicTacToe.PLAYER_X, TicTacToe.PLAYER_O, TicTacToe.EMPTY
+
+
+def _side_to_move(board):
+    return X if board.count(X) == board.count(O) else O
+
+
+class TestEndgameTablebase(unittest.TestCase):
+    """Test cases for the endgame tablebase"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.classic = build_tablebase(3, max_empties=9)
+        cls.small = build_tablebase(4, max_empties=1)
+
+    def test_invalid_configuration_raises_error(self) -> None:
+        """Test impossible geometries, oversized boards and empty-cell limits are rejected."""
+        with self.assertRaises(ValueError):
+            build_tablebase(3, 4)
+        with self.assertRaises(ValueError):
+            build_tablebase(5, 4, max_empties=1)
+        with self.assertRaises(ValueError):
+            build_tablebase(3, max_empties=10)
+        with self.assertRaises(ValueError):
+            EndgameTablebase(3, 3, 9, bytearray(3))
+
+    def test_index_is_perfect(self) -> None:
+        """Test every board with legal mark counts gets a distinct index with no gaps."""
+        indices = set()
+        for values in product((E, X, O), repeat=9):
+            x_bits = sum(1 << cell for cell, value in enumerate(values) if value == X)
+            o_bits = sum(1 << cell for cell, value in enumerate(values) if value == O)
+            index = self.classic.index(x_bits, o_bits)
+            if index is not None:
+                indices.add(index)
+        self.assertEqual(indices, set(range(self.classic.position_count)))
+
+        # Full 4x4 boards: every choice of the eight X cells
+        full_boards = build_tablebase(4, max_empties=0)
+        indices = {full_boards.index(x_bits, 0xFFFF ^ x_bits)
+                   for x_bits in range(1 << 16) if bin(x_bits).count('1') == 8}
+        self.assertEqual(indices, set(range(full_boards.position_count)))
+        self.assertIsNone(full_boards.index(0b1, 0))  # Too many empty cells
+
+    def test_classic_values_match_perfect_play_table(self) -> None:
+        """Test the retrograde 3x3 values agree with the solved game for every reachable board."""
+        symbols = (E, X, O)
+        for index, record in solve_all_positions().items():
+            board = [symbols[index // 3 ** cell % 3] for cell in range(9)]
+            with self.subTest(board=board):
+                self.assertEqual(self.classic.probe(board, _side_to_move(board)), (record >> 9) - 1)
+
+    def test_values_match_search_on_larger_board(self) -> None:
+        """Test 4x4 values agree with a full search on positions near the end of the game."""
+        rng = random.Random(22)
+        checked = 0
+        while checked < 40:
+            board = [E] * 16
+            for cell in rng.sample(range(16), 15):
+                board[cell] = X if board.count(X) == board.count(O) else O
+            side = _side_to_move(board)
+            ai = AIPlayer(side, DifficultyLevel.HARD, enable_delay=False, board_size=4,
+                          use_opening_book=False)
+            if ai._winner(board) is not None:
+                continue
+            checked += 1
+            with self.subTest(board=board):
+                score = ai._negamax(board, UNLIMITED_DEPTH, side)
+                self.assertEqual(self.small.probe(board, side), (score > 0) - (score < 0))
+
+    def test_probe_returns_none_when_not_covered(self) -> None:
+        """Test wrong sizes, wrong sides, unreachable positions and early positions are not answered."""
+        self.assertIsNone(self.classic.probe([E] * 16, X))
+        self.assertIsNone(self.classic.probe([E] * 9, O))
+        self.assertIsNone(self.classic.probe([X, X, X, O, O, O, E, E, E], X))  # Both players won
+        self.assertIsNone(self.small.probe([E] * 16, X))
+        self.assertEqual(self.classic.probe([X, X, E, O, O, E, E, E, E], X), WIN)
+        self.assertEqual(self.classic.probe([X, X, E, O, O, E, X, E, E], O), WIN)
+        self.assertEqual(self.classic.probe([X, X, X, O, O, E, E, E, E], O), LOSS)
+        self.assertEqual(self.classic.probe([E] * 9, X), DRAW)
+
+    def test_save_and_load_round_trip(self) -> None:
+        """Test a saved tablebase maps back with identical values."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'tablebase.bin')
+            self.small.save(path)
+            self.assertEqual(os.path.getsize(path), HEADER.size + (self.small.position_count + 3) // 4)
+
+            loaded = EndgameTablebase.load(path)
+            self.assertEqual((loaded.size, loaded.win_length, loaded.max_empties), (4, 4, 1))
+            rng = random.Random(8)
+            for _ in range(200):
+                board = [E] * 16
+                for cell in rng.sample(range(16), 15):
+                    board[cell] = X if board.count(X) == board.count(O) else O
+                side = _side_to_move(board)
+                self.assertEqual(loaded.probe(board, side), self.small.probe(board, side))
+            loaded.close()
+
+    def test_load_rejects_invalid_file(self) -> None:
+        """Test files that are not tablebases, or are truncated, are rejected."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'invalid.bin')
+            for content in (b'not a tablebase', HEADER.pack(MAGIC, 3, 3, 9, 6046) + bytes(10)):
+                with open(path, 'wb') as tablebase_file:
+                    tablebase_file.write(content)
+                with self.subTest(content=content[:8]):
+                    with self.assertRaises(ValueError):
+                        EndgameTablebase.load(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+import random
+import unittest
+
+from src.generalized_tic_tac_toe import GeneralizedTicTacToe, board_geometry, square_symmetries
+from src.tic_tac_toe import (TicTacToe, GameMode, SYMMETRIES, WINNING_COMBINATIONS, winning_lines,
+                             zobrist_hash)
+
+
+class TestWinningLines(unittest.TestCase):
+    """Test cases for the precomputed win-line geometry"""
+
+    def test_classic_lines_match_tic_tac_toe(self) -> None:
+        """Test the 3x3 configuration reproduces the classic eight lines in order."""
+        self.assertEqual(winning_lines(3, 3), WINNING_COMBINATIONS)
+        self.assertEqual(len(WINNING_COMBINATIONS), 8)
+
+    def test_line_counts_for_larger_boards(self) -> None:
+        """Test the number of lines for several configurations."""
+        self.assertEqual(len(winning_lines(4, 4)), 10)
+        self.assertEqual(len(winning_lines(4, 3)), 24)
+        self.assertEqual(len(winning_lines(15, 5)), 572)
+
+    def test_single_cell_lines_are_not_repeated(self) -> None:
+        """Test one in a row gives each cell once instead of once per direction."""
+        self.assertEqual(winning_lines(3, 1), tuple((cell,) for cell in range(9)))
+        lines, lines_through = board_geometry(4, 1)
+        self.assertEqual(len(lines), 16)
+        self.assertTrue(all(len(through) == 1 for through in lines_through))
+
+    def test_lines_through_each_cell(self) -> None:
+        """Test lines_through contains exactly the lines covering each cell."""
+        lines, lines_through = board_geometry(5, 4)
+        for index in range(25):
+            with self.subTest(index=index):
+                self.assertEqual(set(lines_through[index]), {line for line in lines if index in line})
+
+    def test_geometry_is_shared_between_games(self) -> None:
+        """Test games of the same configuration reuse one set of lines."""
+        self.assertIs(GeneralizedTicTacToe(6, 4).lines, GeneralizedTicTacToe(6, 4).lines)
+
+    def test_square_symmetries_map_lines_onto_lines(self) -> None:
+        """Test the eight symmetries are distinct permutations that preserve win lines."""
+        self.assertEqual(square_symmetries(3), SYMMETRIES)
+        for size, win_length in ((4, 4), (5, 4)):
+            lines = {frozenset(line) for line in winning_lines(size, win_length)}
+            symmetries = square_symmetries(size)
+            self.assertEqual(len(set(symmetries)), 8)
+            for source in symmetries:
+                with self.subTest(size=size, source=source):
+                    self.assertEqual(sorted(source), list(range(size * size)))
+                    self.assertEqual({frozenset(source[cell] for cell in line) for line in lines}, lines)
+
+
+class TestGeneralizedTicTacToe(unittest.TestCase):
+    """Test cases for GeneralizedTicTacToe"""
+
+    def test_defaults_to_classic_game(self) -> None:
+        """Test the default configuration is a 3x3 board with three in a row."""
+        game = GeneralizedTicTacToe()
+        self.assertIsInstance(game, TicTacToe)
+        self.assertEqual((game.size, game.win_length, game.cell_count), (3, 3, 9))
+        self.assertEqual(game.board, [TicTacToe.EMPTY] * 9)
+        self.assertEqual(game.current_player, TicTacToe.PLAYER_X)
+        self.assertEqual(game.get_game_mode(), GameMode.HUMAN_VS_AI)
+        self.assertEqual(GeneralizedTicTacToe(mode=GameMode.HUMAN_VS_HUMAN).mode, GameMode.HUMAN_VS_HUMAN)
+
+    def test_invalid_configuration_raises_error(self) -> None:
+        """Test impossible board sizes and win lengths are rejected."""
+        with self.assertRaises(ValueError):
+            GeneralizedTicTacToe(0)
+        with self.assertRaises(ValueError):
+            GeneralizedTicTacToe(3, 4)
+        with self.assertRaises(ValueError):
+            GeneralizedTicTacToe(3, 0)
+
+    def test_classic_symmetry_helpers_reject_larger_boards(self) -> None:
+        """Test the inherited 3x3 canonicalization and state codes refuse other sizes."""
+        game = GeneralizedTicTacToe(4)
+        game.make_move(6)
+        with self.assertRaises(ValueError):
+            game.canonicalize(game.board)
+        with self.assertRaises(ValueError):
+            game.canonical_key(game.board)
+        with self.assertRaises(ValueError):
+            game.get_state_code()
+        self.assertEqual(GeneralizedTicTacToe().canonical_key([TicTacToe.EMPTY] * 9), ' ' * 9)
+
+    def test_move_validation_uses_board_size(self) -> None:
+        """Test positions are checked against the configured board size."""
+        game = GeneralizedTicTacToe(4)
+        self.assertTrue(game.is_valid_move(16))
+        self.assertFalse(game.is_valid_move(17))
+
+        with self.assertRaises(ValueError) as context:
+            game.make_move(17)
+        self.assertEqual(str(context.exception), "Invalid position 17: must be between 1 and 16")
+
+        game.make_move(16)
+        with self.assertRaises(ValueError) as context:
+            game.make_move(16)
+        self.assertEqual(str(context.exception), "Position 16 is already occupied by 'X'")
+
+    def test_detects_win_in_every_direction(self) -> None:
+        """Test rows, columns, diagonals and anti-diagonals win on a gomoku board."""
+        lines = {
+            'row': (17, 18, 19, 20, 21),
+            'column': (3, 18, 33, 48, 63),
+            'diagonal': (1, 17, 33, 49, 65),
+            'anti-diagonal': (15, 29, 43, 57, 71),
+        }
+        for name, x_moves in lines.items():
+            with self.subTest(line=name):
+                game = GeneralizedTicTacToe(15, 5)
+                o_moves = [225, 224, 223, 222]
+                for x_move, o_move in zip(x_moves, o_moves):
+                    game.make_move(x_move)
+                    game.make_move(o_move)
+                    self.assertIsNone(game.check_winner())
+                game.make_move(x_moves[-1])
+                self.assertEqual(game.check_winner(), TicTacToe.PLAYER_X)
+                self.assertEqual(game.get_game_state(), {'state': 'won', 'winner': TicTacToe.PLAYER_X})
+
+    def test_short_run_does_not_win(self) -> None:
+        """Test k-1 marks in a row are not a win."""
+        game = GeneralizedTicTacToe(5, 4)
+        for position in (1, 25, 2, 24, 3):
+            game.make_move(position)
+        self.assertIsNone(game.check_winner())
+        self.assertEqual(game.get_game_state()['state'], 'ongoing')
+
+    def test_full_board_without_line_is_draw(self) -> None:
+        """Test a full board with no winner is reported as a draw."""
+        game = GeneralizedTicTacToe(4)
+        # Column pairs alternate so no row, column or diagonal is uniform
+        for position in (1, 2, 5, 6, 3, 4, 7, 8, 10, 9, 14, 13, 12, 11, 16, 15):
+            game.make_move(position)
+
+        self.assertTrue(game.is_board_full())
+        self.assertTrue(game.is_draw())
+        self.assertEqual(game.get_game_state(), {'state': 'draw', 'winner': None})
+
+    def test_board_assignment_rescans_position(self) -> None:
+        """Test assigning a board recomputes the winner and move count."""
+        game = GeneralizedTicTacToe(4)
+        game.board = ['O', 'O', 'O', 'O'] + ['X'] * 3 + [' '] * 9
+        self.assertEqual(game.check_winner(), TicTacToe.PLAYER_O)
+        self.assertFalse(game.is_board_full())
+
+        game.reset_board()
+        self.assertIsNone(game.check_winner())
+        with self.assertRaises(ValueError):
+            game.board = [' '] * 9
+
+    def test_find_winning_move(self) -> None:
+        """Test find_winning_move completes a line of the configured length."""
+        game = GeneralizedTicTacToe(4)
+        game.board = ['X', 'X', ' ', 'X'] + [' '] * 12
+        self.assertEqual(game.find_winning_move('X'), 3)
+        self.assertIsNone(game.find_winning_move('O'))
+        with self.assertRaises(ValueError):
+            game.find_winning_move('Z')
+
+    def test_undo_and_redo_on_large_board(self) -> None:
+        """Test undo and redo keep the incremental outcome correct on gomoku boards."""
+        game = GeneralizedTicTacToe(15, 5)
+        for position in (1, 16, 2, 17, 3, 18, 4, 19, 5):
+            game.make_move(position)
+        self.assertEqual(game.check_winner(), TicTacToe.PLAYER_X)
+
+        self.assertEqual(game.undo_move(), 5)
+        self.assertIsNone(game.check_winner())
+        game.make_move(6)  # X plays elsewhere, O can now win at 20
+        game.make_move(20)
+        self.assertEqual(game.check_winner(), TicTacToe.PLAYER_O)
+
+    def test_zobrist_hash_on_large_board(self) -> None:
+        """Test the 64-bit hash tracks moves and undos on a gomoku board."""
+        game = GeneralizedTicTacToe(15, 5)
+        rng = random.Random(14)
+        hashes = [game.zobrist_hash]
+        for _ in range(60):
+            position = rng.choice([p for p in range(1, 226) if game.is_valid_move(p)])
+            game.make_move(position)
+            self.assertEqual(game.zobrist_hash, zobrist_hash(game.board, game.current_player))
+            hashes.append(game.zobrist_hash)
+
+        self.assertEqual(len(set(hashes)), len(hashes))
+        for expected in reversed(hashes[:-1]):
+            game.undo_move()
+            self.assertEqual(game.zobrist_hash, expected)
+
+    def test_classic_configuration_matches_tic_tac_toe(self) -> None:
+        """Test random 3x3 games agree with the original engine move by move."""
+        rng = random.Random(9)
+        for _ in range(300):
+            reference = TicTacToe()
+            game = GeneralizedTicTacToe()
+            while reference.get_game_state()['state'] == 'ongoing':
+                position = rng.choice([p for p in range(1, 10) if reference.is_valid_move(p)])
+                reference.make_move(position)
+                game.make_move(position)
+
+                self.assertEqual(game.board, reference.board)
+                self.assertEqual(game.get_game_state(), reference.get_game_state())
+                for symbol in (TicTacToe.PLAYER_X, TicTacToe.PLAYER_O):
+                    self.assertEqual(game.find_winning_move(symbol), reference.find_winning_move(symbol))
+
+
+if __name__ == '__main__':
+    unittest.main()
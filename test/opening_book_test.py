@@ -0,0 +1,119 @@
+import os
+import random
+import tempfile
+import unittest
+
+from src.opening_book import (OpeningBook, build_book, canonical_key, default_book, default_book_path,
+                              write_book, HEADER, RECORD)
+from src.generalized_tic_tac_toe import square_symmetries
+from src.tic_tac_toe import TicTacToe
+
+X, O, E = TicTacToe.PLAYER_X, TicTacToe.PLAYER_O, TicTacToe.EMPTY
+
+
+class TestOpeningBook(unittest.TestCase):
+    """Test cases for the opening book"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, 'book.bin')
+        cls.entries = build_book(4, 4, plies=2, node_budget=2000)
+        cls.count = write_book(cls.entries, 4, 4, cls.path)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.directory.cleanup()
+
+    def setUp(self) -> None:
+        self.book = OpeningBook(self.path, 4)
+
+    def tearDown(self) -> None:
+        self.book.close()
+
+    def test_canonical_key_is_symmetry_invariant(self) -> None:
+        """Test every rotation and reflection of a position has the same key."""
+        rng = random.Random(21)
+        for _ in range(20):
+            board = [rng.choice((X, O, E)) for _ in range(16)]
+            key, _ = canonical_key(board, X, 4)
+            for source in square_symmetries(4):
+                with self.subTest(board=board, source=source):
+                    self.assertEqual(canonical_key([board[i] for i in source], X, 4)[0], key)
+            self.assertNotEqual(canonical_key(board, O, 4)[0], key)
+
+    def test_file_has_sorted_fixed_width_records(self) -> None:
+        """Test the file is a header plus records sorted by key and move."""
+        self.assertEqual(self.count, sum(len(moves) for moves in self.entries.values()))
+        with open(self.path, 'rb') as book_file:
+            data = book_file.read()
+        self.assertEqual(len(data), HEADER.size + RECORD.size * self.count)
+        records = [RECORD.unpack_from(data, HEADER.size + index * RECORD.size) for index in range(self.count)]
+        self.assertEqual(records, sorted(records))
+        self.assertEqual(len(self.book), self.count)
+
+    def test_lookup_finds_every_position(self) -> None:
+        """Test the binary search returns the stored replies of the opening positions."""
+        # X's book covers the empty board, O's book every reply to each first move
+        x_moves = self.book.best_moves([E] * 16, X)
+        self.assertTrue(x_moves)
+        for first in range(16):
+            board = [E] * 16
+            board[first] = X
+            with self.subTest(first=first):
+                moves = self.book.best_moves(board, O)
+                self.assertTrue(moves)
+                self.assertTrue(all(board[move - 1] == E for move in moves))
+
+    def test_replies_follow_symmetric_positions(self) -> None:
+        """Test a rotated position is answered with the rotated replies."""
+        board = [E] * 16
+        board[1] = X
+        moves = self.book.best_moves(board, O)
+        for source in square_symmetries(4):
+            transformed = [board[i] for i in source]
+            with self.subTest(source=source):
+                expected = sorted(source.index(move - 1) + 1 for move in moves)
+                self.assertEqual(self.book.best_moves(transformed, O), expected)
+
+    def test_returns_none_when_book_does_not_apply(self) -> None:
+        """Test wrong sides, wrong sizes and unknown positions are not answered."""
+        self.assertIsNone(self.book.best_moves([E] * 16, O))
+        self.assertIsNone(self.book.best_moves([E] * 9, X))
+        board = [X, O, X, O] + [E] * 12  # Beyond the two plies in the book
+        self.assertIsNone(self.book.best_moves(board, X))
+
+    def test_missing_or_invalid_file_is_unavailable(self) -> None:
+        """Test unreadable, corrupt or mismatched books fall back to search."""
+        with tempfile.TemporaryDirectory() as directory:
+            corrupt = os.path.join(directory, 'corrupt.bin')
+            with open(corrupt, 'wb') as book_file:
+                book_file.write(b'not a book')
+            books = [OpeningBook(os.path.join(directory, 'missing.bin'), 4),
+                     OpeningBook(corrupt, 4),
+                     OpeningBook(self.path, 5),
+                     OpeningBook(self.path, 4, 3)]
+            for book in books:
+                with self.subTest(path=book.path, size=book.size, win_length=book.win_length):
+                    self.assertFalse(book.is_available())
+                    self.assertEqual(len(book), 0)
+                    self.assertIsNone(book.best_moves([E] * (book.size * book.size), X))
+
+    def test_build_rejects_invalid_limits(self) -> None:
+        """Test non-positive plies and node budgets are rejected."""
+        with self.assertRaises(ValueError):
+            build_book(4, plies=0)
+        with self.assertRaises(ValueError):
+            build_book(4, node_budget=0)
+
+    def test_shipped_book_is_available(self) -> None:
+        """Test the 4x4 book ships with the package and answers the first move."""
+        self.assertTrue(os.path.exists(default_book_path(4, 4)))
+        book = default_book(4, 4)
+        self.assertIs(book, default_book(4, 4))
+        self.assertTrue(book.is_available())
+        self.assertTrue(book.best_moves([E] * 16, X))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+
+from src.perfect_play_table import (PerfectPlayTable, board_index, solve_all_positions,
+                                    write_table, DEFAULT_TABLE_PATH, ENTRY_COUNT)
+from src.tic_tac_toe import TicTacToe
+
+
+class TestPerfectPlayTable(unittest.TestCase):
+    """Test cases for the precomputed perfect-play table"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.records = solve_all_positions()
+        cls.table = PerfectPlayTable()
+
+    def test_board_index_is_base_three(self) -> None:
+        """Test empty, X and O map to digits 0, 1, 2 with position 1 least significant."""
+        self.assertEqual(board_index([TicTacToe.EMPTY] * 9), 0)
+        self.assertEqual(board_index(['X'] + [TicTacToe.EMPTY] * 8), 1)
+        self.assertEqual(board_index(['O'] + [TicTacToe.EMPTY] * 8), 2)
+        self.assertEqual(board_index([TicTacToe.EMPTY] * 8 + ['O']), 2 * 3 ** 8)
+        self.assertEqual(board_index(['O'] * 9), ENTRY_COUNT - 1)
+
+    def test_solves_every_reachable_position(self) -> None:
+        """Test the solver visits all 5,478 legal positions."""
+        self.assertEqual(len(self.records), 5478)
+
+    def test_shipped_table_is_available(self) -> None:
+        """Test the table file ships with the package and maps successfully."""
+        self.assertTrue(os.path.exists(DEFAULT_TABLE_PATH))
+        self.assertTrue(self.table.is_available())
+
+    def test_shipped_table_matches_fresh_solve(self) -> None:
+        """Test the shipped file is up to date with the solver."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'table.bin')
+            write_table(path)
+            with open(path, 'rb') as fresh, open(DEFAULT_TABLE_PATH, 'rb') as shipped:
+                self.assertEqual(fresh.read(), shipped.read())
+
+    def test_empty_board_is_a_draw_where_every_move_is_optimal(self) -> None:
+        """Test the solved value of the opening position."""
+        empty = [TicTacToe.EMPTY] * 9
+
+        self.assertEqual(self.table.value(empty, TicTacToe.PLAYER_X), 0)
+        self.assertEqual(self.table.best_moves(empty, TicTacToe.PLAYER_X), list(range(1, 10)))
+
+    def test_best_moves_for_known_positions(self) -> None:
+        """Test lookups for a forced reply and an immediate win."""
+        corner_opening = ['X'] + [TicTacToe.EMPTY] * 8
+        self.assertEqual(self.table.best_moves(corner_opening, TicTacToe.PLAYER_O), [5])
+
+        winning = ['X', 'X', TicTacToe.EMPTY,
+                   'O', 'O', TicTacToe.EMPTY,
+                   TicTacToe.EMPTY, TicTacToe.EMPTY, TicTacToe.EMPTY]
+        self.assertEqual(self.table.value(winning, TicTacToe.PLAYER_X), 1)
+        self.assertIn(3, self.table.best_moves(winning, TicTacToe.PLAYER_X))
+
+    def test_returns_none_when_table_does_not_apply(self) -> None:
+        """Test wrong side to move, unreachable and finished boards are not answered."""
+        corner_opening = ['X'] + [TicTacToe.EMPTY] * 8
+        self.assertIsNone(self.table.best_moves(corner_opening, TicTacToe.PLAYER_X))
+
+        unreachable = ['X', 'X', 'X', 'X', TicTacToe.EMPTY, TicTacToe.EMPTY,
+                       TicTacToe.EMPTY, TicTacToe.EMPTY, TicTacToe.EMPTY]
+        self.assertIsNone(self.table.best_moves(unreachable, TicTacToe.PLAYER_O))
+
+        finished = ['X', 'X', 'X', 'O', 'O', TicTacToe.EMPTY,
+                    TicTacToe.EMPTY, TicTacToe.EMPTY, TicTacToe.EMPTY]
+        self.assertIsNone(self.table.best_moves(finished, TicTacToe.PLAYER_O))
+        self.assertEqual(self.table.value(finished, TicTacToe.PLAYER_O), -1)
+
+    def test_missing_or_invalid_file_is_unavailable(self) -> None:
+        """Test a missing or corrupt file disables lookups instead of raising."""
+        with tempfile.TemporaryDirectory() as directory:
+            missing = PerfectPlayTable(os.path.join(directory, 'missing.bin'))
+            self.assertFalse(missing.is_available())
+            self.assertIsNone(missing.best_moves([TicTacToe.EMPTY] * 9, TicTacToe.PLAYER_X))
+
+            corrupt_path = os.path.join(directory, 'corrupt.bin')
+            with open(corrupt_path, 'wb') as corrupt:
+                corrupt.write(b'not a table')
+            self.assertFalse(PerfectPlayTable(corrupt_path).is_available())
+
+            truncated_path = os.path.join(directory, 'truncated.bin')
+            with open(truncated_path, 'wb') as truncated:
+                truncated.write(b'TT')  # Shorter than the header
+            truncated_table = PerfectPlayTable(truncated_path)
+            self.assertFalse(truncated_table.is_available())
+            self.assertIsNone(truncated_table.best_moves([TicTacToe.EMPTY] * 9, TicTacToe.PLAYER_X))
+
+    def test_file_is_not_opened_until_first_lookup(self) -> None:
+        """Test the table is mapped lazily."""
+        table = PerfectPlayTable()
+        self.assertIsNone(table._data)
+
+        table.best_moves([TicTacToe.EMPTY] * 9, TicTacToe.PLAYER_X)
+        self.assertIsNotNone(table._data)
+
+        table.close()
+        self.assertIsNone(table._data)
+
+
+if __name__ == '__main__':
+    unittest.main()
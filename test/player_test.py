@@ -1,10 +1,16 @@
+import asyncio
+import gc
 import unittest
 from unittest.mock import patch, call, MagicMock
 import random
-from src.player import Player, HumanPlayer, AIPlayer, DifficultyLevel
-from src.tic_tac_toe import TicTacToe, GameMode
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from src.player import (Player, HumanPlayer, AIPlayer, MCTSPlayer, DifficultyLevel, MoveOrdering,
+                        UNLIMITED_DEPTH, SCORE_BOUND)
+from src.tic_tac_toe import TicTacToe, GameMode, SYMMETRIES, board_winner
 from src.game_controller import GameController
 from src.terminal_ui import TerminalUI
+from src import perfect_play_table
+from src.endgame_tablebase import build_tablebase
 import time
 
 class TestPlayer(unittest.TestCase):
@@ -32,7 +38,7 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(result, TicTacToe.PLAYER_O)
         mock_input.assert_called_with("Enter your choice (1-4): ")
 
-    @patch('random.choice')
+    @patch('random.Random.choice')
     @patch('builtins.print')
     @patch('builtins.input')
     def test_choose_symbol_returns_random_when_option_3_selected(self, mock_input, mock_print, mock_random):
@@ -45,7 +51,22 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(result, TicTacToe.PLAYER_X)
         mock_random.assert_called_once_with([TicTacToe.PLAYER_X, TicTacToe.PLAYER_O])
 
-    @patch('random.choice')
+    @patch('builtins.print')
+    @patch('builtins.input')
+    def test_choose_symbol_uses_injected_rng(self, mock_input, mock_print):
+        """Test choose_symbol draws the random option from an injected generator."""
+        mock_input.return_value = '3'
+        rng = MagicMock()
+        rng.choice.return_value = TicTacToe.PLAYER_O
+
+        with patch('random.choice') as global_choice:
+            result = Player.choose_symbol(rng)
+
+        self.assertEqual(result, TicTacToe.PLAYER_O)
+        rng.choice.assert_called_once_with([TicTacToe.PLAYER_X, TicTacToe.PLAYER_O])
+        global_choice.assert_not_called()
+
+    @patch('random.Random.choice')
     @patch('builtins.print')
     @patch('builtins.input')
     def test_choose_symbol_random_can_return_either_symbol(self, mock_input, mock_print, mock_random):
@@ -147,7 +168,7 @@ class TestPlayer(unittest.TestCase):
                 mock_input.return_value = input_value
                 
                 if i == 2:  # Random case
-                    with patch('random.choice', return_value=TicTacToe.PLAYER_X):
+                    with patch('random.Random.choice', return_value=TicTacToe.PLAYER_X):
                         result = Player.choose_symbol()
                         self.assertIn(result, [TicTacToe.PLAYER_X, TicTacToe.PLAYER_O])
                 else:
@@ -208,7 +229,7 @@ class TestPlayer(unittest.TestCase):
         self.assertTrue(hasattr(Player, 'choose_symbol'))
         self.assertTrue(callable(getattr(Player, 'choose_symbol')))
 
-    @patch('random.choice')
+    @patch('random.Random.choice')
     @patch('builtins.print')
     @patch('builtins.input')
     def test_choose_symbol_random_uses_correct_symbols(self, mock_input, mock_print, mock_random):
@@ -760,14 +781,17 @@ class TestAIPlayer(unittest.TestCase):
         empty_board = [TicTacToe.EMPTY] * 9
         
         # Mock random.uniform to return predictable value
-        with patch('random.uniform', return_value=1.5):
+        with patch('random.Random.uniform', return_value=1.5):
             move = ai.get_move(empty_board)
         
         # Verify thinking message was displayed
         mock_print.assert_called_with("AI opponent is thinking...")
         
-        # Verify sleep was called with the expected delay
-        mock_sleep.assert_called_once_with(1.5)
+        # Verify sleep only covered the part of the delay the search did not use
+        mock_sleep.assert_called_once()
+        remaining = mock_sleep.call_args[0][0]
+        self.assertLessEqual(remaining, 1.5)
+        self.assertGreater(remaining, 1.0)
         
         # Verify valid move was returned
         self.assertIsInstance(move, int)
@@ -793,20 +817,71 @@ class TestAIPlayer(unittest.TestCase):
         self.assertGreaterEqual(move, 1)
         self.assertLessEqual(move, 9)
     
-    @patch('random.uniform')
-    def test_simulate_thinking_delay_uses_random_timing(self, mock_uniform):
-        """Test _simulate_thinking_delay uses random timing between 0.5-2.0 seconds."""
+    @patch('random.Random.uniform')
+    def test_thinking_delay_uses_random_timing(self, mock_uniform):
+        """Test the thinking delay lasts a random 0.5-2.0 seconds from when it starts."""
         ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD)
         mock_uniform.return_value = 1.2
         
-        with patch('time.sleep') as mock_sleep, patch('builtins.print'):
-            ai._simulate_thinking_delay()
+        with patch('time.perf_counter', return_value=100.0), patch('builtins.print'):
+            deadline = ai._start_thinking_delay()
         
         # Verify random.uniform was called with correct range
         mock_uniform.assert_called_once_with(0.5, 2.0)
         
-        # Verify sleep was called with the random value
-        mock_sleep.assert_called_once_with(1.2)
+        # Verify the delay ends the random value after it started
+        self.assertEqual(deadline, 101.2)
+        with patch('time.perf_counter', return_value=100.5):
+            self.assertAlmostEqual(ai._remaining_delay(deadline), 0.7)
+        with patch('time.perf_counter', return_value=102.0):
+            self.assertEqual(ai._remaining_delay(deadline), 0.0)
+    
+    def test_thinking_delay_subtracts_search_time(self):
+        """Test a search that outlasts the delay returns without sleeping."""
+        ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, status_callback=lambda message: None)
+        
+        def slow_choice(board, available_moves):
+            time.sleep(0.05)
+            return available_moves[0]
+        
+        with patch('random.Random.uniform', return_value=0.01), \
+                patch.object(ai, '_choose_move', side_effect=slow_choice), \
+                patch('src.player.time.sleep', wraps=time.sleep) as mock_sleep:
+            ai.get_move([TicTacToe.EMPTY] * 9)
+        
+        # Only the simulated search slept
+        mock_sleep.assert_called_once_with(0.05)
+    
+    def test_get_move_async_awaits_the_delay(self):
+        """Test the awaitable variant searches off the event loop and sleeps asynchronously."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, status_callback=lambda message: None)
+        board = [TicTacToe.PLAYER_X] + [TicTacToe.EMPTY] * 8
+        
+        async def play():
+            with patch('random.Random.uniform', return_value=0.05), patch('time.sleep') as mock_sleep, \
+                    patch('asyncio.sleep', wraps=asyncio.sleep) as mock_async_sleep:
+                move = await ai.get_move_async(board)
+            mock_sleep.assert_not_called()
+            mock_async_sleep.assert_called_once()
+            return move
+        
+        self.assertEqual(asyncio.run(play()), 5)
+        self.assertEqual(board, [TicTacToe.PLAYER_X] + [TicTacToe.EMPTY] * 8)
+        with self.assertRaises(ValueError):
+            asyncio.run(ai.get_move_async([TicTacToe.PLAYER_X] * 9))
+    
+    def test_get_move_async_rejects_process_pools(self):
+        """Test executors other than thread pools are rejected before any work is submitted."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False)
+        board = [TicTacToe.PLAYER_X] + [TicTacToe.EMPTY] * 8
+        executor = MagicMock(spec=ProcessPoolExecutor)
+        
+        with self.assertRaises(ValueError):
+            asyncio.run(ai.get_move_async(board, executor))
+        executor.submit.assert_not_called()
+        
+        with ThreadPoolExecutor(max_workers=1) as threads:
+            self.assertEqual(asyncio.run(ai.get_move_async(board, threads)), 5)
     
     def test_ai_enable_delay_parameter_default_true(self):
         """Test enable_delay parameter defaults to True."""
@@ -818,6 +893,755 @@ class TestAIPlayer(unittest.TestCase):
         ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.MEDIUM, enable_delay=False)
         self.assertFalse(ai.enable_delay, "enable_delay should be False when explicitly set")
 
+    def test_alpha_beta_enabled_by_default(self):
+        """Test alpha-beta pruning is on unless explicitly disabled."""
+        self.assertTrue(AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD).use_alpha_beta)
+        self.assertFalse(AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD,
+                                  use_alpha_beta=False).use_alpha_beta)
+
+    def test_alpha_beta_finds_same_best_moves_as_plain_minimax(self):
+        """Test pruning returns exactly the same set of optimal moves as plain minimax."""
+        rng = random.Random(42)
+
+        for _ in range(25):
+            game = TicTacToe()
+            for position in rng.sample(range(1, 10), rng.randint(2, 5)):
+                if game.get_game_state()['state'] != 'ongoing':
+                    break
+                game.make_move(position)
+            if game.get_game_state()['state'] != 'ongoing':
+                continue
+            board = game.board.copy()
+
+            with self.subTest(board=board):
+                pruned = AIPlayer(game.current_player, DifficultyLevel.HARD,
+                                  enable_delay=False)
+                plain = AIPlayer(game.current_player, DifficultyLevel.HARD,
+                                 enable_delay=False, use_alpha_beta=False,
+                                 transposition_table_size=0)
+                self.assertEqual(sorted(pruned._find_best_moves(board)),
+                                 sorted(plain._find_best_moves(board)))
+
+    def test_alpha_beta_visits_fewer_nodes(self):
+        """Test pruning searches far fewer nodes than plain minimax."""
+        board = [TicTacToe.PLAYER_X] + [TicTacToe.EMPTY] * 8
+        pruned = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD,
+                          enable_delay=False, transposition_table_size=0)
+        plain = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD,
+                         enable_delay=False, use_alpha_beta=False,
+                         transposition_table_size=0)
+
+        pruned._find_best_moves(board)
+        plain._find_best_moves(board)
+
+        self.assertLess(pruned.nodes_searched * 5, plain.nodes_searched)
+
+    def test_minimax_fail_soft_bounds(self):
+        """Test _minimax returns valid bounds when the true score is outside the window."""
+        ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False)
+        # X to move in a drawn position
+        board = ['X', TicTacToe.EMPTY, TicTacToe.EMPTY,
+                 TicTacToe.EMPTY, 'O', TicTacToe.EMPTY,
+                 TicTacToe.EMPTY, TicTacToe.EMPTY, TicTacToe.EMPTY]
+
+        exact = ai._minimax(board, float('inf'), True)
+        upper_bound = ai._minimax(board, float('inf'), True, 5, float('inf'))
+        lower_bound = ai._minimax(board, float('inf'), True, float('-inf'), -5)
+
+        self.assertEqual(exact, 0)
+        self.assertTrue(exact <= upper_bound <= 5)
+        self.assertTrue(-5 <= lower_bound <= exact)
+
+    def test_transposition_table_created_with_configured_size(self):
+        """Test the transposition table honours its size cap and can be disabled."""
+        ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, transposition_table_size=500)
+        self.assertEqual(ai.transposition_table.max_entries, 500)
+
+        disabled = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, transposition_table_size=0)
+        self.assertIsNone(disabled.transposition_table)
+
+    def test_transposition_table_makes_repeat_searches_cache_hits(self):
+        """Test a warm table answers every root move without searching deeper."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False)
+        board = [TicTacToe.PLAYER_X] + [TicTacToe.EMPTY] * 8
+
+        first = ai._find_best_moves(board)
+        nodes_before = ai.nodes_searched
+        second = ai._find_best_moves(board)
+
+        self.assertEqual(sorted(first), sorted(second))
+        # One node per root move, each answered straight from the table
+        self.assertEqual(ai.nodes_searched - nodes_before, 8)
+
+    def test_transposition_table_persists_across_games(self):
+        """Test cached positions are reused when the same player starts a new game."""
+        ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False,
+                      use_lookup_table=False)
+        board = [TicTacToe.EMPTY, TicTacToe.PLAYER_O, TicTacToe.EMPTY,
+                 TicTacToe.EMPTY, TicTacToe.PLAYER_X, TicTacToe.EMPTY,
+                 TicTacToe.EMPTY, TicTacToe.EMPTY, TicTacToe.EMPTY]
+
+        ai.get_move(board)
+        cached_positions = len(ai.transposition_table)
+        hits_before = ai.transposition_table.hits
+        ai.get_move(board)
+
+        self.assertGreater(cached_positions, 0)
+        self.assertGreater(ai.transposition_table.hits, hits_before)
+
+    def test_transposition_table_keeps_best_moves_unchanged(self):
+        """Test cached search returns the same optimal moves as an uncached search."""
+        cached = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False)
+        uncached = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False,
+                            transposition_table_size=0)
+        boards = [
+            ['X', 'O', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
+            ['X', ' ', ' ', ' ', 'O', ' ', ' ', ' ', ' '],
+            [' ', ' ', ' ', ' ', 'O', ' ', ' ', ' ', 'X'],
+            ['X', 'O', ' ', ' ', ' ', ' ', ' ', ' ', ' '],  # Repeated: answered from the warm table
+        ]
+
+        for board in boards:
+            with self.subTest(board=board):
+                self.assertEqual(sorted(cached._find_best_moves(board)),
+                                 sorted(uncached._find_best_moves(board)))
+
+    def test_lookup_table_answers_best_move_without_search(self):
+        """Test HARD moves come from the perfect-play table with no tree search."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False)
+        board = [TicTacToe.PLAYER_X] + [TicTacToe.EMPTY] * 8
+
+        move = ai._get_best_move_minimax(board)
+
+        self.assertEqual(move, 5, "Only the center draws against a corner opening")
+        self.assertEqual(ai.nodes_searched, 0)
+
+    def test_lookup_table_matches_search_best_moves(self):
+        """Test the table returns the same optimal move sets as a full search."""
+        # An even number of moves leaves X to play
+        searching = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False,
+                             use_lookup_table=False)
+        rng = random.Random(7)
+
+        for _ in range(30):
+            game = TicTacToe()
+            for _ in range(rng.choice([0, 2, 4, 6])):
+                if game.get_game_state()['state'] != 'ongoing':
+                    break
+                game.make_move(rng.choice([p for p in range(1, 10) if game.is_valid_move(p)]))
+            if game.get_game_state()['state'] != 'ongoing':
+                continue
+
+            with self.subTest(board=game.board):
+                self.assertEqual(
+                    sorted(perfect_play_table.default_table.best_moves(game.board, TicTacToe.PLAYER_X)),
+                    sorted(searching._find_best_moves(game.board)))
+
+    def test_lookup_table_can_be_disabled(self):
+        """Test disabling the table falls back to minimax search."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      use_lookup_table=False)
+        board = [TicTacToe.PLAYER_X] + [TicTacToe.EMPTY] * 8
+
+        self.assertEqual(ai._get_best_move_minimax(board), 5)
+        self.assertGreater(ai.nodes_searched, 0)
+
+    def test_opening_book_answers_larger_board_without_search(self):
+        """Test opening moves on a 4x4 board come from the shipped book with no search."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      board_size=4, node_budget=5000)
+        board = [TicTacToe.EMPTY] * 16
+        board[0] = TicTacToe.PLAYER_X
+
+        move = ai._get_best_move_minimax(board)
+
+        self.assertIn(move, ai.opening_book.best_moves(board, TicTacToe.PLAYER_O))
+        self.assertEqual(ai.nodes_searched, 0)
+
+    def test_opening_book_can_be_disabled(self):
+        """Test disabling the book, or playing the 3x3 game, leaves no book to consult."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      board_size=4, node_budget=500, use_opening_book=False)
+        board = [TicTacToe.EMPTY] * 16
+        board[0] = TicTacToe.PLAYER_X
+
+        self.assertIsNone(ai.opening_book)
+        self.assertEqual(board[ai._get_best_move_minimax(board) - 1], TicTacToe.EMPTY)
+        self.assertGreater(ai.nodes_searched, 0)
+        self.assertIsNone(AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD).opening_book)
+
+    def test_players_get_their_own_generator(self):
+        """Test players without an injected generator get a private one, and ints are seeds."""
+        players = [AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.EASY), MCTSPlayer(TicTacToe.PLAYER_X),
+                   HumanPlayer(TicTacToe.PLAYER_X), HumanPlayer(TicTacToe.PLAYER_O)]
+        for player in players:
+            with self.subTest(player=type(player).__name__):
+                self.assertIsInstance(player.rng, random.Random)
+        self.assertEqual(len({id(player.rng) for player in players}), len(players))
+
+        seeded = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.EASY, rng=23)
+        self.assertEqual(seeded.rng.random(), random.Random(23).random())
+        rng = random.Random(5)
+        self.assertIs(MCTSPlayer(TicTacToe.PLAYER_O, rng=rng).rng, rng)
+
+    def test_seeded_rng_replays_the_same_games(self):
+        """Test players seeded alike make the same moves without touching the global generator."""
+        def play(seed):
+            rng = random.Random(seed)
+            players = {TicTacToe.PLAYER_X: AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.EASY,
+                                                    enable_delay=False, rng=rng),
+                       TicTacToe.PLAYER_O: MCTSPlayer(TicTacToe.PLAYER_O, playouts=50, rng=rng)}
+            games = []
+            for _ in range(5):
+                game = TicTacToe()
+                while game.get_game_state()['state'] == 'ongoing':
+                    game.make_move(players[game.current_player].get_move(game.board))
+                games.append(game.board)
+            return games
+
+        global_state = random.getstate()
+        first = play(23)
+        self.assertEqual(random.getstate(), global_state)
+        self.assertEqual(play(23), first)
+        self.assertNotEqual(play(24), first)
+
+    def test_thinking_delay_uses_injected_rng(self):
+        """Test the simulated delay is drawn from the player's generator."""
+        rng = MagicMock()
+        rng.uniform.return_value = 0.75
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, status_callback=lambda message: None,
+                      rng=rng)
+
+        with patch('time.perf_counter', return_value=10.0):
+            deadline = ai._start_thinking_delay()
+
+        rng.uniform.assert_called_once_with(0.5, 2.0)
+        self.assertEqual(deadline, 10.75)
+
+    def test_tablebase_scores_endgames_without_expanding_them(self):
+        """Test probing the tablebase keeps the best moves and searches fewer nodes."""
+        tablebase = build_tablebase(4, max_empties=1)
+        board = [TicTacToe.PLAYER_X, TicTacToe.PLAYER_O, TicTacToe.PLAYER_X, TicTacToe.PLAYER_O,
+                 TicTacToe.PLAYER_O, TicTacToe.PLAYER_X, TicTacToe.PLAYER_O, TicTacToe.PLAYER_X,
+                 TicTacToe.PLAYER_X, TicTacToe.PLAYER_X, TicTacToe.PLAYER_O, TicTacToe.PLAYER_O] + \
+                [TicTacToe.EMPTY] * 4
+        plain = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False, board_size=4)
+        probing = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False, board_size=4,
+                           tablebase=tablebase)
+
+        self.assertIs(probing.tablebase, tablebase)
+        self.assertEqual(sorted(probing._find_best_moves(board)), sorted(plain._find_best_moves(board)))
+        self.assertLess(probing.nodes_searched, plain.nodes_searched)
+
+    def test_tablebase_must_match_board_configuration(self):
+        """Test a tablebase built for another board is rejected."""
+        with self.assertRaises(ValueError):
+            AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, tablebase=build_tablebase(4, max_empties=0))
+        self.assertIsNone(AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD).tablebase)
+
+    def test_transposition_table_shares_entries_between_symmetric_positions(self):
+        """Test a rotated position is answered from the entry of the original."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      use_lookup_table=False)
+        corner_top_left = [TicTacToe.PLAYER_X] + [TicTacToe.EMPTY] * 8
+        corner_bottom_right = [TicTacToe.EMPTY] * 8 + [TicTacToe.PLAYER_X]
+
+        ai._find_best_moves(corner_top_left)
+        cold_nodes = ai.nodes_searched
+
+        # Every reply to the rotated opening already has an entry
+        for position in range(8):
+            child = corner_bottom_right.copy()
+            child[position] = TicTacToe.PLAYER_O
+            self.assertIn(ai._position_key(child, False), ai.transposition_table)
+
+        best = ai._find_best_moves(corner_bottom_right)
+
+        self.assertEqual(best, [5])
+        self.assertLess(ai.nodes_searched - cold_nodes, cold_nodes)
+
+    def test_search_restores_board_after_make_unmake(self):
+        """Test in-place make/unmake leaves the searched board exactly as it was."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      use_lookup_table=False, transposition_table_size=0)
+        board = [TicTacToe.PLAYER_X, TicTacToe.EMPTY, TicTacToe.EMPTY,
+                 TicTacToe.EMPTY, TicTacToe.PLAYER_O, TicTacToe.EMPTY,
+                 TicTacToe.EMPTY, TicTacToe.EMPTY, TicTacToe.PLAYER_X]
+        original = board.copy()
+
+        ai._minimax(board, float('inf'), True)
+        self.assertEqual(board, original)
+        ai._minimax(board, 2, False)
+        self.assertEqual(board, original)
+
+    def test_get_move_does_not_modify_game_board(self):
+        """Test the AI searches a private copy, not the caller's board."""
+        game = TicTacToe()
+        game.make_move(1)
+        for difficulty in DifficultyLevel:
+            with self.subTest(difficulty=difficulty):
+                ai = AIPlayer(TicTacToe.PLAYER_O, difficulty, enable_delay=False,
+                              use_lookup_table=False)
+                ai.get_move(game.board)
+                self.assertEqual(game.board, [TicTacToe.PLAYER_X] + [TicTacToe.EMPTY] * 8)
+                self.assertFalse(game.board.dirty)
+
+    def test_concurrent_searches_on_shared_player(self):
+        """Test one player can search different positions from several threads at once."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      use_lookup_table=False, transposition_table_size=500)
+        boards = []
+        for first in range(9):
+            board = [TicTacToe.EMPTY] * 9
+            board[first] = TicTacToe.PLAYER_X
+            boards.append(board)
+        reference = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                             use_lookup_table=False, transposition_table_size=0)
+        expected = [sorted(reference._find_best_moves(board)) for board in boards]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(ai._find_best_moves, boards * 3))
+
+        self.assertEqual([sorted(moves) for moves in results], expected * 3)
+
+    def test_search_budgets_must_be_positive(self):
+        """Test zero or negative budgets are rejected."""
+        with self.assertRaises(ValueError):
+            AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, time_budget=0)
+        with self.assertRaises(ValueError):
+            AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, node_budget=0)
+        with self.assertRaises(ValueError):
+            AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, board_size=3, win_length=4)
+
+    def test_iterative_deepening_agrees_with_full_search(self):
+        """Test a generous budget finds only moves that full search also rates best."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      use_lookup_table=False, node_budget=10 ** 6)
+        rng = random.Random(15)
+        for _ in range(20):
+            board = [TicTacToe.EMPTY] * 9
+            for index in rng.sample(range(9), 3):
+                board[index] = TicTacToe.PLAYER_X
+            board[rng.choice([i for i in range(9) if board[i] == TicTacToe.EMPTY])] = TicTacToe.PLAYER_O
+            board[rng.choice([i for i in range(9) if board[i] == TicTacToe.EMPTY])] = TicTacToe.PLAYER_O
+            if board_winner(board) is not None:
+                continue
+            with self.subTest(board=board):
+                deepened = ai._iterative_deepening(board)
+                self.assertTrue(set(deepened) <= set(ai._find_best_moves(board)))
+                self.assertGreater(ai.last_search_depth, 0)
+
+    def test_iterative_deepening_completes_drawn_position(self):
+        """Test a drawn position is searched to the end and matches full search."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      use_lookup_table=False, time_budget=10.0)
+        board = [TicTacToe.PLAYER_X] + [TicTacToe.EMPTY] * 8
+
+        self.assertEqual(ai._iterative_deepening(board), [5])
+        self.assertEqual(ai.last_search_depth, 8)
+
+    def test_node_budget_stops_search(self):
+        """Test the search stops at the node budget and still returns a legal move."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      node_budget=200, board_size=4, use_opening_book=False)
+        board = [TicTacToe.PLAYER_X] + [TicTacToe.EMPTY] * 15
+        original = board.copy()
+
+        move = ai.get_move(board)
+
+        self.assertIn(move, range(2, 17))
+        self.assertLessEqual(ai.nodes_searched, 201)
+        self.assertGreater(ai.last_search_depth, 0)
+        self.assertEqual(board, original)
+
+    def test_time_budget_bounds_move_latency(self):
+        """Test a move on a large board is returned close to the time budget."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      time_budget=0.05, board_size=7, win_length=4)
+        board = [TicTacToe.EMPTY] * 49
+        board[24] = TicTacToe.PLAYER_X
+
+        start = time.perf_counter()
+        move = ai.get_move(board)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(board[move - 1], TicTacToe.EMPTY)
+        self.assertLess(elapsed, 0.5)
+        self.assertIsNone(ai._active_budget.budget)
+
+    def test_budget_applies_to_suboptimal_moves(self):
+        """Test the depth-2 suboptimal search also honours the node budget."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.EASY, enable_delay=False,
+                      node_budget=30, board_size=5, win_length=4)
+        board = [TicTacToe.EMPTY] * 25
+        board[12] = TicTacToe.PLAYER_X
+        available = [i + 1 for i in range(25) if board[i] == TicTacToe.EMPTY]
+
+        move = ai._get_reasonable_suboptimal_move(board, available)
+
+        self.assertIn(move, available)
+        self.assertLessEqual(ai.nodes_searched, 31)
+
+    def test_larger_board_wins_and_blocks(self):
+        """Test the early win/block checks use the configured board geometry."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      node_budget=5000, board_size=4)
+        x, o, e = TicTacToe.PLAYER_X, TicTacToe.PLAYER_O, TicTacToe.EMPTY
+        winning = [o, o, o, e,
+                   x, x, x, e,
+                   e, e, e, e,
+                   x, e, e, e]
+        blocking = [x, x, x, e,
+                    o, e, e, e,
+                    o, e, e, e,
+                    e, e, e, e]
+
+        self.assertEqual(ai.get_move(winning), 4)
+        self.assertEqual(ai.get_move(blocking), 4)
+        with self.assertRaises(ValueError):
+            ai.get_move([e] * 9)
+
+    def test_larger_board_search_finds_forced_win(self):
+        """Test the budgeted search on a 4x4, three-in-a-row board finds a winning fork."""
+        ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False,
+                      node_budget=20000, board_size=4, win_length=3)
+        x, o, e = TicTacToe.PLAYER_X, TicTacToe.PLAYER_O, TicTacToe.EMPTY
+        # X at 6 and 11 with O far away: X can set up two threats at once
+        board = [o, e, e, e,
+                 e, x, e, e,
+                 e, e, x, e,
+                 e, e, e, o]
+
+        moves = ai._iterative_deepening(board)
+
+        # Each fork wins on X's next move whatever O does; nothing deeper is searched
+        self.assertEqual(moves, [3, 7, 8, 9, 10, 14])
+        self.assertEqual(ai.last_search_depth, 3)
+
+    def test_negamax_agrees_with_minimax_from_both_sides(self):
+        """Test the negamax core scores positions as minimax does, negated for the opponent."""
+        ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False)
+        rng = random.Random(19)
+        for _ in range(25):
+            game = TicTacToe()
+            for _ in range(rng.randrange(6)):
+                if game.get_game_state()['state'] != 'ongoing':
+                    break
+                game.make_move(rng.choice([p for p in range(1, 10) if game.is_valid_move(p)]))
+            board = list(game.board)
+            side = game.current_player
+
+            with self.subTest(board=board):
+                score = ai._negamax(board, UNLIMITED_DEPTH, side)
+                self.assertIsInstance(score, int)
+                expected = ai._minimax(board, float('inf'), side == ai.symbol)
+                self.assertEqual(score if side == ai.symbol else -score, expected)
+                self.assertEqual(board, list(game.board))
+
+    def test_negamax_depth_bonus_only_for_limited_depth(self):
+        """Test wins score exactly 10 when unlimited and 10 plus remaining depth otherwise."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      transposition_table_size=0)
+        x, o, e = TicTacToe.PLAYER_X, TicTacToe.PLAYER_O, TicTacToe.EMPTY
+        # O to move completes the middle row
+        board = [x, x, e,
+                 o, o, e,
+                 x, e, e]
+
+        self.assertEqual(ai._negamax(board, UNLIMITED_DEPTH, o), 10)
+        self.assertEqual(ai._negamax(board, 3, o), 12)
+        self.assertEqual(ai._negamax(board, 3, x), 12)  # X to move wins at position 3 first
+        self.assertEqual(ai._search_root(board, UNLIMITED_DEPTH), (10, [6]))
+
+    def test_search_root_on_full_board_has_no_moves(self):
+        """Test the root search reports the integer floor and no moves on a full board."""
+        ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False)
+        full = ['X', 'O', 'X', 'X', 'O', 'O', 'O', 'X', 'X']
+        self.assertEqual(ai._search_root(full, UNLIMITED_DEPTH), (-SCORE_BOUND, []))
+
+    def test_evaluate_position_scores_from_ai_perspective(self):
+        """Test the depth-limit heuristic prefers the AI's stronger positions."""
+        x_ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.EASY, enable_delay=False)
+        o_ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.EASY, enable_delay=False)
+        board = [TicTacToe.EMPTY] * 9
+        board[4] = TicTacToe.PLAYER_X
+
+        self.assertGreater(x_ai._evaluate_position(board), 0)
+        self.assertEqual(o_ai._evaluate_position(board), -x_ai._evaluate_position(board))
+
+    def test_depth_limited_search_distinguishes_moves(self):
+        """Test the depth-2 suboptimal search ranks center over corners over edges."""
+        ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.EASY, enable_delay=False)
+        board = [TicTacToe.EMPTY] * 9
+        scores = {}
+        for position in (5, 1, 2):
+            board[position - 1] = TicTacToe.PLAYER_X
+            scores[position] = -ai._negamax(board, 2, TicTacToe.PLAYER_O)
+            board[position - 1] = TicTacToe.EMPTY
+
+        self.assertGreater(scores[5], scores[1])
+        self.assertGreater(scores[1], scores[2])
+        for _ in range(20):
+            self.assertIn(ai._get_reasonable_suboptimal_move(board, list(range(1, 10))), [1, 3, 5, 7, 9])
+
+    def test_move_ordering_must_be_enum(self):
+        """Test an invalid move ordering is rejected."""
+        with self.assertRaises(TypeError):
+            AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, move_ordering="static")
+        self.assertIs(AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD).move_ordering,
+                      MoveOrdering.DYNAMIC)
+
+    def test_static_order_is_center_corners_edges(self):
+        """Test the static priority tries cells on the most lines first."""
+        ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, move_ordering=MoveOrdering.STATIC)
+        self.assertEqual(list(ai._move_order()), [4, 0, 2, 6, 8, 1, 3, 5, 7])
+
+        large = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, board_size=4)
+        self.assertEqual(set(large._move_order()[:4]), {5, 6, 9, 10})
+
+    def test_every_move_ordering_finds_same_best_moves(self):
+        """Test ordering changes how much is pruned, never which moves are optimal."""
+        x, o, e = TicTacToe.PLAYER_X, TicTacToe.PLAYER_O, TicTacToe.EMPTY
+        positions = [
+            (3, 3, [x, e, e, e, o, e, e, e, e], UNLIMITED_DEPTH),
+            (3, 3, [o, x, e, e, x, e, e, e, e], UNLIMITED_DEPTH),
+            (4, 3, [o, e, e, e, e, x, e, e, e, e, x, e, e, e, e, o], 3),
+        ]
+        for size, win_length, board, depth in positions:
+            results = {}
+            for ordering in MoveOrdering:
+                ai = AIPlayer(x, DifficultyLevel.HARD, enable_delay=False, board_size=size,
+                              win_length=win_length, move_ordering=ordering)
+                results[ordering] = ai._search_root(board, depth)
+            with self.subTest(board=board):
+                self.assertEqual(len(set(map(str, results.values()))), 1, results)
+
+    def test_move_ordering_reduces_nodes_searched(self):
+        """Test static and dynamic ordering prune more than board order."""
+        board = [TicTacToe.EMPTY] * 9
+        nodes = {}
+        for ordering in MoveOrdering:
+            ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False,
+                          transposition_table_size=0, move_ordering=ordering)
+            ai._search_root(board, UNLIMITED_DEPTH)
+            nodes[ordering] = ai.nodes_searched
+
+        self.assertLess(nodes[MoveOrdering.STATIC], nodes[MoveOrdering.INDEX])
+        self.assertLess(nodes[MoveOrdering.DYNAMIC], nodes[MoveOrdering.STATIC])
+        self.assertLess(nodes[MoveOrdering.HISTORY], nodes[MoveOrdering.INDEX])
+
+    def test_transposition_table_stores_best_move_in_canonical_coordinates(self):
+        """Test the stored move maps back to the winning cell of a rotated position."""
+        ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False)
+        x, o, e = TicTacToe.PLAYER_X, TicTacToe.PLAYER_O, TicTacToe.EMPTY
+        # X to move and win at index 8; the board is not in canonical form
+        board = [o, e, e,
+                 o, e, x,
+                 e, e, x]
+
+        ai._minimax(board, float('inf'), True)
+        key, transform = ai._table_slot(board, TicTacToe.PLAYER_X)
+        stored = ai.transposition_table.get(key).best_move
+
+        self.assertIsNotNone(transform)
+        self.assertEqual(SYMMETRIES[transform][stored], 2)
+
+    def test_killer_moves_recorded_only_for_dynamic_ordering(self):
+        """Test cutoffs update the killer and history tables for dynamic orderings."""
+        board = [TicTacToe.PLAYER_X] + [TicTacToe.EMPTY] * 8
+        for ordering, expect_killers in ((MoveOrdering.STATIC, False), (MoveOrdering.HISTORY, True)):
+            ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                          transposition_table_size=0, move_ordering=ordering)
+            ai._search_root(board, UNLIMITED_DEPTH)
+            with self.subTest(ordering=ordering):
+                killers = [move for slot in ai._heuristics.killers for move in slot if move is not None]
+                history = sum(ai._heuristics.history[TicTacToe.PLAYER_X])
+                self.assertEqual(bool(killers), expect_killers)
+                self.assertEqual(history > 0, expect_killers)
+
+    def test_parallel_workers_must_be_positive(self):
+        """Test the worker count of the root-split search is validated."""
+        with self.assertRaises(ValueError):
+            AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, parallel_workers=0)
+
+    def test_parallel_root_split_matches_sequential_search(self):
+        """Test scoring root moves in worker processes finds the same best moves."""
+        x, o, e = TicTacToe.PLAYER_X, TicTacToe.PLAYER_O, TicTacToe.EMPTY
+        board = [x, e, e, x,
+                 e, o, e, e,
+                 e, e, x, e,
+                 o, e, e, o]
+        sequential = AIPlayer(x, DifficultyLevel.HARD, enable_delay=False, board_size=4)
+        parallel = AIPlayer(x, DifficultyLevel.HARD, enable_delay=False, board_size=4,
+                            parallel_workers=2)
+        self.addCleanup(parallel.close)
+
+        self.assertEqual(parallel._search_root(board, UNLIMITED_DEPTH),
+                         sequential._search_root(board, UNLIMITED_DEPTH))
+        self.assertGreater(parallel.nodes_searched, 0)
+        self.assertEqual(board[0], x)
+
+    def test_parallel_search_honours_time_budget(self):
+        """Test budgeted iterative deepening still returns a move when split across workers."""
+        ai = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False,
+                      time_budget=0.5, board_size=5, win_length=4, parallel_workers=2)
+        self.addCleanup(ai.close)
+        board = [TicTacToe.EMPTY] * 25
+        board[12] = TicTacToe.PLAYER_X
+
+        move = ai.get_move(board)
+
+        self.assertEqual(board[move - 1], TicTacToe.EMPTY)
+        self.assertIsNone(ai._active_budget.budget)
+
+    def test_close_stops_worker_processes(self):
+        """Test close() shuts down the pool and a later search starts a new one."""
+        ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False,
+                      board_size=4, win_length=3, parallel_workers=2)
+        ai.close()  # Nothing started yet
+        board = [TicTacToe.EMPTY] * 16
+        board[5] = TicTacToe.PLAYER_X
+        board[0] = TicTacToe.PLAYER_O
+
+        ai._search_root(board, 2)
+        self.assertIsNotNone(ai._executor)
+        ai.close()
+        self.assertIsNone(ai._executor)
+        ai._search_root(board, 2)
+        ai.close()
+
+    def test_worker_pool_is_released_without_close(self):
+        """Test the context manager and garbage collection both shut the pool down."""
+        board = [TicTacToe.EMPTY] * 16
+        board[5] = TicTacToe.PLAYER_X
+        board[0] = TicTacToe.PLAYER_O
+
+        with AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False,
+                      board_size=4, win_length=3, parallel_workers=2) as ai:
+            ai._search_root(board, 2)
+            executor = ai._executor
+        self.assertIsNone(ai._executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(abs, -1)
+
+        ai = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False,
+                      board_size=4, win_length=3, parallel_workers=2)
+        ai._search_root(board, 2)
+        executor = ai._executor
+        finalizer = ai._executor_finalizer
+        del ai
+        gc.collect()
+        self.assertFalse(finalizer.alive)
+        with self.assertRaises(RuntimeError):
+            executor.submit(abs, -1)
+
+
+class TestMCTSPlayer(unittest.TestCase):
+    """Test cases for MCTSPlayer class"""
+
+    def setUp(self) -> None:
+        self.rng = random.Random(16)
+
+    def test_mcts_player_inherits_from_player(self) -> None:
+        """Test MCTSPlayer is a Player with the given symbol."""
+        player = MCTSPlayer('O')
+        self.assertIsInstance(player, Player)
+        self.assertEqual(player.symbol, 'O')
+        self.assertEqual((player.playouts, player.time_budget), (1000, None))
+
+    def test_invalid_configuration_raises_error(self) -> None:
+        """Test budgets and board geometry are validated."""
+        with self.assertRaises(ValueError):
+            MCTSPlayer('X', playouts=None)
+        with self.assertRaises(ValueError):
+            MCTSPlayer('X', playouts=0)
+        with self.assertRaises(ValueError):
+            MCTSPlayer('X', time_budget=0)
+        with self.assertRaises(ValueError):
+            MCTSPlayer('X', board_size=3, win_length=4)
+        with self.assertRaises(ValueError):
+            MCTSPlayer('Z')
+
+    def test_get_move_rejects_bad_boards(self) -> None:
+        """Test wrong-sized and full boards are rejected."""
+        player = MCTSPlayer('X', playouts=10)
+        with self.assertRaises(ValueError):
+            player.get_move([' '] * 8)
+        with self.assertRaises(ValueError):
+            player.get_move(['X', 'O', 'X', 'X', 'O', 'O', 'O', 'X', 'X'])
+
+    def test_takes_winning_move(self) -> None:
+        """Test the player completes its own line."""
+        player = MCTSPlayer('X', playouts=500, rng=self.rng)
+        self.assertEqual(player.get_move(['X', 'X', ' ', 'O', 'O', ' ', ' ', ' ', ' ']), 3)
+
+    def test_blocks_opponent_win(self) -> None:
+        """Test the player blocks a line the opponent is about to complete."""
+        player = MCTSPlayer('O', playouts=1000, rng=self.rng)
+        self.assertEqual(player.get_move(['X', 'X', ' ', ' ', 'O', ' ', ' ', ' ', ' ']), 3)
+
+    def test_runs_requested_playouts_and_leaves_board_unchanged(self) -> None:
+        """Test the playout budget is honored and the caller's board is not touched."""
+        player = MCTSPlayer('O', playouts=300, rng=self.rng)
+        board = ['X', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ']
+        move = player.get_move(board)
+        self.assertEqual(player.last_playouts, 300)
+        self.assertEqual(board, ['X', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '])
+        self.assertEqual(board[move - 1], ' ')
+
+    def test_time_budget_limits_search(self) -> None:
+        """Test a time budget alone bounds the search time."""
+        player = MCTSPlayer('X', playouts=None, time_budget=0.05, board_size=7, win_length=4)
+        start = time.perf_counter()
+        move = player.get_move([' '] * 49)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertTrue(1 <= move <= 49)
+        self.assertGreater(player.last_playouts, 0)
+
+    def test_reuses_tree_after_opponent_reply(self) -> None:
+        """Test the explored subtree is kept when the opponent plays an expected move."""
+        player = MCTSPlayer('X', playouts=2000, rng=self.rng)
+        board = [' '] * 9
+        move = player.get_move(board)
+        self.assertEqual(player.last_reused_visits, 0)
+
+        board[move - 1] = 'X'
+        reply = next(index for index, cell in enumerate(board) if cell == ' ')
+        board[reply] = 'O'
+        player.get_move(board)
+        self.assertGreater(player.last_reused_visits, 0)
+
+    def test_unrelated_position_rebuilds_tree(self) -> None:
+        """Test a position that does not follow the last move starts a fresh tree."""
+        player = MCTSPlayer('X', playouts=200, rng=self.rng)
+        player.get_move([' '] * 9)
+        player.get_move(['O', 'O', 'X', ' ', 'X', ' ', ' ', ' ', ' '])
+        self.assertEqual(player.last_reused_visits, 0)
+
+    def test_never_loses_to_hard_ai(self) -> None:
+        """Test MCTS holds the perfect-play AI to draws from either side."""
+        for mcts_symbol in ('X', 'O'):
+            with self.subTest(mcts=mcts_symbol):
+                mcts = MCTSPlayer(mcts_symbol, playouts=1000, rng=self.rng)
+                hard = AIPlayer('O' if mcts_symbol == 'X' else 'X', DifficultyLevel.HARD, enable_delay=False,
+                                rng=self.rng)
+                players = {mcts_symbol: mcts, hard.symbol: hard}
+                for _ in range(3):
+                    game = TicTacToe()
+                    while game.get_game_state()['state'] == 'ongoing':
+                        game.make_move(players[game.current_player].get_move(game.board))
+                    self.assertNotEqual(game.check_winner(), hard.symbol)
+
+    def test_finds_win_on_larger_board(self) -> None:
+        """Test the player completes a line on a generalized board."""
+        player = MCTSPlayer('X', playouts=400, board_size=4, rng=self.rng)
+        board = ['X', 'X', 'X', ' ',
+                 'O', 'O', 'O', ' ',
+                 ' ', ' ', ' ', ' ',
+                 ' ', ' ', ' ', ' ']
+        self.assertEqual(player.get_move(board), 4)
+
+
 class TestDifficultyLevel(unittest.TestCase):
     """Test cases for DifficultyLevel enum"""
 
@@ -0,0 +1,116 @@
+import random
+import unittest
+
+from src.position_evaluator import (PositionEvaluator, WIN_NEXT_MOVE, LOST_TO_FORK,
+                                    POSITIONAL_LIMIT, _classic_scores)
+from src.tic_tac_toe import TicTacToe, BOARD_CODE_COUNT
+
+X, O, E = TicTacToe.PLAYER_X, TicTacToe.PLAYER_O, TicTacToe.EMPTY
+
+
+class TestPositionEvaluator(unittest.TestCase):
+    """Test cases for PositionEvaluator"""
+
+    def setUp(self) -> None:
+        self.evaluator = PositionEvaluator()
+
+    def test_invalid_geometry_raises_error(self) -> None:
+        """Test impossible board configurations are rejected."""
+        with self.assertRaises(ValueError):
+            PositionEvaluator(3, 4)
+        with self.assertRaises(ValueError):
+            PositionEvaluator(0)
+
+    def test_empty_board_is_even(self) -> None:
+        """Test the empty board scores zero for both players."""
+        self.assertEqual(self.evaluator.evaluate([E] * 9, X), 0)
+        self.assertEqual(self.evaluator.evaluate([E] * 9, O), 0)
+
+    def test_scores_are_negated_for_the_opponent(self) -> None:
+        """Test a position scores the same for one player as minus the other."""
+        rng = random.Random(20)
+        for _ in range(200):
+            board = [rng.choice((X, O, E)) for _ in range(9)]
+            with self.subTest(board=board):
+                self.assertEqual(self.evaluator.evaluate(board, X), -self.evaluator.evaluate(board, O))
+
+    def test_center_beats_corner_beats_edge(self) -> None:
+        """Test center and corner control are worth more than edges."""
+        center = [E, E, E, E, X, E, E, E, E]
+        corner = [X, E, E, E, E, E, E, E, E]
+        edge = [E, X, E, E, E, E, E, E, E]
+        scores = [self.evaluator.evaluate(board, X) for board in (center, corner, edge)]
+        self.assertGreater(scores[0], scores[1])
+        self.assertGreater(scores[1], scores[2])
+
+        # Against a center opening, a corner reply stands better than an edge
+        corner_reply = [O, E, E, E, X, E, E, E, E]
+        edge_reply = [E, O, E, E, X, E, E, E, E]
+        self.assertGreater(self.evaluator.evaluate(corner_reply, O),
+                           self.evaluator.evaluate(edge_reply, O))
+
+    def test_threat_for_side_to_move_scores_just_below_win(self) -> None:
+        """Test a player to move with a threat is scored as winning next move."""
+        board = [X, X, E,
+                 O, O, E,
+                 E, E, E]  # X to move completes the top row
+        self.assertEqual(self.evaluator.evaluate(board, X), WIN_NEXT_MOVE)
+        self.assertEqual(self.evaluator.evaluate(board, O), -WIN_NEXT_MOVE)
+
+    def test_fork_against_side_to_move(self) -> None:
+        """Test two threats on different cells are scored as a lost position for the blocker."""
+        board = [X, E, X,
+                 E, O, E,
+                 X, E, O]  # O to move, X threatens 2 and 4
+        self.assertEqual(self.evaluator.evaluate(board, O), -LOST_TO_FORK)
+
+        single = [X, E, X,
+                  E, O, E,
+                  E, E, E]  # One threat only: O can block it
+        self.assertLess(abs(self.evaluator.evaluate(single, O)), LOST_TO_FORK)
+
+    def test_scores_never_reach_a_win(self) -> None:
+        """Test every 3x3 score lies strictly inside the range of proven results."""
+        table = _classic_scores()
+        self.assertEqual(len(table), BOARD_CODE_COUNT)
+        self.assertLessEqual(max(table), WIN_NEXT_MOVE)
+        self.assertGreaterEqual(min(table), -WIN_NEXT_MOVE)
+
+    def test_table_matches_direct_computation(self) -> None:
+        """Test the precomputed 3x3 table agrees with scoring the board directly."""
+        rng = random.Random(3)
+        for _ in range(300):
+            board = [rng.choice((X, O, E)) for _ in range(9)]
+            with self.subTest(board=board):
+                self.assertEqual(self.evaluator.evaluate(board, X), self.evaluator._score_for_x(board))
+
+    def test_evaluate_many_matches_evaluate(self) -> None:
+        """Test batch evaluation returns the same scores as one-by-one evaluation."""
+        rng = random.Random(5)
+        for evaluator, cells in ((self.evaluator, 9), (PositionEvaluator(5, 4), 25)):
+            boards = [[rng.choice((X, O, E)) for _ in range(cells)] for _ in range(50)]
+            for symbol in (X, O):
+                with self.subTest(size=evaluator.size, symbol=symbol):
+                    self.assertEqual(evaluator.evaluate_many(boards, symbol),
+                                     [evaluator.evaluate(board, symbol) for board in boards])
+        self.assertEqual(self.evaluator.evaluate_many([], X), [])
+
+    def test_larger_board_scores(self) -> None:
+        """Test open lines and threats are read from the configured geometry."""
+        evaluator = PositionEvaluator(7, 4)
+        board = [E] * 49
+        board[24] = X
+        board[0] = O
+        center_score = evaluator.evaluate(board, X)
+        self.assertGreater(center_score, 0)
+        self.assertLessEqual(center_score, POSITIONAL_LIMIT)
+
+        board[25] = X
+        board[1] = O
+        board[26] = X
+        board[2] = O  # X to move with an open three: a threat on either end
+        self.assertEqual(evaluator.evaluate(board, X), WIN_NEXT_MOVE)
+
+
+if __name__ == '__main__':
+    unittest.main()
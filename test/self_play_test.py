@@ -0,0 +1,119 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from src.self_play import play_game, run_self_play, new_session_stats, record_game_result, main
+from src.player import Player, AIPlayer, DifficultyLevel
+from src.tic_tac_toe import TicTacToe
+
+
+class ScriptedPlayer(Player):
+    """Player that replays a fixed list of moves."""
+
+    def __init__(self, symbol: str, moves):
+        super().__init__(symbol)
+        self.moves = list(moves)
+
+    def get_move(self, board):
+        return self.moves.pop(0)
+
+
+class TestSelfPlay(unittest.TestCase):
+    """Test cases for the headless self-play runner"""
+
+    def test_play_game_returns_final_state(self) -> None:
+        """Test a scripted game ends with X winning the left column."""
+        player_x = ScriptedPlayer(TicTacToe.PLAYER_X, [1, 4, 7])
+        player_o = ScriptedPlayer(TicTacToe.PLAYER_O, [2, 5])
+
+        result = play_game(player_x, player_o)
+
+        self.assertEqual(result, {'state': 'won', 'winner': 'X'})
+
+    def test_play_game_works_with_list_engine(self) -> None:
+        """Test any TicTacToe engine can be plugged in."""
+        player_x = ScriptedPlayer(TicTacToe.PLAYER_X, [1, 2, 4])
+        player_o = ScriptedPlayer(TicTacToe.PLAYER_O, [3, 5, 7])
+
+        result = play_game(player_x, player_o, engine_factory=TicTacToe)
+
+        self.assertEqual(result, {'state': 'won', 'winner': 'O'})
+
+    def test_play_game_propagates_invalid_moves(self) -> None:
+        """Test a player returning an occupied square raises ValueError."""
+        player_x = ScriptedPlayer(TicTacToe.PLAYER_X, [1, 1])
+        player_o = ScriptedPlayer(TicTacToe.PLAYER_O, [1])
+
+        with self.assertRaises(ValueError):
+            play_game(player_x, player_o)
+
+    def test_run_self_play_hard_vs_hard_always_draws(self) -> None:
+        """Test two perfect players draw every game."""
+        player_x = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False)
+        player_o = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False)
+
+        stats = run_self_play(player_x, player_o, 50)
+
+        self.assertEqual(stats, {'games_played': 50, 'x_wins': 0, 'o_wins': 0, 'draws': 50})
+
+    def test_run_self_play_results_have_session_stats_shape(self) -> None:
+        """Test aggregate results use the GameController.session_stats keys and add up."""
+        player_x = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.EASY, enable_delay=False)
+        player_o = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.EASY, enable_delay=False)
+
+        stats = run_self_play(player_x, player_o, 40)
+
+        self.assertEqual(set(stats), set(new_session_stats()))
+        self.assertEqual(stats['games_played'], 40)
+        self.assertEqual(stats['x_wins'] + stats['o_wins'] + stats['draws'], 40)
+
+    def test_run_self_play_makes_no_terminal_io(self) -> None:
+        """Test self-play never prints, prompts or sleeps."""
+        player_x = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.MEDIUM, enable_delay=False)
+        player_o = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.MEDIUM, enable_delay=False)
+
+        with patch('builtins.print') as mock_print, \
+                patch('builtins.input') as mock_input, \
+                patch('time.sleep') as mock_sleep:
+            run_self_play(player_x, player_o, 10)
+
+        mock_print.assert_not_called()
+        mock_input.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    def test_run_self_play_rejects_invalid_setup(self) -> None:
+        """Test delayed AI players, swapped symbols and negative counts are rejected."""
+        quick_x = AIPlayer(TicTacToe.PLAYER_X, DifficultyLevel.HARD, enable_delay=False)
+        quick_o = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD, enable_delay=False)
+        delayed_o = AIPlayer(TicTacToe.PLAYER_O, DifficultyLevel.HARD)
+
+        with self.assertRaises(ValueError):
+            run_self_play(quick_x, delayed_o, 1)
+        with self.assertRaises(ValueError):
+            run_self_play(quick_o, quick_x, 1)
+        with self.assertRaises(ValueError):
+            run_self_play(quick_x, quick_o, -1)
+
+    def test_record_game_result_counts_each_outcome(self) -> None:
+        """Test wins and draws are tallied like GameController._update_session_stats."""
+        stats = new_session_stats()
+
+        record_game_result(stats, {'state': 'won', 'winner': 'X'})
+        record_game_result(stats, {'state': 'won', 'winner': 'O'})
+        record_game_result(stats, {'state': 'draw', 'winner': None})
+
+        self.assertEqual(stats, {'games_played': 3, 'x_wins': 1, 'o_wins': 1, 'draws': 1})
+
+    def test_main_runs_requested_games(self) -> None:
+        """Test the CLI entry point plays the requested matchup and reports the totals."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            stats = main(['--games', '5', '--x', 'hard', '--o', 'hard', '--seed', '3'])
+
+        self.assertEqual(stats['draws'], 5)
+        self.assertIn("5 games", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
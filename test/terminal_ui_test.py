@@ -8,6 +8,7 @@ focusing on input validation, output verification, and edge cases.
 import unittest
 from unittest.mock import Mock, patch, call
 from io import StringIO
+import random
 import sys
 import os
 
@@ -371,7 +372,7 @@ class TestTerminalUIInputMethods(unittest.TestCase):
         self.assertIsNone(symbol)
     
     @patch('builtins.input')
-    @patch('random.choice')
+    @patch('random.Random.choice')
     @patch('sys.stdout', new_callable=StringIO)
     def test_get_player_symbol_random(self, mock_stdout, mock_choice, mock_input) -> None:
         """Test random symbol selection."""
@@ -390,6 +391,20 @@ class TestTerminalUIInputMethods(unittest.TestCase):
         output = mock_stdout.getvalue()
         self.assertIn("Random choice: You are player X", output)
     
+    @patch('builtins.input')
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_get_player_symbol_random_uses_injected_rng(self, mock_stdout, mock_input) -> None:
+        """Test the random symbol is drawn from the generator given to the UI."""
+        mock_input.return_value = '3'
+        ui = TerminalUI(random.Random(3))
+        expected = random.Random(3).choice([TicTacToe.PLAYER_X, TicTacToe.PLAYER_O])
+
+        with patch('random.choice') as global_choice:
+            symbol = ui.get_player_symbol()
+
+        self.assertEqual(symbol, expected)
+        global_choice.assert_not_called()
+    
     @patch('builtins.input')
     def test_get_ai_difficulty_easy(self, mock_input) -> None:
         """Test selecting easy AI difficulty."""
@@ -462,7 +477,7 @@ class TestTerminalUIInputMethods(unittest.TestCase):
             self.ui.get_player_symbol()
     
     @patch('builtins.input')
-    @patch('random.choice')
+    @patch('random.Random.choice')
     def test_get_player_symbol_random_choice_o(self, mock_choice, mock_input) -> None:
         """Test random symbol selection choosing O."""
         # Arrange
@@ -1,5 +1,8 @@
+import itertools
 import unittest
-from src.tic_tac_toe import TicTacToe, GameMode
+from unittest.mock import patch
+from src.tic_tac_toe import (TicTacToe, GameMode, SYMMETRIES, STATE_CODE_COUNT, ZOBRIST_SIDE_KEY,
+                             board_winner, board_is_full, zobrist_hash, zobrist_keys)
 
 class TestTicTacToe(unittest.TestCase):
     """Test cases for TicTacToe"""
@@ -1395,5 +1398,374 @@ class TestTicTacToe(unittest.TestCase):
             self.game.find_winning_move('')
         self.assertIn("Invalid player symbol ''", str(context.exception))
 
+    def test_symmetries_are_eight_distinct_permutations(self) -> None:
+        """Test SYMMETRIES holds the identity plus seven other board permutations."""
+        self.assertEqual(len(SYMMETRIES), 8)
+        self.assertEqual(SYMMETRIES[0], tuple(range(9)))
+        self.assertEqual(len(set(SYMMETRIES)), 8)
+        for source in SYMMETRIES:
+            self.assertEqual(sorted(source), list(range(9)))
+            self.assertEqual(source[4], 4, "Every symmetry keeps the center fixed")
+
+    def test_canonicalize_maps_symmetric_boards_to_same_form(self) -> None:
+        """Test every rotation/reflection of a board has the same canonical form."""
+        board = ['X', 'O', ' ',
+                 ' ', 'X', ' ',
+                 ' ', ' ', 'O']
+        canonical, _ = TicTacToe.canonicalize(board)
+
+        for source in SYMMETRIES:
+            image = [board[index] for index in source]
+            with self.subTest(image=image):
+                self.assertEqual(TicTacToe.canonicalize(image)[0], canonical)
+                self.assertEqual(TicTacToe.canonical_key(image), ''.join(canonical))
+
+    def test_canonicalize_returns_transform_that_produces_canonical_board(self) -> None:
+        """Test the returned transform index reproduces the canonical board."""
+        board = [' ', ' ', 'X',
+                 ' ', 'O', ' ',
+                 ' ', ' ', ' ']
+        canonical, transform = TicTacToe.canonicalize(board)
+
+        self.assertEqual([board[index] for index in SYMMETRIES[transform]], canonical)
+
+    def test_transform_positions_round_trip(self) -> None:
+        """Test positions map to the canonical board and back unchanged."""
+        board = [' ', ' ', 'X',
+                 ' ', ' ', ' ',
+                 ' ', ' ', ' ']
+        canonical, transform = TicTacToe.canonicalize(board)
+
+        # The X on position 3 lands wherever transform_position says it does
+        moved = TicTacToe.transform_position(3, transform)
+        self.assertEqual(canonical[moved - 1], 'X')
+        self.assertEqual(TicTacToe.inverse_transform_position(moved, transform), 3)
+
+        for transform in range(8):
+            for position in range(1, 10):
+                with self.subTest(transform=transform, position=position):
+                    self.assertEqual(
+                        TicTacToe.inverse_transform_position(
+                            TicTacToe.transform_position(position, transform), transform),
+                        position)
+
+    def test_canonicalize_leaves_fully_symmetric_board_unchanged(self) -> None:
+        """Test the empty board is its own canonical form with the identity transform."""
+        empty = [TicTacToe.EMPTY] * 9
+
+        self.assertEqual(TicTacToe.canonicalize(empty), (empty, 0))
+
+    def test_game_state_after_moves_does_not_rescan_board(self) -> None:
+        """Test the outcome is tracked by make_move without full-board line checks."""
+        for position in (1, 4, 2, 5):
+            self.game.make_move(position)
+
+        with patch.object(TicTacToe, '_check_line', side_effect=AssertionError("full scan")):
+            self.assertEqual(self.game.get_game_state(), {'state': 'ongoing', 'winner': None})
+            self.game.make_move(3)
+            self.assertEqual(self.game.get_game_state(), {'state': 'won', 'winner': 'X'})
+            self.assertEqual(self.game.check_winner(), 'X')
+
+    def test_direct_board_writes_are_detected(self) -> None:
+        """Test in-place board edits are picked up by the next state query."""
+        self.game.make_move(1)
+        self.assertIsNone(self.game.check_winner())
+
+        self.game.board[1] = 'X'
+        self.game.board[2] = 'X'
+        self.assertEqual(self.game.check_winner(), 'X')
+
+        self.game.board[2] = ' '
+        self.assertIsNone(self.game.check_winner())
+        self.game.make_move(3)  # O blocks after the direct edits
+        self.assertEqual(self.game.board, ['X', 'X', 'O'] + [' '] * 6)
+        self.assertIsNone(self.game.check_winner())
+
+    def test_move_counter_tracks_draw(self) -> None:
+        """Test a full board reached through make_move is a draw."""
+        for position in (1, 2, 3, 5, 4, 6, 8, 7, 9):
+            self.assertFalse(self.game.is_board_full())
+            self.game.make_move(position)
+
+        self.assertTrue(self.game.is_board_full())
+        self.assertEqual(self.game.get_game_state(), {'state': 'draw', 'winner': None})
+
+    def test_board_assignment_copies_cells(self) -> None:
+        """Test assigning a board stores a copy that is rescanned on demand."""
+        cells = ['O', 'O', 'O', 'X', 'X', ' ', 'X', ' ', ' ']
+        self.game.board = cells
+        cells[0] = ' '
+
+        self.assertEqual(self.game.board[0], 'O')
+        self.assertEqual(self.game.get_game_state(), {'state': 'won', 'winner': 'O'})
+        self.assertIs(type(self.game.board.copy()), list)
+
+    def test_winner_after_play_continues_matches_full_scan(self) -> None:
+        """Test a second completed line is resolved the same way as a fresh scan of the board."""
+        for position in (7, 1, 8, 2, 9, 3):  # X wins the bottom row, then O the top row
+            self.game.make_move(position)
+
+        fresh = TicTacToe()
+        fresh.board = list(self.game.board)
+        self.assertEqual(self.game.check_winner(), fresh.check_winner())
+        self.assertEqual(self.game.check_winner(), 'O')  # First line in WINNING_COMBINATIONS order
+
+        self.game.board.dirty = True  # Force a full rescan
+        self.assertEqual(self.game.check_winner(), 'O')
+
+    def test_undo_after_direct_board_write_raises(self) -> None:
+        """Test undo refuses a move whose mark was removed or replaced by a direct write."""
+        self.game.make_move(1)
+        self.game.board[0] = ' '
+        with self.assertRaises(ValueError):
+            self.game.undo_move()
+        self.assertEqual(self.game.current_player, 'O')
+        self.assertEqual(self.game.get_game_state(), {'state': 'ongoing', 'winner': None})
+        self.assertEqual(self.game.board.count(' '), 9)
+
+        self.game.board[0] = 'O'
+        with self.assertRaises(ValueError):
+            self.game.undo_move()
+
+        self.game.board[0] = 'X'
+        self.assertEqual(self.game.undo_move(), 1)
+        self.assertEqual(self.game.board, [' '] * 9)
+
+    def test_undo_move_restores_previous_position(self) -> None:
+        """Test undo_move clears the last mark and returns the turn to its player."""
+        self.game.make_move(5)
+        self.game.make_move(1)
+
+        self.assertEqual(self.game.undo_move(), 1)
+        self.assertEqual(self.game.board, [' '] * 4 + ['X'] + [' '] * 4)
+        self.assertEqual(self.game.current_player, 'O')
+        self.assertEqual(self.game.undo_move(), 5)
+        self.assertEqual(self.game.board, [' '] * 9)
+        self.assertEqual(self.game.current_player, 'X')
+
+    def test_undo_winning_move_reopens_game(self) -> None:
+        """Test undoing the move that completed a line clears the winner."""
+        for position in (1, 4, 2, 5, 3):
+            self.game.make_move(position)
+        self.assertEqual(self.game.get_game_state(), {'state': 'won', 'winner': 'X'})
+
+        self.game.undo_move()
+        self.assertEqual(self.game.get_game_state(), {'state': 'ongoing', 'winner': None})
+        self.game.redo_move()
+        self.assertEqual(self.game.get_game_state(), {'state': 'won', 'winner': 'X'})
+
+    def test_undo_last_move_of_draw(self) -> None:
+        """Test undoing the final move of a draw leaves one empty square."""
+        for position in (1, 2, 3, 5, 4, 6, 8, 7, 9):
+            self.game.make_move(position)
+
+        self.game.undo_move()
+        self.assertFalse(self.game.is_board_full())
+        self.assertEqual(self.game.get_game_state()['state'], 'ongoing')
+        self.assertTrue(self.game.is_valid_move(9))
+
+    def test_redo_replays_undone_moves_in_order(self) -> None:
+        """Test redo_move replays undone moves until the redo stack is empty."""
+        for position in (5, 1, 9):
+            self.game.make_move(position)
+        for _ in range(3):
+            self.game.undo_move()
+
+        self.assertEqual([self.game.redo_move() for _ in range(3)], [5, 1, 9])
+        self.assertEqual(self.game.board, ['O', ' ', ' ', ' ', 'X', ' ', ' ', ' ', 'X'])
+        with self.assertRaises(ValueError) as context:
+            self.game.redo_move()
+        self.assertEqual(str(context.exception), "No moves to redo")
+
+    def test_new_move_discards_redo_history(self) -> None:
+        """Test making a move after an undo clears the redo stack."""
+        self.game.make_move(5)
+        self.game.undo_move()
+        self.game.make_move(1)
+
+        with self.assertRaises(ValueError):
+            self.game.redo_move()
+
+    def test_undo_without_moves_raises_error(self) -> None:
+        """Test undo_move on a fresh or reset game raises ValueError."""
+        with self.assertRaises(ValueError) as context:
+            self.game.undo_move()
+        self.assertEqual(str(context.exception), "No moves to undo")
+
+        self.game.make_move(5)
+        self.game.reset_board()
+        with self.assertRaises(ValueError):
+            self.game.undo_move()
+
+    def test_board_assignment_clears_history(self) -> None:
+        """Test replacing the board forgets moves that no longer apply."""
+        self.game.make_move(5)
+        self.game.board = ['X'] + [' '] * 8
+
+        with self.assertRaises(ValueError):
+            self.game.undo_move()
+
+    def test_board_winner_matches_check_winner(self) -> None:
+        """Test the stateless evaluator agrees with the engine on every line."""
+        for line in ((0, 1, 2), (2, 5, 8), (0, 4, 8), (2, 4, 6)):
+            for symbol in ('X', 'O'):
+                board = [' '] * 9
+                for index in line:
+                    board[index] = symbol
+                self.game.board = board
+                with self.subTest(line=line, symbol=symbol):
+                    self.assertEqual(board_winner(board), symbol)
+                    self.assertEqual(board_winner(board), self.game.check_winner())
+
+        self.assertIsNone(board_winner([' '] * 9))
+        self.assertIsNone(board_winner(['X', 'O', 'X', 'X', 'O', 'O', 'O', 'X', 'X']))
+
+    def test_board_is_full(self) -> None:
+        """Test the stateless full-board check."""
+        self.assertFalse(board_is_full([' '] * 9))
+        self.assertFalse(board_is_full(['X'] * 8 + [' ']))
+        self.assertTrue(board_is_full(['X', 'O', 'X', 'X', 'O', 'O', 'O', 'X', 'X']))
+
+    def test_board_evaluators_do_not_modify_board(self) -> None:
+        """Test the evaluators only read their argument."""
+        board = ['X', 'X', 'X', 'O', 'O', ' ', ' ', ' ', ' ']
+        board_winner(board)
+        board_is_full(board)
+        self.assertEqual(board, ['X', 'X', 'X', 'O', 'O', ' ', ' ', ' ', ' '])
+
+    def test_encode_board_uses_base_three_digits(self) -> None:
+        """Test position 1 is the least significant base-3 digit."""
+        self.assertEqual(TicTacToe.encode_board([' '] * 9), 0)
+        self.assertEqual(TicTacToe.encode_board(['X'] + [' '] * 8), 1)
+        self.assertEqual(TicTacToe.encode_board(['O'] + [' '] * 8), 2)
+        self.assertEqual(TicTacToe.encode_board([' '] * 8 + ['X']), 3 ** 8)
+        self.assertEqual(TicTacToe.encode_board(['O'] * 9), 3 ** 9 - 1)
+        self.assertEqual(TicTacToe.encode_board('XO       '), TicTacToe.encode_board(['X', 'O'] + [' '] * 7))
+
+    def test_encoders_reject_invalid_boards(self) -> None:
+        """Test boards without exactly 9 valid cells raise instead of producing out-of-range codes."""
+        for board in ([' '] * 5, ['X'] * 12, [' '] * 8 + ['Z'], ['X', 'O'] * 4 + ['-']):
+            with self.subTest(board=board):
+                with self.assertRaises(ValueError):
+                    TicTacToe.encode_board(board)
+                with self.assertRaises(ValueError):
+                    TicTacToe.encode_state(board, 'X')
+
+    def test_encode_state_round_trips_every_board(self) -> None:
+        """Test every board and side to move has a unique code that decodes back."""
+        seen = set()
+        for cells in itertools.product(' XO', repeat=9):
+            board = list(cells)
+            for side in ('X', 'O'):
+                code = TicTacToe.encode_state(board, side)
+                self.assertTrue(0 <= code < STATE_CODE_COUNT)
+                seen.add(code)
+                self.assertEqual(TicTacToe.decode_state(code), (board, side))
+        self.assertEqual(len(seen), STATE_CODE_COUNT)
+
+    def test_encode_state_infers_side_to_move(self) -> None:
+        """Test the side to move defaults to the one implied by the mark counts."""
+        self.assertEqual(TicTacToe.encode_state([' '] * 9), 0)
+        self.assertEqual(TicTacToe.encode_state(['X'] + [' '] * 8), 3)
+        self.assertEqual(TicTacToe.encode_state(['X', 'O'] + [' '] * 7), (1 + 2 * 3) * 2)
+
+        with self.assertRaises(ValueError):
+            TicTacToe.encode_state([' '] * 9, 'Z')
+
+    def test_decode_state_rejects_out_of_range_codes(self) -> None:
+        """Test invalid codes raise ValueError."""
+        for code in (-1, STATE_CODE_COUNT):
+            with self.subTest(code=code):
+                with self.assertRaises(ValueError):
+                    TicTacToe.decode_state(code)
+
+    def test_encode_states_matches_single_encoder(self) -> None:
+        """Test the batch encoder gives the same codes in a 16-bit array."""
+        boards = [[' '] * 9, ['X'] + [' '] * 8, ['X', 'O', 'X', ' ', 'O', ' ', ' ', ' ', 'X'], ['O'] * 9]
+        sides = ['X', 'O', 'O', 'X']
+
+        codes = TicTacToe.encode_states(boards, sides)
+        self.assertEqual(codes.typecode, 'H')
+        self.assertEqual(list(codes), [TicTacToe.encode_state(b, s) for b, s in zip(boards, sides)])
+        self.assertEqual(list(TicTacToe.encode_states(boards)),
+                         [TicTacToe.encode_state(b) for b in boards])
+        self.assertEqual(len(TicTacToe.encode_states([])), 0)
+
+    def test_encode_states_validates_input(self) -> None:
+        """Test the batch encoder rejects malformed boards, invalid sides and mismatched sides."""
+        with self.assertRaises(ValueError):
+            TicTacToe.encode_states([[' '] * 8])
+        with self.assertRaises(ValueError):
+            TicTacToe.encode_states([[' '] * 9], ['X', 'O'])
+        with self.assertRaises(ValueError):
+            TicTacToe.encode_states([[' '] * 8, ['X'] * 10])  # Lengths add up to 18
+        with self.assertRaises(ValueError):
+            TicTacToe.encode_states([[' '] * 9, ['X'] + ['Z'] * 8])
+        with self.assertRaises(ValueError):
+            TicTacToe.encode_states([[' '] * 9, [' '] * 9], ['X', 'Z'])
+
+    def test_get_state_code_uses_current_player(self) -> None:
+        """Test a game encodes its own board and turn."""
+        self.game.make_move(1)
+        self.assertEqual(self.game.get_state_code(), 3)
+        self.assertEqual(TicTacToe.decode_state(self.game.get_state_code()),
+                         (self.game.board, self.game.current_player))
+
+    def test_zobrist_keys_are_fixed_and_distinct(self) -> None:
+        """Test the key table is deterministic and has no repeated keys."""
+        keys = zobrist_keys(9)
+        self.assertIs(keys, zobrist_keys(9))
+        values = [key for cell in keys for key in cell.values()] + [ZOBRIST_SIDE_KEY]
+        self.assertEqual(len(set(values)), 19)
+        self.assertTrue(all(0 <= value < 2 ** 64 for value in values))
+
+    def test_zobrist_hash_updates_incrementally(self) -> None:
+        """Test the engine's hash always matches a from-scratch computation."""
+        self.assertEqual(self.game.zobrist_hash, 0)
+        for position in (5, 1, 9, 3):
+            self.game.make_move(position)
+            self.assertEqual(self.game.zobrist_hash,
+                             zobrist_hash(self.game.board, self.game.current_player))
+
+        with patch('src.tic_tac_toe.zobrist_hash', side_effect=AssertionError("rehashed")):
+            self.game.make_move(7)
+            self.game.undo_move()
+            self.game.zobrist_hash
+
+    def test_zobrist_hash_restored_by_undo(self) -> None:
+        """Test make followed by undo returns exactly the previous hash."""
+        self.game.make_move(5)
+        before = self.game.zobrist_hash
+
+        self.game.make_move(1)
+        self.assertNotEqual(self.game.zobrist_hash, before)
+        self.game.undo_move()
+        self.assertEqual(self.game.zobrist_hash, before)
+
+    def test_zobrist_hash_is_independent_of_move_order(self) -> None:
+        """Test transpositions reach the same hash."""
+        other = TicTacToe()
+        for position in (1, 5, 9):
+            self.game.make_move(position)
+        for position in (9, 5, 1):
+            other.make_move(position)
+
+        self.assertEqual(self.game.zobrist_hash, other.zobrist_hash)
+
+    def test_zobrist_hash_includes_side_to_move(self) -> None:
+        """Test the same board hashes differently for each side to move."""
+        self.game.board = ['X', 'O'] + [' '] * 7
+        x_to_move = self.game.zobrist_hash
+        self.game.current_player = 'O'
+
+        self.assertEqual(self.game.zobrist_hash, x_to_move ^ ZOBRIST_SIDE_KEY)
+
+    def test_zobrist_hash_follows_direct_board_edits(self) -> None:
+        """Test a directly edited board is rehashed on the next read."""
+        self.game.make_move(5)
+        self.game.board[0] = 'O'
+
+        self.assertEqual(self.game.zobrist_hash, zobrist_hash(self.game.board, 'O'))
+
 if __name__ == '__main__':
     unittest.main()
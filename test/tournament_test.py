@@ -0,0 +1,79 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from src.tournament import (round_robin_pairings, merge_stats, batch_seed,
+                            run_tournament, main)
+from src.player import DifficultyLevel
+
+
+class TestTournament(unittest.TestCase):
+    """Test cases for the multi-process tournament executor"""
+
+    def test_round_robin_covers_every_ordered_matchup(self) -> None:
+        """Test each difficulty meets every other difficulty with both colours."""
+        pairings = round_robin_pairings()
+
+        self.assertEqual(len(pairings), 9)
+        self.assertEqual(len(set(pairings)), 9)
+        self.assertIn((DifficultyLevel.EASY, DifficultyLevel.HARD), pairings)
+        self.assertIn((DifficultyLevel.HARD, DifficultyLevel.EASY), pairings)
+        self.assertIn((DifficultyLevel.MEDIUM, DifficultyLevel.MEDIUM), pairings)
+
+    def test_merge_stats_sums_every_counter(self) -> None:
+        """Test batch results are added together key by key."""
+        merged = merge_stats([
+            {'games_played': 3, 'x_wins': 1, 'o_wins': 1, 'draws': 1},
+            {'games_played': 2, 'x_wins': 0, 'o_wins': 0, 'draws': 2},
+        ])
+
+        self.assertEqual(merged, {'games_played': 5, 'x_wins': 1, 'o_wins': 1, 'draws': 3})
+        self.assertEqual(merge_stats([])['games_played'], 0)
+
+    def test_batch_seed_is_deterministic_and_distinct(self) -> None:
+        """Test batch seeds replay exactly and differ between batches."""
+        self.assertEqual(batch_seed(1, 2, 3), batch_seed(1, 2, 3))
+        self.assertNotEqual(batch_seed(1, 2, 3), batch_seed(1, 2, 4))
+        self.assertNotEqual(batch_seed(1, 2, 3), batch_seed(2, 2, 3))
+
+    def test_run_tournament_merges_batches_per_matchup(self) -> None:
+        """Test games are split into batches and merged back per matchup."""
+        results = run_tournament(25, workers=2, batch_size=10, seed=5)
+
+        self.assertEqual(set(results), set(round_robin_pairings()))
+        for pairing, stats in results.items():
+            with self.subTest(pairing=pairing):
+                self.assertEqual(stats['games_played'], 25)
+                self.assertEqual(stats['x_wins'] + stats['o_wins'] + stats['draws'], 25)
+
+        self.assertEqual(results[(DifficultyLevel.HARD, DifficultyLevel.HARD)]['draws'], 25)
+        self.assertEqual(results[(DifficultyLevel.HARD, DifficultyLevel.EASY)]['o_wins'], 0)
+
+    def test_run_tournament_is_reproducible_for_any_worker_count(self) -> None:
+        """Test the same seed gives identical results in-process and across workers."""
+        difficulties = (DifficultyLevel.EASY, DifficultyLevel.MEDIUM)
+
+        inline = run_tournament(30, difficulties, workers=1, batch_size=7, seed=11)
+        pooled = run_tournament(30, difficulties, workers=3, batch_size=7, seed=11)
+
+        self.assertEqual(inline, pooled)
+
+    def test_run_tournament_rejects_invalid_arguments(self) -> None:
+        """Test negative game counts and empty batches are rejected."""
+        with self.assertRaises(ValueError):
+            run_tournament(-1, workers=1)
+        with self.assertRaises(ValueError):
+            run_tournament(10, workers=1, batch_size=0)
+
+    def test_main_prints_every_matchup(self) -> None:
+        """Test the CLI reports one line per matchup."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            results = main(['--games', '4', '--workers', '1', '--seed', '2'])
+
+        self.assertEqual(len(results), 9)
+        self.assertEqual(output.getvalue().count("vs O"), 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import threading
+import unittest
+
+from src.transposition_table import TranspositionTable, TranspositionEntry, Bound
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """Test cases for TranspositionTable"""
+
+    def setUp(self) -> None:
+        self.table = TranspositionTable(max_entries=3)
+
+    def test_rejects_non_positive_size(self) -> None:
+        """Test the size cap must be at least one entry."""
+        for size in [0, -1]:
+            with self.subTest(size=size):
+                with self.assertRaises(ValueError):
+                    TranspositionTable(size)
+
+    def test_store_and_get_round_trip(self) -> None:
+        """Test stored score, depth and bound are returned unchanged."""
+        self.table.store('a', -10, 4, Bound.UPPER)
+
+        self.assertEqual(self.table.get('a'), TranspositionEntry(-10, 4, Bound.UPPER))
+        self.assertIn('a', self.table)
+        self.assertEqual(len(self.table), 1)
+
+    def test_best_move_is_stored_with_entry(self) -> None:
+        """Test the best move is kept alongside the score and defaults to None."""
+        self.table.store('a', 3, 2, Bound.LOWER, best_move=4)
+
+        self.assertEqual(self.table.get('a').best_move, 4)
+        self.assertEqual(self.table.get('a'), TranspositionEntry(3, 2, Bound.LOWER, 4))
+        self.assertEqual(TranspositionEntry(0, 1, Bound.EXACT).best_move, None)
+
+    def test_get_missing_key_returns_none(self) -> None:
+        """Test looking up an unknown position returns None and counts a miss."""
+        self.assertIsNone(self.table.get('missing'))
+        self.assertEqual(self.table.misses, 1)
+        self.assertEqual(self.table.hits, 0)
+
+    def test_store_overwrites_existing_entry(self) -> None:
+        """Test storing the same key replaces its entry without growing the table."""
+        self.table.store('a', 0, 2, Bound.LOWER)
+        self.table.store('a', 10, float('inf'), Bound.EXACT)
+
+        self.assertEqual(len(self.table), 1)
+        self.assertEqual(self.table.get('a').bound, Bound.EXACT)
+
+    def test_evicts_least_recently_used_entry(self) -> None:
+        """Test a full table evicts the entry that was used longest ago."""
+        self.table.store('a', 1, 1, Bound.EXACT)
+        self.table.store('b', 2, 1, Bound.EXACT)
+        self.table.store('c', 3, 1, Bound.EXACT)
+
+        self.table.get('a')  # 'b' is now the least recently used
+        self.table.store('d', 4, 1, Bound.EXACT)
+
+        self.assertEqual(len(self.table), 3)
+        self.assertIn('a', self.table)
+        self.assertNotIn('b', self.table)
+        self.assertIn('d', self.table)
+
+    def test_clear_empties_table_and_counters(self) -> None:
+        """Test clear removes all entries and resets statistics."""
+        self.table.store('a', 1, 1, Bound.EXACT)
+        self.table.get('a')
+        self.table.get('b')
+
+        self.table.clear()
+
+        self.assertEqual(len(self.table), 0)
+        self.assertEqual(self.table.hits, 0)
+        self.assertEqual(self.table.misses, 0)
+
+    def test_concurrent_access_keeps_table_consistent(self) -> None:
+        """Test many threads storing and evicting at once never corrupt the table."""
+        table = TranspositionTable(max_entries=50)
+        errors = []
+
+        def worker(offset: int) -> None:
+            try:
+                for i in range(2000):
+                    key = (offset + i) % 120
+                    table.store(key, i, 1, Bound.EXACT)
+                    table.get((key + 7) % 120)
+            except Exception as error:  # pragma: no cover - only on failure
+                errors.append(error)
+
+        threads = [threading.Thread(target=worker, args=(n * 13,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(table), 50)
+        self.assertEqual(table.hits + table.misses, 8 * 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()